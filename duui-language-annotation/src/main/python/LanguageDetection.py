@@ -4,44 +4,95 @@ from typing import List
 from iso639 import languages
 from transformers import AutoModelForSequenceClassification, AutoTokenizer
 import torch
-import gcld3
-import langdetect
-import spacy
-from spacy.language import Language
-from spacy_langdetect import LanguageDetector
 from scipy.special import softmax
 import numpy as np
 
 
+# ISO 639-3 to ISO 639-1 codes, for the languages that have one
+part3_to_part1 = {code: language.part1 for code, language in languages.part3.items() if language.part1 != ""}
+
+
+# Language codes of fastText labels like "__label__deu_Latn", computed once per label
+class LabelLanguages(dict):
+    def __init__(self, part1: bool):
+        super().__init__()
+        self.part1 = part1
+
+    def __missing__(self, label):
+        language = label.split("__label__")[1].split("_")[0]
+        if self.part1:
+            language = part3_to_part1.get(language, language)
+        self[label] = language
+        return language
+
+
+glotlid_label_languages = LabelLanguages(part1=True)
+fasttext_label_languages = LabelLanguages(part1=False)
+
+
+# Predict all texts with one call to fastText, returns the top k languages and scores of each text
+def fasttext_prediction(model, texts: List[str], k: int, label_languages: LabelLanguages):
+    # fastText predicts one line per text
+    labels, scores = model.predict([text.replace("\n", " ") for text in texts], k=k)
+    return [
+        dict(zip([label_languages[label] for label in text_labels], text_scores.tolist()))
+        for text_labels, text_scores in zip(labels, scores)
+    ]
+
+
 def get_lang_detector(nlp, name):
+    from spacy_langdetect import LanguageDetector
     return LanguageDetector()
 
 
+# Loaders of the LanguageIdentification backends, the libraries are only imported when a backend is used
+def load_glc3d():
+    import gcld3
+    return gcld3.NNetLanguageIdentifier(min_num_bytes=1, max_num_bytes=200000)
+
+
+def load_fasttext():
+    return fasttext.load_model("lid.176.bin")
+
+
+def load_spacy():
+    import spacy
+    from spacy.language import Language
+    model_spacy = spacy.load("en_core_web_sm")
+    Language.factory("language_detector", func=get_lang_detector)
+    model_spacy.add_pipe('language_detector', last=True)
+    return model_spacy
+
+
+def load_google():
+    import langdetect
+    return langdetect
+
+
+backend_loaders = {
+    "glc3d": load_glc3d,
+    "fasttext": load_fasttext,
+    "spacy": load_spacy,
+    "google": load_google,
+}
+
+
 class LanguageDetection:
     def __init__(self):
         self.model_path = hf_hub_download(repo_id="cis-lmu/glotlid", filename="model.bin")
         self.model = fasttext.load_model(self.model_path)
 
     def language_prediction(self, text: List[str]):
-        lang_text = self.model.predict(text, k=5)
-        lang_out = []
-        for c, lang in enumerate(lang_text[0]):
-            land_dict = {}
-            for c2, lang_i in enumerate(lang):
-                lang_pred = lang_i.split("__label__")[1].split("_")[0]
-                if lang_pred in languages.part3:
-                    lang_part1 = languages.part3[lang_pred].part1
-                    if lang_part1 != "":
-                        lang_pred = lang_part1
-                land_dict[lang_pred] = float(lang_text[1][c][c2])
-            # land_dict = {k: v for k, v in sorted(land_dict.items(), key=lambda item: item[1], reverse=True)}
-            lang_out.append(land_dict)
-        return lang_out
+        return fasttext_prediction(self.model, text, 5, glotlid_label_languages)
+
+    def lang_prediction(self, texts: List[str]):
+        return self.language_prediction(texts)
 
 
 class LanguageCheck:
-    def __init__(self, model_name: str, device='cuda:0'):
+    def __init__(self, model_name: str, device='cuda:0', batch_size: int = 32):
         self.device = device
+        self.batch_size = batch_size
         self.tokenizer = AutoTokenizer.from_pretrained(model_name, cache_dir="/storage/nlp/huggingface/models")
         self.model = AutoModelForSequenceClassification.from_pretrained(model_name,
                                                                         cache_dir="/storage/nlp/huggingface/models").to(
@@ -52,57 +103,77 @@ class LanguageCheck:
             if "-" in label:
                 self.labels[c] = label.split("-")[0]
 
+    # texts are tokenized once and sorted by token count, so each batch is only padded to its longest text
     def language_prediction(self, texts: List[str]):
-        with torch.no_grad():
-            score_list = []
-            inputs = self.tokenizer(texts, return_tensors="pt", padding=True, truncation=True, max_length=512).to(
-                self.device)
-            outputs = self.model(**inputs)
-            scores = outputs[0].detach().cpu().numpy()
-            for score in scores:
-                score_dict_i = {}
-                score_i = softmax(score)
-                ranking = np.argsort(score_i)
-                ranking = ranking[::-1]
-                for i in range(score.shape[0]):
-                    score_dict_i[self.labels[ranking[i]]] = float(score_i[ranking[i]])
-                score_list.append(score_dict_i)
-        return score_list
+        if len(texts) == 0:
+            return []
+        encodings = self.tokenizer(texts, truncation=True, max_length=512)
+        lengths = [len(input_ids) for input_ids in encodings["input_ids"]]
+        order = np.argsort(lengths, kind="stable")
+
+        logits = np.zeros((len(texts), len(self.labels)), dtype=np.float32)
+        with torch.inference_mode():
+            for batch_start in range(0, len(order), self.batch_size):
+                batch = order[batch_start:batch_start + self.batch_size]
+                inputs = self.tokenizer.pad([
+                    {key: encodings[key][i] for key in encodings.keys()}
+                    for i in batch
+                ], return_tensors="pt").to(self.device)
+                logits[batch] = self.model(**inputs)[0].float().cpu().numpy()
+
+        # rank the labels of all texts at once, highest score first
+        scores = softmax(logits, axis=1)
+        ranking = np.argsort(scores, axis=1)[:, ::-1]
+        ranked_labels = np.array(self.labels, dtype=object)[ranking]
+        ranked_scores = np.take_along_axis(scores, ranking, axis=1).tolist()
+        return [
+            dict(zip(labels_i, scores_i))
+            for labels_i, scores_i in zip(ranked_labels.tolist(), ranked_scores)
+        ]
+
+    def lang_prediction(self, texts: List[str]):
+        return self.language_prediction(texts)
 
 
 class LanguageIdentification:
     def __init__(self, model_name:str):
-        self.model_glcd3 = gcld3.NNetLanguageIdentifier(min_num_bytes=1, max_num_bytes=200000)
-        self.model_fasttext = fasttext.load_model("lid.176.bin")
-        self.model_spacy = spacy.load("en_core_web_sm")
-        Language.factory("language_detector", func=get_lang_detector)
-        self.model_spacy.add_pipe('language_detector', last=True)
-        self.model_google = langdetect
+        if model_name not in backend_loaders:
+            raise ValueError(f"Unknown language identification backend {model_name}")
         self.model_name = model_name
+        # only the backend of this model name is needed, it is loaded on first use and freed with this instance
+        self.backend = None
+
+    def load_backend(self):
+        if self.backend is None:
+            self.backend = backend_loaders[self.model_name]()
+        return self.backend
 
     def glc3d_identification(self, text):
-        result = self.model_glcd3.FindTopNMostFreqLangs(text, 5)
-        res_back = {}
-        for c, res_i in enumerate(result):
-            res_back[res_i.language] = res_i.probability
-        res_back = {k: v for k, v in sorted(res_back.items(), key=lambda item: item[1], reverse=True)}
-        return res_back
+        return self.glc3d_identification_batch([text])[0]
+
+    # gcld3 has no batch api, the model is only looked up once for all texts
+    def glc3d_identification_batch(self, texts):
+        model_glcd3 = self.load_backend()
+        lang_out = []
+        for text in texts:
+            res_back = {res_i.language: res_i.probability for res_i in model_glcd3.FindTopNMostFreqLangs(text, 5)}
+            lang_out.append(dict(sorted(res_back.items(), key=lambda item: item[1], reverse=True)))
+        return lang_out
 
     def fastText_identification(self, text):
-        result = self.model_fasttext.predict(text, k=5)
-        res_back = {}
-        for c, lang in enumerate(result[0]):
-            res_back[lang.split("__label__")[1].split("_")[0]] = float(result[1][c])
-        res_back = {k: v for k, v in sorted(res_back.items(), key=lambda item: item[1], reverse=True)}
-        return res_back
+        return self.fastText_identification_batch([text])[0]
+
+    # fastText returns the labels sorted by score
+    def fastText_identification_batch(self, texts):
+        return fasttext_prediction(self.load_backend(), texts, 5, fasttext_label_languages)
 
     def spacy_identification(self, text):
-        result = self.model_spacy(text)
+        result = self.load_backend()(text)
         res_back = {result._.language["language"]: result._.language["score"]}
         return res_back
 
     def google_identification(self, text):
-        result = self.model_google.detect_langs(text)
+        result = self.load_backend().detect_langs(text)
         res_back = {}
         for res_i in result:
             res_back[res_i.lang] = res_i.prob
@@ -110,15 +181,47 @@ class LanguageIdentification:
         return res_back
 
     def lang_prediction(self, texts):
+        match self.model_name:
+            case "glc3d":
+                return self.glc3d_identification_batch(texts)
+            case "fasttext":
+                return self.fastText_identification_batch(texts)
         lang_out = []
         for text in texts:
             match self.model_name:
-                case "glc3d":
-                    lang_out.append(self.glc3d_identification(text))
-                case "fasttext":
-                    lang_out.append(self.fastText_identification(text))
                 case "spacy":
                     lang_out.append(self.spacy_identification(text))
                 case "google":
                     lang_out.append(self.google_identification(text))
         return lang_out
+
+
+# Runs a fast model on all texts and only the texts it is unsure about through a slower, more accurate model,
+# a text is escalated if its top score is below the threshold or the margin to the second language is below the margin
+class LanguageCascade:
+    def __init__(self, fast_model, model, threshold: float, margin: float):
+        self.fast_model = fast_model
+        self.model = model
+        self.threshold = threshold
+        self.margin = margin
+
+    def needs_escalation(self, res):
+        if len(res) == 0:
+            return True
+        top_scores = sorted(res.values(), reverse=True)
+        if top_scores[0] < self.threshold:
+            return True
+        return len(top_scores) > 1 and top_scores[0] - top_scores[1] < self.margin
+
+    # returns the predictions and the number of escalated texts
+    def cascade_prediction(self, texts: List[str]):
+        lang_out = self.fast_model.lang_prediction(texts)
+        escalate = [c for c, res in enumerate(lang_out) if self.needs_escalation(res)]
+        if len(escalate) > 0:
+            escalated_out = self.model.lang_prediction([texts[c] for c in escalate])
+            for c, res in zip(escalate, escalated_out):
+                lang_out[c] = res
+        return lang_out, len(escalate)
+
+    def lang_prediction(self, texts: List[str]):
+        return self.cascade_prediction(texts)[0]
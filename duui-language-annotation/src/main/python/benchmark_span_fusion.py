@@ -0,0 +1,165 @@
+# Benchmark of the language span fusion on synthetic documents with many sentences
+# Compares fuse_language_spans with the previous implementation (kept here as reference) and checks the outputs are equal.
+# Run from this directory, no models are loaded:
+#   python benchmark_span_fusion.py --sentences 10000,50000,100000
+import argparse
+import copy
+import json
+import os
+import random
+from time import perf_counter
+
+# The service is configured using env vars, provide defaults for a local run
+os.environ.setdefault("LANGUAGE_ANNOTATOR_NAME", "duui-language-annotation-benchmark")
+os.environ.setdefault("LANGUAGE_ANNOTATOR_VERSION", "unset")
+os.environ.setdefault("LANGUAGE_LOG_LEVEL", "WARNING")
+os.environ.setdefault("LANGUAGE_MODEL_CACHE_SIZE", "1")
+
+from duui_language_annotation import UimaSentence, fuse_language_spans
+
+LANGUAGES = ["en", "de", "fr", "it", "es"]
+
+
+# Previous implementation of the fusion in process_selection
+def fuse_language_spans_reference(sentences, results):
+    all_begin = []
+    all_end = []
+    langs = []
+    scores = []
+    lang_out = {}
+    for c, res in enumerate(results):
+        all_langs = list(res.keys())
+        if all_langs[0] not in lang_out:
+            lang_out[all_langs[0]] = {}
+        begin_i = sentences[c].begin
+        end_i = sentences[c].end
+        lang_out[all_langs[0]][begin_i] = {
+            "begin": begin_i,
+            "end": end_i,
+            "lang": all_langs[0],
+            "score": res[all_langs[0]]
+        }
+    for lang in lang_out:
+        lang_out[lang] = dict(sorted(lang_out[lang].items()))
+    lang_out_copy = copy.deepcopy(lang_out)
+    fused_list = {}
+    for lang in lang_out_copy:
+        fused_list[lang] = [[]]
+        begin_keys = list(lang_out_copy[lang].keys())
+        counter_index = 0
+        for i in range(len(begin_keys)):
+            if i+1 in range(len(begin_keys)):
+                begin_i = lang_out_copy[lang][begin_keys[i+1]]["begin"]
+                end_i = lang_out_copy[lang][begin_keys[i]]["end"]
+                if begin_i == end_i+1:
+                    lang_out[lang][begin_keys[i]]["Fuse"] = True
+                    lang_out[lang][begin_keys[i+1]]["Fuse"] = True
+                    fused_list[lang][counter_index].append(begin_keys[i])
+                    fused_list[lang][counter_index].append(begin_keys[i+1])
+                else:
+                    if len(fused_list[lang][counter_index]) > 0:
+                        counter_index += 1
+                        fused_list[lang].append([])
+                    if "Fuse" not in lang_out[lang][begin_keys[i]]:
+                        fused_list[lang][counter_index].append(begin_keys[i])
+            else:
+                if len(fused_list[lang][counter_index]) > 0:
+                    counter_index += 1
+                    fused_list[lang].append([])
+                if "Fuse" not in lang_out[lang][begin_keys[i]]:
+                    fused_list[lang][counter_index].append(begin_keys[i])
+    lang_new_out = {}
+    for lang in fused_list:
+        lang_new_out[lang] = {}
+        for i in range(len(fused_list[lang])):
+            if len(fused_list[lang][i]) > 0:
+                begin = fused_list[lang][i][0]
+                end = lang_out[lang][fused_list[lang][i][-1]]["end"]
+                scores_i = []
+                for j in range(len(fused_list[lang][i])):
+                    scores_i.append(lang_out[lang][fused_list[lang][i][j]]["score"])
+                avg_score = sum(scores_i) / len(scores_i)
+                lang_new_out[lang][begin] = {
+                    "begin": begin,
+                    "end": end,
+                    "lang": lang,
+                    "score": avg_score
+                }
+    for lang in lang_new_out:
+        for begin in lang_new_out[lang]:
+            begin = lang_new_out[lang][begin]["begin"]
+            end = lang_new_out[lang][begin]["end"]
+            langs.append(lang_new_out[lang][begin]["lang"])
+            scores.append(lang_new_out[lang][begin]["score"])
+            all_begin.append(begin)
+            all_end.append(end)
+    return {
+        "begin": all_begin,
+        "end": all_end,
+        "lang": langs,
+        "scores": scores
+    }
+
+
+# Sentences separated by one character (fused if the language is the same) or by a line break and one character,
+# the language changes with the given probability, predictions have up to three languages
+def build_document(sentences_count, switch_probability, rnd):
+    sentences = []
+    results = []
+    lang = rnd.choice(LANGUAGES)
+    begin = 0
+    for _ in range(sentences_count):
+        end = begin + rnd.randint(10, 200)
+        sentences.append(UimaSentence(text="", begin=begin, end=end))
+        if rnd.random() < switch_probability:
+            lang = rnd.choice(LANGUAGES)
+        other_langs = rnd.sample([l for l in LANGUAGES if l != lang], rnd.randint(0, 2))
+        score = rnd.uniform(0.4, 1.0)
+        res = {lang: score}
+        for other_lang in other_langs:
+            res[other_lang] = (1 - score) / len(other_langs)
+        results.append(res)
+        begin = end + rnd.choice([1, 1, 1, 2])
+    return sentences, results
+
+
+def best_time(function, sentences, results, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        output = function(sentences, results)
+        timings.append(perf_counter() - start)
+    return min(timings), output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the language span fusion")
+    parser.add_argument("--sentences", default="10000,50000,100000", help="Comma separated numbers of sentences per document")
+    parser.add_argument("--switch-probability", type=float, default=0.1, help="Probability of a language change between sentences")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs per implementation")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the synthetic documents")
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    results = []
+    for sentences_count in [int(s) for s in args.sentences.split(",")]:
+        sentences, predictions = build_document(sentences_count, args.switch_probability, rnd)
+        reference_seconds, reference_output = best_time(fuse_language_spans_reference, sentences, predictions, args.repeat)
+        seconds, output = best_time(fuse_language_spans, sentences, predictions, args.repeat)
+        results.append({
+            "sentences": sentences_count,
+            "spans": len(output["begin"]),
+            "reference_seconds": reference_seconds,
+            "seconds": seconds,
+            "speedup": reference_seconds / seconds,
+            "equal_output": output == reference_output,
+        })
+
+    print(json.dumps({
+        "switch_probability": args.switch_probability,
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
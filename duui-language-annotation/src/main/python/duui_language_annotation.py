@@ -1,4 +1,4 @@
-import copy
+from itertools import groupby, zip_longest
 
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
@@ -10,7 +10,7 @@ from cassis import load_typesystem
 import torch
 from threading import Lock
 from functools import lru_cache
-from LanguageDetection import LanguageDetection, LanguageCheck, LanguageIdentification
+from LanguageDetection import LanguageDetection, LanguageCheck, LanguageIdentification, LanguageCascade
 # from sp_correction import SentenceBestPrediction
 
 # Settings
@@ -69,6 +69,15 @@ class Settings(BaseSettings):
     # language_model_name: str
     # Name of this annotator
     language_model_cache_size: int
+    # Batch size of the transformer models
+    language_batch_size: int = 32
+    # Cascade: fast model run on all sentences and the model for the sentences it is unsure about
+    language_cascade_fast_model: str = "Glotlid"
+    language_cascade_model: str = "papluca/xlm-roberta-base-language-detection"
+    # Cascade: escalate if the top score of the fast model is below the threshold
+    language_cascade_threshold: float = 0.9
+    # Cascade: escalate if the difference of the two top scores of the fast model is below the margin
+    language_cascade_margin: float = 0.2
 
 
 # Load settings from env vars
@@ -77,6 +86,13 @@ lru_cache_with_size = lru_cache(maxsize=settings.language_model_cache_size)
 logging.basicConfig(level=settings.language_log_level)
 logger = logging.getLogger(__name__)
 
+# Check the cascade models, this is a hard error!
+for cascade_model in [settings.language_cascade_fast_model, settings.language_cascade_model]:
+    if cascade_model not in sources or cascade_model not in versions:
+        raise ValueError(f"The cascade model \"{cascade_model}\" does not exist!")
+sources["Cascade"] = f"{sources[settings.language_cascade_fast_model]} -> {sources[settings.language_cascade_model]}"
+versions["Cascade"] = f"{versions[settings.language_cascade_fast_model]} -> {versions[settings.language_cascade_model]}"
+
 device = 0 if torch.cuda.is_available() else "cpu"
 logger.info(f'USING {device}')
 # Load the predefined typesystem that is needed for this annotator to work
@@ -138,6 +154,8 @@ class TextImagerResponse(BaseModel):
     model_name: str
     model_version: str
     model_source: str
+    # Fraction of sentences sent to the second model, only in cascade mode
+    escalated_fraction: Optional[float] = None
 
 
 
@@ -190,8 +208,7 @@ def get_communication_layer() -> str:
 def get_documentation():
     return "Test"
 
-@lru_cache_with_size
-def load_model(model_name):
+def create_model(model_name):
     match model_name:
         case "Glotlid":
             model_i = LanguageDetection()
@@ -204,10 +221,33 @@ def load_model(model_name):
         case "glc3d":
             model_i = LanguageIdentification(model_name="glc3d")
         case _:
-            model_i = LanguageCheck(model_name, device=device)
+            model_i = LanguageCheck(model_name, device=device, batch_size=settings.language_batch_size)
     return model_i
 
 
+@lru_cache_with_size
+def load_model(model_name):
+    return create_model(model_name)
+
+
+# The cascade holds both of its models itself, so they do not evict each other from the model cache on every escalation
+@lru_cache(maxsize=1)
+def load_cascade():
+    return LanguageCascade(
+        create_model(settings.language_cascade_fast_model),
+        create_model(settings.language_cascade_model),
+        threshold=settings.language_cascade_threshold,
+        margin=settings.language_cascade_margin
+    )
+
+
+def load_classifier(model_name):
+    match model_name:
+        case "Cascade":
+            return load_cascade()
+    return load_model(model_name)
+
+
 def fix_unicode_problems(text):
     # fix emoji in python string and prevent json error on response
     # File "/usr/local/lib/python3.8/site-packages/starlette/responses.py", line 190, in render
@@ -215,12 +255,67 @@ def fix_unicode_problems(text):
     clean_text = text.encode('utf-16', 'surrogatepass').decode('utf-16', 'surrogateescape')
     return clean_text
 
-def process_selection(model_name, selection):
+# Fuse the top languages of the sentences into spans, sentences of the same language are fused if one begins
+# one character after the end of the previous one, the score of a span is the average of the fused sentence scores.
+# Same output as the previous nested loop version: a single sentence directly before a fused span is added to it,
+# and the inner sentences of a fused span are counted twice for the average.
+def fuse_language_spans(sentences, results):
     all_begin = []
     all_end = []
     langs = []
     scores = []
-    lang_out = {}
+
+    # top language of each sentence, a later sentence with the same language and begin replaces the earlier one
+    lang_order = {}
+    spans = {}
+    for sentence, res in zip(sentences, results):
+        lang, score = next(iter(res.items()))
+        lang_index = lang_order.setdefault(lang, len(lang_order))
+        spans[(lang_index, sentence.begin)] = (sentence.end, lang, score)
+
+    # single sweep over the sentences sorted by language (in order of appearance) and begin
+    for _, lang_spans in groupby(sorted(spans.items()), key=lambda span: span[0][0]):
+        lang_spans = [(begin, end, lang, score) for (_, begin), (end, lang, score) in lang_spans]
+        # open span as [begin, end, score sum, score count]
+        fused_span = None
+        fused_with_previous = False
+        for (begin, end, lang, score), next_span in zip_longest(lang_spans, lang_spans[1:]):
+            if next_span is not None and next_span[0] == end + 1:
+                if fused_span is None:
+                    fused_span = [begin, end, 0.0, 0]
+                fused_span[1] = next_span[1]
+                fused_span[2] += score
+                fused_span[2] += next_span[3]
+                fused_span[3] += 2
+                fused_with_previous = True
+                continue
+
+            if fused_span is not None:
+                all_begin.append(fused_span[0])
+                all_end.append(fused_span[1])
+                langs.append(lang)
+                scores.append(fused_span[2] / fused_span[3])
+                fused_span = None
+            if not fused_with_previous:
+                fused_span = [begin, end, score, 1]
+            fused_with_previous = False
+
+        if fused_span is not None:
+            all_begin.append(fused_span[0])
+            all_end.append(fused_span[1])
+            langs.append(lang_spans[0][2])
+            scores.append(fused_span[2] / fused_span[3])
+
+    output = {
+        "begin": all_begin,
+        "end": all_end,
+        "lang": langs,
+        "scores": scores
+    }
+    return output
+
+
+def process_selection(model_name, selection):
     for s in selection.sentences:
         s.text = fix_unicode_problems(s.text)
 
@@ -231,83 +326,17 @@ def process_selection(model_name, selection):
     logger.debug("Preprocessed texts:")
     logger.debug(texts)
 
+    escalated = 0
     with model_lock:
-        classifier = load_model(model_name)
-        results = classifier.lang_prediction(texts)
-        for c, res in enumerate(results):
-            all_langs = list(res.keys())
-            if all_langs[0] not in lang_out:
-                lang_out[all_langs[0]] = {}
-            begin_i = selection.sentences[c].begin
-            end_i = selection.sentences[c].end
-            lang_out[all_langs[0]][begin_i] = {
-                "begin": begin_i,
-                "end": end_i,
-                "lang": all_langs[0],
-                "score": res[all_langs[0]]
-            }
-        # sort after begin
-        for lang in lang_out:
-            lang_out[lang] = dict(sorted(lang_out[lang].items()))
-        #fuse begin and end if begin and end+1 of the key are the same
-        lang_out_copy = copy.deepcopy(lang_out)
-        fused_list = {}
-        for lang in lang_out_copy:
-            fused_list[lang] = [[]]
-            begin_keys = list(lang_out_copy[lang].keys())
-            counter_index = 0
-            for i in range(len(begin_keys)):
-                if i+1 in range(len(begin_keys)):
-                    begin_i = lang_out_copy[lang][begin_keys[i+1]]["begin"]
-                    end_i = lang_out_copy[lang][begin_keys[i]]["end"]
-                    if begin_i == end_i+1:
-                        lang_out[lang][begin_keys[i]]["Fuse"] = True
-                        lang_out[lang][begin_keys[i+1]]["Fuse"] = True
-                        fused_list[lang][counter_index].append(begin_keys[i])
-                        fused_list[lang][counter_index].append(begin_keys[i+1])
-                    else:
-                        if len(fused_list[lang][counter_index]) > 0:
-                            counter_index += 1
-                            fused_list[lang].append([])
-                        if "Fuse" not in lang_out[lang][begin_keys[i]]:
-                            fused_list[lang][counter_index].append(begin_keys[i])
-                else:
-                    if len(fused_list[lang][counter_index]) > 0:
-                        counter_index += 1
-                        fused_list[lang].append([])
-                    if "Fuse" not in lang_out[lang][begin_keys[i]]:
-                        fused_list[lang][counter_index].append(begin_keys[i])
-        lang_new_out = {}
-        for lang in fused_list:
-            lang_new_out[lang] = {}
-            for i in range(len(fused_list[lang])):
-                if len(fused_list[lang][i]) > 0:
-                    begin = fused_list[lang][i][0]
-                    end = lang_out[lang][fused_list[lang][i][-1]]["end"]
-                    scores_i = []
-                    for j in range(len(fused_list[lang][i])):
-                        scores_i.append(lang_out[lang][fused_list[lang][i][j]]["score"])
-                    avg_score = sum(scores_i) / len(scores_i)
-                    lang_new_out[lang][begin] = {
-                        "begin": begin,
-                        "end": end,
-                        "lang": lang,
-                        "score": avg_score
-                    }
-        for lang in lang_new_out:
-            for begin in lang_new_out[lang]:
-                begin = lang_new_out[lang][begin]["begin"]
-                end = lang_new_out[lang][begin]["end"]
-                langs.append(lang_new_out[lang][begin]["lang"])
-                scores.append(lang_new_out[lang][begin]["score"])
-                all_begin.append(begin)
-                all_end.append(end)
-    output = {
-        "begin": all_begin,
-        "end": all_end,
-        "lang": langs,
-        "scores": scores
-    }
+        classifier = load_classifier(model_name)
+        if isinstance(classifier, LanguageCascade):
+            results, escalated = classifier.cascade_prediction(texts)
+            logger.debug(f"Escalated {escalated} of {len(texts)} sentences")
+        else:
+            results = classifier.lang_prediction(texts)
+
+    output = fuse_language_spans(selection.sentences, results)
+    output["escalated"] = escalated
     return output
 
 # Process request from DUUI
@@ -319,6 +348,7 @@ def post_process(request: TextImagerRequest):
     end = []
     lang = []
     scores = []
+    escalated_fraction = None
     # Save modification start time for later
     modification_timestamp_seconds = int(time())
     try:
@@ -339,6 +369,8 @@ def post_process(request: TextImagerRequest):
             comment=modification_meta_comment
         )
         mv = ""
+        sentences_count = 0
+        escalated = 0
 
         for selection in request.selections:
             processed_sentences = process_selection(request.model_name, selection)
@@ -346,9 +378,14 @@ def post_process(request: TextImagerRequest):
             end = end + processed_sentences["end"]
             lang = lang + processed_sentences["lang"]
             scores = scores + processed_sentences["scores"]
+            sentences_count += len(selection.sentences)
+            escalated += processed_sentences["escalated"]
+        if request.model_name == "Cascade" and sentences_count > 0:
+            escalated_fraction = escalated / sentences_count
+            logger.info(f"Cascade escalated {escalated} of {sentences_count} sentences ({escalated_fraction:.1%})")
     except Exception as ex:
         logger.exception(ex)
-    return TextImagerResponse(meta=meta, modification_meta=modification_meta, begin=begin, end=end, lang=lang, scores=scores, model_name=request.model_name,model_version=model_version, model_source=model_source)
+    return TextImagerResponse(meta=meta, modification_meta=modification_meta, begin=begin, end=end, lang=lang, scores=scores, model_name=request.model_name,model_version=model_version, model_source=model_source, escalated_fraction=escalated_fraction)
 
 
 
@@ -0,0 +1,122 @@
+# Benchmark of the "objects" and "columnar" response formats of the spaCy annotator
+# Compares building and serializing the response of one large document, the spaCy processing is only done once.
+# Run from this directory, the model needs to be installed:
+#   python benchmark_response_format.py --model de_core_news_sm --size 1000000
+import argparse
+import json
+import os
+from time import perf_counter
+
+# The service is configured using env vars, provide defaults for a local run
+os.environ.setdefault("TEXTIMAGER_SPACY_ANNOTATOR_NAME", "textimager-duui-spacy-benchmark")
+os.environ.setdefault("TEXTIMAGER_SPACY_ANNOTATOR_VERSION", "unset")
+os.environ.setdefault("TEXTIMAGER_SPACY_LOG_LEVEL", "WARNING")
+os.environ.setdefault("TEXTIMAGER_SPACY_MODEL_CACHE_SIZE", "1")
+os.environ.setdefault("TEXTIMAGER_SPACY_VARIANT", "")
+
+# Typesystem and Lua script are loaded relative to the working directory
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+import textimager_duui_spacy as service
+
+SAMPLE_TEXT = (
+    "Die Bundesregierung hat am Mittwoch in Berlin einen neuen Gesetzentwurf vorgestellt. "
+    "Angela Merkel sprach mit Vertretern der Länder über die Finanzierung der Schulen. "
+    "Weitere Informationen gibt es unter https://www.example.org/nachrichten?id=42 im Netz. "
+    "Die Opposition kritisierte den Vorschlag als unzureichend und forderte Nachbesserungen. "
+)
+
+
+def build_text(size):
+    return (SAMPLE_TEXT * (size // len(SAMPLE_TEXT) + 1))[:size]
+
+
+def build_objects(doc, utf16_converter, write_types, meta, modification_meta):
+    sentences = []
+    tokens = []
+    dependencies = []
+    entities = []
+    service.add_doc_objects(doc, 0, utf16_converter.python_to_external, write_types, sentences, tokens, dependencies, entities)
+    return service.TextImagerResponse(
+        sentences=sentences,
+        tokens=tokens,
+        dependencies=dependencies,
+        entities=entities,
+        meta=meta,
+        modification_meta=modification_meta,
+        is_pretokenized=False
+    ).model_dump_json()
+
+
+def build_columnar(doc, utf16_converter, write_types, meta, modification_meta):
+    columns = service.ColumnarAnnotations(write_types)
+    columns.add_doc(doc, 0, utf16_converter)
+    return columns.to_response(meta, modification_meta, False).model_dump_json()
+
+
+def run_benchmark(name, builder, repeat, *args):
+    timings = []
+    content = None
+    for _ in range(repeat):
+        start = perf_counter()
+        content = builder(*args)
+        timings.append(perf_counter() - start)
+    return {
+        "format": name,
+        "best_seconds": min(timings),
+        "mean_seconds": sum(timings) / len(timings),
+        "response_bytes": len(content.encode("utf-8")),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the response formats of the spaCy annotator")
+    parser.add_argument("--model", default="de_core_news_sm", help="spaCy model to use")
+    parser.add_argument("--size", type=int, default=1000000, help="Document size in characters")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs per format")
+    args = parser.parse_args()
+
+    text = build_text(args.size)
+
+    nlp = service.spacy.load(args.model)
+    nlp.max_length = len(text) + 100
+    start = perf_counter()
+    doc = nlp(text)
+    spacy_seconds = perf_counter() - start
+
+    utf16_converter = service.Utf16OffsetConverter(text)
+
+    meta = service.AnnotationMeta(
+        name=service.settings.annotator_name,
+        version=service.settings.annotator_version,
+        modelName=nlp.meta["name"],
+        modelVersion=nlp.meta["version"],
+        spacyVersion=service.spacy.__version__,
+        modelLang=nlp.meta["lang"],
+        modelSpacyVersion=nlp.meta["spacy_version"],
+        modelSpacyGitVersion=nlp.meta["spacy_git_version"]
+    )
+    modification_meta = service.DocumentModification(
+        user=service.settings.annotator_name,
+        timestamp=0,
+        comment="benchmark"
+    )
+    write_types = set(service.TEXTIMAGER_ANNOTATOR_OUTPUT_TYPES)
+
+    results = [
+        run_benchmark(service.RESPONSE_FORMAT_OBJECTS, build_objects, args.repeat, doc, utf16_converter, write_types, meta, modification_meta),
+        run_benchmark(service.RESPONSE_FORMAT_COLUMNAR, build_columnar, args.repeat, doc, utf16_converter, write_types, meta, modification_meta),
+    ]
+
+    print(json.dumps({
+        "model": args.model,
+        "text_chars": len(text),
+        "tokens": len(doc),
+        "spacy_seconds": spacy_seconds,
+        "speedup": results[0]["best_seconds"] / results[1]["best_seconds"],
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
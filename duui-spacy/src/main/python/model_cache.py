@@ -0,0 +1,130 @@
+import gc
+import logging
+import os
+import resource
+from collections import OrderedDict
+from threading import Lock
+from time import time
+
+logger = logging.getLogger(__name__)
+
+
+# Get the resident memory of this process in bytes
+def get_resident_memory():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # Only the peak is available, on Linux this is in KB
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# LRU cache for loaded models, limited by number of models and/or their memory
+# The size of a model is measured as the increase of resident memory while loading it.
+# Note: If different models are loaded concurrently, the measured sizes are only approximations.
+class ModelCache:
+    def __init__(self, max_models=None, max_memory=None):
+        # Max number of cached models, None for no limit
+        self.max_models = max_models
+        # Max memory of all cached models in bytes, None for no limit
+        self.max_memory = max_memory
+
+        # Cached models, ordered from least to most recently used
+        self.entries = OrderedDict()
+        self.lock = Lock()
+        # One lock per key, so that a model is only loaded once, while other models can still be loaded
+        # The locks are kept after eviction, a waiting request might already hold a reference to it.
+        self.key_locks = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # Get the model for this key, loading it with the given function if not cached
+    def get(self, key, load):
+        with self.lock:
+            model = self.get_cached(key)
+            if model is not None:
+                return model
+            if key not in self.key_locks:
+                self.key_locks[key] = Lock()
+            key_lock = self.key_locks[key]
+
+        with key_lock:
+            # Another request might have loaded the model while waiting for the lock
+            with self.lock:
+                model = self.get_cached(key)
+                if model is not None:
+                    return model
+                self.misses += 1
+
+            memory_before = get_resident_memory()
+            model = load()
+            size = max(0, get_resident_memory() - memory_before)
+            logger.info("Loaded model \"%s\" using %.1f MB", key, size / 1024 / 1024)
+
+            with self.lock:
+                self.entries[key] = {
+                    "model": model,
+                    "size": size,
+                    "loaded": time(),
+                }
+                evicted = self.evict(key)
+
+        # Free the memory of the evicted models, as far as they are not used anymore
+        if evicted > 0:
+            gc.collect()
+
+        return model
+
+    # Get cached model and mark it as recently used, lock must be held
+    def get_cached(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry["model"]
+
+    # Evict least recently used models until the limits are met, never evicts the given key, lock must be held
+    def evict(self, keep_key):
+        evicted = 0
+        while len(self.entries) > 1 and self.is_over_limit():
+            key = next(iter(self.entries))
+            if key == keep_key:
+                break
+            entry = self.entries.pop(key)
+            self.evictions += 1
+            evicted += 1
+            logger.info("Evicted model \"%s\" using %.1f MB", key, entry["size"] / 1024 / 1024)
+        return evicted
+
+    def is_over_limit(self):
+        if self.max_models is not None and len(self.entries) > self.max_models:
+            return True
+        if self.max_memory is not None and self.memory() > self.max_memory:
+            return True
+        return False
+
+    # Memory of all cached models in bytes
+    def memory(self):
+        return sum(entry["size"] for entry in self.entries.values())
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "max_models": self.max_models,
+                "max_memory": self.max_memory,
+                "memory": self.memory(),
+                "models": [
+                    {
+                        "key": str(key),
+                        "size": entry["size"],
+                        "loaded": entry["loaded"],
+                    }
+                    for key, entry in self.entries.items()
+                ],
+            }
@@ -0,0 +1,109 @@
+import logging
+import sqlite3
+from collections import OrderedDict
+from threading import Lock
+from time import time
+
+logger = logging.getLogger(__name__)
+
+
+# Cache for serialized annotation results, identified by a hash of everything the result depends on
+# Uses an in-memory LRU tier and an optional SQLite file as second tier, shared between restarts.
+# Entries found on disk are moved to the memory tier again.
+class ResultCache:
+    def __init__(self, max_entries=0, disk_path=None, max_disk_size=None):
+        # Max number of results in memory, 0 disables the memory tier
+        self.max_entries = max_entries
+        # Max size of all results on disk in bytes, None for no limit
+        self.max_disk_size = max_disk_size
+
+        # Cached results, ordered from least to most recently used
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+
+        self.disk = None
+        self.disk_size = 0
+        if disk_path is not None:
+            self.disk = sqlite3.connect(disk_path, check_same_thread=False, isolation_level=None)
+            self.disk.execute("PRAGMA journal_mode=WAL")
+            self.disk.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)")
+            self.disk.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+            self.disk_size = self.disk.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            logger.info("Using result cache on disk \"%s\" with %.1f MB", disk_path, self.disk_size / 1024 / 1024)
+
+    def is_enabled(self):
+        return self.max_entries > 0 or self.disk is not None
+
+    # Get the cached result for this key, None if not cached
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+                self.memory_hits += 1
+                return value
+
+            if self.disk is not None:
+                row = self.disk.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self.disk.execute("UPDATE results SET accessed = ? WHERE key = ?", (time(), key))
+                    self.disk_hits += 1
+                    self.put_memory(key, row[0])
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.put_memory(key, value)
+
+            if self.disk is not None:
+                size = len(value.encode("utf-8"))
+                row = self.disk.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+                self.disk.execute("INSERT OR REPLACE INTO results (key, value, size, accessed) VALUES (?, ?, ?, ?)", (key, value, size, time()))
+                self.disk_size += size - (row[0] if row is not None else 0)
+                self.evict_disk(key)
+
+    # Add to memory tier and evict least recently used results, lock must be held
+    def put_memory(self, key, value):
+        if self.max_entries <= 0:
+            return
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    # Delete least recently accessed results until the disk limit is met, never evicts the given key, lock must be held
+    def evict_disk(self, keep_key):
+        if self.max_disk_size is None:
+            return
+        while self.disk_size > self.max_disk_size:
+            row = self.disk.execute("SELECT key, size FROM results WHERE key != ? ORDER BY accessed LIMIT 1", (keep_key,)).fetchone()
+            if row is None:
+                break
+            self.disk.execute("DELETE FROM results WHERE key = ?", (row[0],))
+            self.disk_size -= row[1]
+            self.disk_evictions += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_evictions": self.disk_evictions,
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "disk_entries": self.disk.execute("SELECT COUNT(*) FROM results").fetchone()[0] if self.disk is not None else 0,
+                "disk_size": self.disk_size,
+                "max_disk_size": self.max_disk_size,
+            }
@@ -3,6 +3,29 @@ StandardCharsets = luajava.bindClass("java.nio.charset.StandardCharsets")
 JCasUtil = luajava.bindClass("org.apache.uima.fit.util.JCasUtil")
 Token = luajava.bindClass("de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Token")
 Sentence = luajava.bindClass("de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Sentence")
+
+-- Setters of the morphological features, used for the columnar response format
+MORPH_FEATURE_SETTERS = {
+    gender = "setGender",
+    number = "setNumber",
+    case = "setCase",
+    degree = "setDegree",
+    verbForm = "setVerbForm",
+    tense = "setTense",
+    mood = "setMood",
+    voice = "setVoice",
+    definiteness = "setDefiniteness",
+    person = "setPerson",
+    aspect = "setAspect",
+    animacy = "setAnimacy",
+    negative = "setNegative",
+    numType = "setNumType",
+    possessive = "setPossessive",
+    pronType = "setPronType",
+    reflex = "setReflex",
+    transitivity = "setTransitivity"
+}
+
 -- This "serialize" function is called to transform the CAS object into an stream that is sent to the annotator
 -- Inputs:
 --  - inputCas: The actual CAS object to serialize
@@ -16,9 +39,10 @@ function serialize(inputCas, outputStream, parameters)
     local doc_lang = inputCas:getDocumentLanguage()
 
     -- Should use tokens directly?
-    local tokens = nil
-    local spaces = nil
-    local sent_starts = nil
+    -- Tokens are sent as their offsets in the text, spaces are derived from the gaps between them
+    local token_begins = nil
+    local token_ends = nil
+    local sent_start_inds = nil
     local use_existing_tokens = false
     local use_existing_sentences = false
     if parameters["use_existing_tokens"] ~= nil then
@@ -28,43 +52,43 @@ function serialize(inputCas, outputStream, parameters)
         use_existing_sentences = parameters["use_existing_sentences"] == "true"
     end
     if use_existing_tokens then
-        tokens = {}
-        spaces = {}
-        sent_starts = {}
+        token_begins = {}
+        token_ends = {}
+        if use_existing_sentences then
+            sent_start_inds = {}
+        end
 
-        local tokens_count = 1
-        local tokens_it = luajava.newInstance("java.util.ArrayList", JCasUtil:select(inputCas, Token)):listIterator()
-        local sentences = luajava.newInstance("java.util.ArrayList", JCasUtil:select(inputCas, Sentence))
+        -- Tokens and sentences are both sorted by begin, so a single pass over both is enough
+        local sentences_it = JCasUtil:select(inputCas, Sentence):iterator()
+        local sentence = nil
+        if sentences_it:hasNext() then
+            sentence = sentences_it:next()
+        end
+
+        local tokens_count = 0
+        local tokens_it = JCasUtil:select(inputCas, Token):iterator()
         while tokens_it:hasNext() do
             local token = tokens_it:next()
-            tokens[tokens_count] = token:getCoveredText()
-            -- try to get next to see if space is needed
-            has_space = false
-            if tokens_it:hasNext() then
-                local next_token = tokens_it:next()
-                has_space = next_token:getBegin() ~= token:getEnd()
-                tokens_it:previous()
-            end
-            spaces[tokens_count] = has_space
+            local token_begin = token:getBegin()
+            tokens_count = tokens_count + 1
+            token_begins[tokens_count] = token_begin
+            token_ends[tokens_count] = token:getEnd()
+
             if use_existing_sentences then
-                local sentences_it = sentences:listIterator()
-                sent_starts[tokens_count] = false
-                while sentences_it:hasNext() do
-                    local sentence = sentences_it:next()
-                    if sentence:getBegin() == token:getBegin() then
-                        sent_starts[tokens_count] = true
-                        break
-                    elseif sentence:getBegin() > token:getBegin() then
-                        break
+                -- Skip sentences starting before this token
+                while sentence ~= nil and sentence:getBegin() < token_begin do
+                    if sentences_it:hasNext() then
+                        sentence = sentences_it:next()
+                    else
+                        sentence = nil
                     end
                 end
+                -- Note: Token indices start at 0 in the annotator
+                if sentence ~= nil and sentence:getBegin() == token_begin then
+                    sent_start_inds[#sent_start_inds+1] = tokens_count - 1
+                end
             end
-
-            tokens_count = tokens_count + 1
         end
-
-        -- reset text
-        doc_text = ""
     end
 
     -- Encode data as JSON object and write to stream
@@ -73,9 +97,9 @@ function serialize(inputCas, outputStream, parameters)
         text = doc_text,
         lang = doc_lang,
         parameters = parameters,
-        tokens = tokens,
-        spaces = spaces,
-        sent_starts = sent_starts
+        token_begins = token_begins,
+        token_ends = token_ends,
+        sent_start_inds = sent_start_inds
     }))
 end
 
@@ -84,11 +108,12 @@ end
 --  - inputCas: The actual CAS object to deserialize into
 --  - inputStream: Stream that is received from to the annotator, can be e.g. a string, JSON payload, ...
 function deserialize(inputCas, inputStream)
-    -- Get string from stream, assume UTF-8 encoding
-    local inputString = luajava.newInstance("java.lang.String", inputStream:readAllBytes(), StandardCharsets.UTF_8)
+    -- Read stream line by line, assume UTF-8 encoding
+    -- Note: All formats except "stream" are sent as one single line
+    local inputReader = luajava.newInstance("java.io.BufferedReader", luajava.newInstance("java.io.InputStreamReader", inputStream, StandardCharsets.UTF_8))
 
-    -- Parse JSON data from string into object
-    local results = json.decode(inputString)
+    -- Parse JSON data from first line into object
+    local results = json.decode(inputReader:readLine())
 
     -- Add modification annotation
     local modification_meta = results["modification_meta"]
@@ -104,10 +129,34 @@ function deserialize(inputCas, inputStream)
     -- If was pretokenized, use existing tokens
     local is_pretokenized = results["is_pretokenized"]
 
+    -- Columnar responses contain arrays instead of objects
+    if results["format"] == "columnar" then
+        deserialize_columnar(inputCas, results, meta, is_pretokenized)
+        return
+    end
+
+    -- Streamed responses contain one columnar response per line, each is added before reading the next one
+    -- The last line either marks the end of the stream or contains the error that stopped the processing
+    if results["format"] == "stream" then
+        local line = inputReader:readLine()
+        while line ~= nil do
+            local window = json.decode(line)
+            if window["error"] ~= nil then
+                error("spaCy failed while streaming the response: " .. window["error"])
+            end
+            if window["done"] then
+                return
+            end
+            deserialize_columnar(inputCas, window, meta, is_pretokenized)
+            line = inputReader:readLine()
+        end
+        error("spaCy streaming response ended before it was complete")
+    end
+
     -- Add sentences
     for i, sent in ipairs(results["sentences"]) do
         -- Writing can be disabled via parameters
-        -- Note: spaCy will still run the full pipeline, and all results are based on these results
+        -- Note: Only the spaCy pipeline components needed for the written types are run
         if sent["write_sentence"] then
             -- Create sentence annotation
             local sent_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Sentence", inputCas)
@@ -403,3 +452,200 @@ function deserialize(inputCas, inputStream)
         end
     end
 end
+
+-- Create annotator meta data annotation for the given annotation, using the base meta data
+function add_annotator_meta(inputCas, reference, meta)
+    local meta_anno = luajava.newInstance("org.texttechnologylab.annotation.SpacyAnnotatorMetaData", inputCas)
+    meta_anno:setReference(reference)
+    meta_anno:setName(meta["name"])
+    meta_anno:setVersion(meta["version"])
+    meta_anno:setModelName(meta["modelName"])
+    meta_anno:setModelVersion(meta["modelVersion"])
+    meta_anno:setSpacyVersion(meta["spacyVersion"])
+    meta_anno:setModelLang(meta["modelLang"])
+    meta_anno:setModelSpacyVersion(meta["modelSpacyVersion"])
+    meta_anno:setModelSpacyGitVersion(meta["modelSpacyGitVersion"])
+    meta_anno:addToIndexes()
+end
+
+-- Deserialize the columnar response format
+-- All annotations are sent as parallel arrays, only the arrays needed for the written types are set
+function deserialize_columnar(inputCas, results, meta, is_pretokenized)
+    local write = results["write"]
+
+    -- Add sentences
+    if write["sentence"] then
+        local sentence_ends = results["sentences"]["end"]
+        for i, begin in ipairs(results["sentences"]["begin"]) do
+            local sent_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Sentence", inputCas)
+            sent_anno:setBegin(begin)
+            sent_anno:setEnd(sentence_ends[i])
+            sent_anno:addToIndexes()
+            add_annotator_meta(inputCas, sent_anno, meta)
+        end
+    end
+
+    -- Add tokens
+    -- Save all tokens, to allow for retrieval in dependencies
+    -- Note: Lua starts counting at 1, token indices in the response start at 0
+    local tokens = results["tokens"]
+    local token_begins = tokens["begin"]
+    local token_ends = tokens["end"]
+    local all_tokens = {}
+    if is_pretokenized then
+        -- Use existing tokens if pretokenized
+        local tokens_count = 1
+        local tokens_it = JCasUtil:select(inputCas, Token):iterator()
+        while tokens_it:hasNext() do
+            all_tokens[tokens_count] = tokens_it:next()
+            tokens_count = tokens_count + 1
+        end
+    elseif write["token"] then
+        for i, begin in ipairs(token_begins) do
+            local token_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Token", inputCas)
+            token_anno:setBegin(begin)
+            token_anno:setEnd(token_ends[i])
+            token_anno:addToIndexes()
+            all_tokens[i] = token_anno
+            add_annotator_meta(inputCas, token_anno, meta)
+        end
+
+        -- URL detection
+        local url_parts = results["urls"]["parts"]
+        for i, ind in ipairs(results["urls"]["ind"]) do
+            local url_anno = luajava.newInstance("org.texttechnologylab.type.id.URL", inputCas)
+            url_anno:setBegin(token_begins[ind+1])
+            url_anno:setEnd(token_ends[ind+1])
+
+            -- optional url might be split in parts
+            local parts = url_parts[i]
+            if next(parts) ~= nil then
+                url_anno:setScheme(parts["scheme"])
+                url_anno:setUser(parts["user"])
+                url_anno:setPassword(parts["password"])
+                url_anno:setHost(parts["host"])
+                url_anno:setPort(parts["port"])
+                url_anno:setPath(parts["path"])
+                url_anno:setQuery(parts["query"])
+                url_anno:setFragment(parts["fragment"])
+            end
+            url_anno:addToIndexes()
+        end
+    end
+
+    if write["lemma"] then
+        local lemmas = tokens["lemma"]
+        for i, begin in ipairs(token_begins) do
+            local token_anno = all_tokens[i]
+            local lemma_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Lemma", inputCas)
+            lemma_anno:setBegin(begin)
+            lemma_anno:setEnd(token_ends[i])
+            if lemmas[i] == nil or lemmas[i] == "" then
+                if token_anno ~= nil then
+                    lemma_anno:setValue(token_anno:getCoveredText())
+                end
+            else
+                lemma_anno:setValue(lemmas[i])
+            end
+            lemma_anno:addToIndexes()
+
+            if token_anno ~= nil then
+                token_anno:setLemma(lemma_anno)
+            end
+            add_annotator_meta(inputCas, lemma_anno, meta)
+        end
+    end
+
+    if write["pos"] then
+        local pos = tokens["pos"]
+        local pos_coarse = tokens["pos_coarse"]
+        for i, begin in ipairs(token_begins) do
+            local pos_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.lexmorph.type.pos.POS", inputCas)
+            pos_anno:setBegin(begin)
+            pos_anno:setEnd(token_ends[i])
+            pos_anno:setPosValue(pos[i])
+            pos_anno:setCoarseValue(pos_coarse[i])
+            pos_anno:addToIndexes()
+
+            if all_tokens[i] ~= nil then
+                all_tokens[i]:setPos(pos_anno)
+            end
+            add_annotator_meta(inputCas, pos_anno, meta)
+        end
+    end
+
+    if write["morph"] then
+        local morphs = results["morphs"]
+        for i, morph_ind in ipairs(tokens["morph"]) do
+            local morph = morphs[morph_ind+1]
+            local morph_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.lexmorph.type.morph.MorphologicalFeatures", inputCas)
+            morph_anno:setBegin(token_begins[i])
+            morph_anno:setEnd(token_ends[i])
+            morph_anno:setValue(morph["value"])
+
+            -- Add detailed infos, if available
+            for feature, value in pairs(morph["details"]) do
+                local setter = MORPH_FEATURE_SETTERS[feature]
+                if setter ~= nil then
+                    morph_anno[setter](morph_anno, value)
+                end
+            end
+            morph_anno:addToIndexes()
+
+            if all_tokens[i] ~= nil then
+                all_tokens[i]:setMorph(morph_anno)
+            end
+            add_annotator_meta(inputCas, morph_anno, meta)
+        end
+    end
+
+    -- Add dependencies
+    if write["dep"] then
+        local deps = tokens["dep"]
+        for i, head in ipairs(tokens["head"]) do
+            if head >= 0 then
+                local dep_anno
+                if deps[i] == "ROOT" then
+                    dep_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.syntax.type.dependency.ROOT", inputCas)
+                    dep_anno:setDependencyType("--")
+                else
+                    dep_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.syntax.type.dependency.Dependency", inputCas)
+                    dep_anno:setDependencyType(deps[i])
+                end
+
+                dep_anno:setBegin(token_begins[i])
+                dep_anno:setEnd(token_ends[i])
+                dep_anno:setFlavor("basic")
+
+                local governor_token = all_tokens[head+1]
+                local dependent_token = all_tokens[i]
+                if governor_token ~= nil then
+                    dep_anno:setGovernor(governor_token)
+                end
+                if dependent_token ~= nil then
+                    dep_anno:setDependent(dependent_token)
+                end
+                if governor_token ~= nil and dependent_token ~= nil then
+                    dependent_token:setParent(governor_token)
+                end
+
+                dep_anno:addToIndexes()
+                add_annotator_meta(inputCas, dep_anno, meta)
+            end
+        end
+    end
+
+    -- Add entities
+    if write["entity"] then
+        local entity_ends = results["entities"]["end"]
+        local entity_values = results["entities"]["value"]
+        for i, begin in ipairs(results["entities"]["begin"]) do
+            local ent_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.ner.type.NamedEntity", inputCas)
+            ent_anno:setBegin(begin)
+            ent_anno:setEnd(entity_ends[i])
+            ent_anno:setValue(entity_values[i])
+            ent_anno:addToIndexes()
+            add_annotator_meta(inputCas, ent_anno, meta)
+        end
+    end
+end
@@ -1,21 +1,30 @@
+import hashlib
+import json
 import logging
+import re
+from contextlib import asynccontextmanager
 from functools import lru_cache
+from pathlib import Path
 from platform import python_version
 from sys import version as sys_version
-from threading import Lock
+from threading import Thread
 from time import time
 from typing import List, Optional, Union
 from urllib.parse import urlparse
 
+import numpy as np
 import spacy
 from cassis import load_typesystem
-from cassis.cas import Utf16CodepointOffsetConverter
 from fastapi import FastAPI, Response
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
+from spacy.attrs import DEP, HEAD, IS_SPACE, LEMMA, LENGTH, LIKE_URL, MORPH, POS, SPACY, TAG
 from spacy.tokens import Doc
 
+from model_cache import ModelCache
+from result_cache import ResultCache
+
 
 # Settings
 # These are automatically loaded from env variables
@@ -30,10 +39,29 @@ class Settings(BaseSettings):
     log_level: str
     # Model LRU cache size
     model_cache_size: int
+    # Max memory of all cached models in MB, least recently used models are evicted if exceeded
+    model_cache_memory: Optional[int] = None
     # This is set to the model if only one single model is in the Docker image
     single_model: Optional[str] = None
     # This is set to the language of the single model
     single_model_lang: Optional[str] = None
+    # Batch size for processing multiple documents at once, uses the spaCy default if not set
+    batch_size: Optional[int] = None
+    # Number of processes for processing multiple documents at once
+    batch_n_process: int = 1
+    # Number of processes for processing the splits of large texts, -1 uses all cores
+    split_n_process: int = 1
+    # Max number of characters processed at once in the streaming response format
+    stream_window_size: int = 100000
+    # Models to load and warm up at startup, comma separated languages with optional model variant, e.g. "de,en:accuracy"
+    # Note: In single model mode, the single model is preloaded if any entry is given
+    preload_models: Optional[str] = None
+    # Max number of annotation results cached in memory, 0 disables the memory tier
+    result_cache_size: int = 0
+    # Path of the SQLite file to cache annotation results on disk, disabled if not set
+    result_cache_path: Optional[str] = None
+    # Max size of all annotation results cached on disk in MB, least recently used results are deleted if exceeded
+    result_cache_disk_size: Optional[int] = None
 
     class Config:
         env_prefix = 'textimager_spacy_'
@@ -167,6 +195,50 @@ else:
         SPACY_SUPPORTED_LANGS.update(SPACY_MODELS[model_variant].keys())
         SPACY_SUPPORTED_MODELS.update(SPACY_MODELS[model_variant].values())
 
+# Mapping of spaCy morphological features to the fields of the UIMA type
+MORPH_FEATURE_MAPPING = {
+    "Gender": "gender",
+    "Number": "number",
+    "Case": "case",
+    "Degree": "degree",
+    "VerbForm": "verbForm",
+    "Tense": "tense",
+    "Mood": "mood",
+    "Voice": "voice",  # ?
+    "Definite": "definiteness",
+    "Person": "person",
+    "Aspect": "aspect",  # ?
+    "Animacy": "animacy",  # ?
+    "Negative": "negative",  # ?
+    "NumType": "numType",  # ?
+    "Possessive": "possessive",  # ?
+    "PronType": "pronType",
+    "Reflex": "reflex",
+    "Transitivity": "transitivity",  # ?
+}
+
+# Supported response formats
+# - "objects": one JSON object per annotation (default)
+# - "columnar": parallel arrays per annotation type, much faster to build and to parse for large documents
+RESPONSE_FORMAT_OBJECTS = "objects"
+RESPONSE_FORMAT_COLUMNAR = "columnar"
+RESPONSE_FORMAT_STREAM = "stream"
+RESPONSE_FORMATS = [RESPONSE_FORMAT_OBJECTS, RESPONSE_FORMAT_COLUMNAR, RESPONSE_FORMAT_STREAM]
+
+# Attributes that need to be set by the spaCy pipeline to write each type
+# Note: Lemmatizers can depend on the pos and morphological features
+SENTENCE_ATTRIBUTES = {"token.is_sent_start", "doc.sents"}
+WRITE_TYPE_ATTRIBUTES = {
+    UIMA_TYPE_SENTENCE: SENTENCE_ATTRIBUTES,
+    UIMA_TYPE_TOKEN: set(),
+    UIMA_TYPE_LEMMA: {"token.lemma", "token.tag", "token.pos", "token.morph"},
+    UIMA_TYPE_POS: {"token.tag", "token.pos"},
+    UIMA_TYPE_MORPH: {"token.morph"},
+    UIMA_TYPE_DEPENDENCY: {"token.dep", "token.head"},
+    UIMA_TYPE_DEPENDENCY_ROOT: {"token.dep", "token.head"},
+    UIMA_TYPE_NAMED_ENTITY: {"doc.ents", "token.ent_iob", "token.ent_type"},
+}
+
 # Provide additional language mappings
 # TODO more elaborate mapping on iso codes
 SPACY_LANGUAGE_MAPPINGS = {
@@ -183,6 +255,11 @@ class TextImagerRequest(BaseModel):
     tokens: Optional[List[str]] = None
     spaces: Optional[List[bool]] = None
     sent_starts: Optional[List[bool]] = None
+    # Alternatively, offsets of the tokens in the text, this is more compact than tokens and spaces
+    token_begins: Optional[List[int]] = None
+    token_ends: Optional[List[int]] = None
+    # Indices of the tokens starting a sentence, used with token offsets
+    sent_start_inds: Optional[List[int]] = None
     # The texts language
     lang: str
     parameters: Optional[dict] = None
@@ -273,6 +350,117 @@ class TextImagerResponse(BaseModel):
     is_pretokenized: bool
 
 
+# Columnar response: which types should be written by the Lua script
+class ColumnarWriteTypes(BaseModel):
+    sentence: bool
+    token: bool
+    lemma: bool
+    pos: bool
+    morph: bool
+    dep: bool
+    entity: bool
+
+
+# Columnar sentences
+class SentenceColumns(BaseModel):
+    begin: List[int]
+    end: List[int]
+
+
+# Columnar tokens, only the columns needed for the written types are set
+class TokenColumns(BaseModel):
+    begin: List[int]
+    end: List[int]
+    lemma: Optional[List[str]] = None
+    # fine-grained pos, i.e. the tag
+    pos: Optional[List[str]] = None
+    pos_coarse: Optional[List[str]] = None
+    # index into the list of morph values
+    morph: Optional[List[int]] = None
+    # index of the governor token, -1 if there is no dependency
+    head: Optional[List[int]] = None
+    dep: Optional[List[str]] = None
+
+
+# Unique morphological analysis, referenced by the token columns
+class MorphValue(BaseModel):
+    value: str
+    details: dict
+
+
+# Tokens detected as URL
+class UrlColumns(BaseModel):
+    ind: List[int]
+    parts: List[dict]
+
+
+# Columnar entities
+class EntityColumns(BaseModel):
+    begin: List[int]
+    end: List[int]
+    value: List[str]
+
+
+# Columnar response of this annotator
+# Note, this is transformed by the Lua script
+class TextImagerColumnarResponse(BaseModel):
+    # Response format marker, used by the Lua script to select the decoder
+    format: str = RESPONSE_FORMAT_COLUMNAR
+    # Types to write
+    write: ColumnarWriteTypes
+    sentences: SentenceColumns
+    tokens: TokenColumns
+    morphs: List[MorphValue]
+    urls: UrlColumns
+    entities: EntityColumns
+    # Annotation meta, containing model name, version and more
+    meta: Optional[AnnotationMeta] = None
+    # Modification meta, one per document
+    modification_meta: Optional[DocumentModification] = None
+    # Whether the document was pre-tokenized
+    is_pretokenized: bool
+
+
+# First line of the streaming response, followed by one columnar response per window of the text
+# Note, this is transformed by the Lua script
+class TextImagerStreamHeader(BaseModel):
+    # Response format marker, used by the Lua script to select the decoder
+    format: str = RESPONSE_FORMAT_STREAM
+    # Annotation meta, containing model name, version and more
+    meta: Optional[AnnotationMeta] = None
+    # Modification meta, one per document
+    modification_meta: Optional[DocumentModification] = None
+    # Streaming is not used for pre-tokenized documents
+    is_pretokenized: bool = False
+
+
+# Last line of a complete streaming response
+class TextImagerStreamEnd(BaseModel):
+    done: bool = True
+    # Number of streamed windows
+    windows: int
+
+
+# Last line of a streaming response that failed while processing, the Lua script raises this error
+class TextImagerStreamError(BaseModel):
+    error: str
+
+
+# Batch of requests, processed together
+class TextImagerBatchRequest(BaseModel):
+    # The requests to process
+    requests: List[TextImagerRequest]
+    # spaCy batch size, overrides the setting
+    batch_size: Optional[int] = None
+    # Number of processes, overrides the setting
+    n_process: Optional[int] = None
+
+
+# Responses of a batch, in the same order as the requests
+class TextImagerBatchResponse(BaseModel):
+    responses: List[Union[TextImagerResponse, TextImagerColumnarResponse]]
+
+
 # Capabilities
 class TextImagerCapability(BaseModel):
     # List of supported languages by the annotator
@@ -304,6 +492,51 @@ class TextImagerDocumentation(BaseModel):
     implementation_specific: Optional[str] = None
 
 
+# Cached model
+class CachedModel(BaseModel):
+    key: str
+    # Measured resident memory in bytes
+    size: int
+    # Timestamp of loading
+    loaded: float
+
+
+# Statistics of the model cache
+class ModelCacheStats(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    max_models: Optional[int] = None
+    # Memory limit and current usage in bytes
+    max_memory: Optional[int] = None
+    memory: int
+    models: List[CachedModel]
+
+
+# Statistics of the result cache
+class ResultCacheStats(BaseModel):
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    evictions: int
+    disk_evictions: int
+    entries: int
+    max_entries: int
+    disk_entries: int
+    # Disk limit and current usage in bytes
+    disk_size: int
+    max_disk_size: Optional[int] = None
+
+
+# Readiness of this annotator, i.e. whether the preloading at startup is finished
+class TextImagerReadiness(BaseModel):
+    ready: bool
+    # Names of the preloaded models
+    models: List[str]
+    # Entries of the preload list that could not be loaded
+    failed: List[str]
+
+
 # Input/Output description
 class TextImagerInputOutput(BaseModel):
     inputs: List[str]
@@ -358,11 +591,20 @@ def get_spacy_model_name(document_lang, parameters):
     return model_name, document_lang
 
 
-# Create LRU cache with max size for model
-lru_cache_with_size = lru_cache(maxsize=settings.model_cache_size)
-
-# Lock for model loading
-model_load_lock = Lock()
+# Create LRU cache with max size and memory for models
+model_cache = ModelCache(
+    max_models=settings.model_cache_size,
+    max_memory=settings.model_cache_memory * 1024 * 1024 if settings.model_cache_memory is not None else None
+)
+# Sentencizers are tiny, cache them separately so they never evict full models
+sentencizer_cache = ModelCache(max_models=settings.model_cache_size)
+
+# Cache for annotation results of repeated documents
+result_cache = ResultCache(
+    max_entries=settings.result_cache_size,
+    disk_path=settings.result_cache_path,
+    max_disk_size=settings.result_cache_disk_size * 1024 * 1024 if settings.result_cache_disk_size is not None else None
+)
 
 # Load the predefined typesystem that is needed for this annotator to work
 typesystem_filename = 'TypeSystemSpacy.xml'
@@ -383,8 +625,7 @@ with open(lua_communication_script_filename, 'rb') as f:
     logger.debug(lua_communication_script_filename)
 
 
-# Load/cache spaCy model
-@lru_cache_with_size
+# Load spaCy model
 def load_cache_spacy_model(model_name, model_lang, enabled_tools):
     # What tools to enable in the pipeline?
     enabled_tools = None
@@ -403,26 +644,45 @@ def load_cache_spacy_model(model_name, model_lang, enabled_tools):
     return nlp
 
 
-# Load spaCy model using LRU cached function
+# Load spaCy model using the model cache
 def load_spacy_model(model_name, model_lang, enabled_tools):
-    model_load_lock.acquire()
-
     err = None
     try:
         logger.info("Getting spaCy model \"%s\"...", model_name)
-        nlp = load_cache_spacy_model(model_name, model_lang, enabled_tools)
+        nlp = model_cache.get(
+            ("model", model_name, model_lang, enabled_tools),
+            lambda: load_cache_spacy_model(model_name, model_lang, enabled_tools)
+        )
     except Exception as ex:
         nlp = None
         err = str(ex)
         logging.exception("Failed to load spaCy model: %s", ex)
 
-    model_load_lock.release()
-
     return nlp, err
 
 
-# Load/cache spaCy sentencizer model
-@lru_cache_with_size
+# Get the version of a spaCy model without loading it, None if it can not be resolved
+def get_spacy_model_version(model_name):
+    # The sentencizer variant does not use the model, only spaCy itself
+    if settings.variant == "-sentencizer":
+        return ""
+    if spacy.util.is_package(model_name):
+        return spacy.util.get_package_version(model_name)
+    if Path(model_name).exists():
+        return spacy.util.get_model_meta(Path(model_name))["version"]
+    return None
+
+
+# Names of the pipeline components not needed for the written types, cached to check the result cache without loading the model
+@lru_cache(maxsize=1024)
+def get_model_disabled_components(model_name, model_lang, enabled_tools, model_version, write_types):
+    nlp, nlp_err = load_spacy_model(model_name, model_lang, enabled_tools)
+    if nlp is None:
+        raise Exception(f"spaCy model \"{model_name}\" could not be loaded: {nlp_err}")
+    return tuple(get_disabled_components(nlp, write_types))
+
+
+# Load spaCy sentencizer model
 def load_cache_spacy_sentencizer_model(model_lang):
     logger.info("Loading spaCy sentencizer model \"%s\"...", model_lang)
 
@@ -433,24 +693,90 @@ def load_cache_spacy_sentencizer_model(model_lang):
     return nlp_sents
 
 
-# Load spaCy sentencizer model using LRU cached function
+# Load spaCy sentencizer model using the sentencizer cache
 def load_spacy_sentencizer_model(model_lang):
-    model_load_lock.acquire()
-
     err = None
     try:
         logger.info("Getting spaCy sentencizer model \"%s\"...", model_lang)
-        nlp = load_cache_spacy_sentencizer_model(model_lang)
+        nlp = sentencizer_cache.get(
+            ("sentencizer", model_lang),
+            lambda: load_cache_spacy_sentencizer_model(model_lang)
+        )
     except Exception as ex:
         nlp = None
         err = str(ex)
         logging.exception("Failed to load spaCy sentencizer model: %s", ex)
 
-    model_load_lock.release()
-
     return nlp, err
 
 
+# Text used to warm up the preloaded models, the first processing is much slower than all following
+WARMUP_TEXT = "This is a short text. It is only used to warm up the model after loading it."
+
+# State of the preloading at startup, the annotator is ready after all models are loaded
+preload_state = {
+    "ready": False,
+    "models": [],
+    "failed": [],
+}
+
+
+# Parse the list of models to preload into tuples of language and model variant
+def get_preload_models(preload_models):
+    models = []
+    if preload_models is None:
+        return models
+
+    for entry in preload_models.split(","):
+        entry = entry.strip()
+        if len(entry) == 0:
+            continue
+        lang, _, model_variant = entry.partition(":")
+        models.append((lang.strip(), model_variant.strip() if model_variant.strip() else "efficiency"))
+
+    return models
+
+
+# Load and warm up all models to preload
+def preload_spacy_models():
+    models = get_preload_models(settings.preload_models)
+    if len(models) > settings.model_cache_size:
+        logger.warning("Preloading %d models, but the model cache only holds %d", len(models), settings.model_cache_size)
+
+    for lang, model_variant in models:
+        try:
+            if settings.single_model is None:
+                model_name, model_lang = get_spacy_model_name(lang, {"model_variant": model_variant})
+            else:
+                model_name = settings.single_model
+                model_lang = settings.single_model_lang
+            if model_name in preload_state["models"]:
+                continue
+
+            logger.info("Preloading spaCy model \"%s\"...", model_name)
+            start = time()
+            nlp, nlp_err = load_spacy_model(model_name, model_lang, settings.variant)
+            if nlp is None:
+                raise Exception(f"spaCy model \"{model_name}\" could not be loaded: {nlp_err}")
+            process_spacy(nlp, [WARMUP_TEXT])
+            logger.info("Finished preloading spaCy model \"%s\" in %.1f seconds", model_name, time() - start)
+
+            preload_state["models"].append(model_name)
+        except Exception as ex:
+            logger.exception("Failed to preload spaCy model for \"%s:%s\": %s", lang, model_variant, ex)
+            preload_state["failed"].append(f"{lang}:{model_variant}")
+
+    preload_state["ready"] = True
+    logger.info("Annotator is ready")
+
+
+# Preload models in the background, so that the readiness can be checked while loading
+@asynccontextmanager
+async def lifespan(app):
+    Thread(target=preload_spacy_models, daemon=True).start()
+    yield
+
+
 # Start fastapi
 # TODO openapi types are not shown?
 # TODO self host swagger files: https://fastapi.tiangolo.com/advanced/extending-openapi/#self-hosting-javascript-and-css-for-docs
@@ -468,6 +794,7 @@ app = FastAPI(
         "name": "AGPL",
         "url": "http://www.gnu.org/licenses/agpl-3.0.en.html",
     },
+    lifespan=lifespan,
 )
 
 
@@ -502,13 +829,24 @@ def get_documentation() -> TextImagerDocumentation:
             # Use this specific model, overrules all decisions
             "model_name": sorted(list(SPACY_SUPPORTED_MODELS)),
             # Write the following types, if empty/null all are written
-            # Note: All data is always generated by the full document text, dependency is only written if tokens are written too
+            # Note: Only the pipeline components needed for these types are run, dependency is only written if tokens are written too
             "write_types": TEXTIMAGER_ANNOTATOR_OUTPUT_TYPES,
+            # Disable pipeline components not needed for the written types, enabled by default
+            "prune_pipeline": [True, False],
             # Strict language checking, if True the language must be available, on False the multilanguage model is used
             "strict_language_check": [True, False],
+            # Format of the response, "columnar" is much faster for large documents,
+            # "stream" processes the text in windows and streams the results, using bounded memory for very large documents
+            "response_format": RESPONSE_FORMATS,
+            # Max number of characters processed at once in the "stream" response format, overrides the setting
+            "stream_window_size": [settings.stream_window_size],
             # Split large input texts to prevent dramatic increase of time and resources
             # Note: Splitting is performed on sentence boundaries, if possible, else on "."
             "split_large_texts": [True, False],
+            # Number of processes to process the splits in parallel, -1 uses all cores, overrides the setting
+            "split_n_process": [1, -1],
+            # Use the result cache for repeated documents, if enabled in the settings
+            "use_result_cache": [True, False],
             # TODO more zh options
             #"zh_segmenter": [
             #    "char",
@@ -541,6 +879,30 @@ def get_typesystem() -> Response:
     )
 
 
+# Check if the annotator is ready, returns status 503 until the preloading at startup is finished
+@app.get("/v1/ready")
+def get_ready(response: Response) -> TextImagerReadiness:
+    if not preload_state["ready"]:
+        response.status_code = 503
+    return TextImagerReadiness(
+        ready=preload_state["ready"],
+        models=list(preload_state["models"]),
+        failed=list(preload_state["failed"])
+    )
+
+
+# Get statistics of the model cache
+@app.get("/v1/details/model_cache")
+def get_model_cache() -> ModelCacheStats:
+    return ModelCacheStats(**model_cache.stats())
+
+
+# Get statistics of the result cache
+@app.get("/v1/details/result_cache")
+def get_result_cache() -> ResultCacheStats:
+    return ResultCacheStats(**result_cache.stats())
+
+
 # Get annotators input/output types
 @app.get("/v1/details/input_output")
 def get_input_output() -> TextImagerInputOutput:
@@ -560,6 +922,94 @@ def utf16_to_utf8(text):
     return clean_text
 
 
+# Characters outside of the Basic Multilingual Plane, these need two UTF-16 code units
+NON_BMP_CHARACTERS = re.compile("[\U00010000-\U0010FFFF]")
+
+
+# Maps offsets in Python strings (code points) to the UTF-16 offsets used by UIMA
+# Texts with only BMP characters need no conversion at all, this is checked in one scan.
+# Else, a table with the number of surrogates before each position is precomputed,
+# allowing to convert whole offset arrays at once.
+# If the text is a part of the document, external offsets are shifted by its UTF-16 begin in the document.
+class Utf16OffsetConverter:
+    def __init__(self, text, external_begin=0):
+        self.external_begin = external_begin
+        self.text_len = len(text)
+        self.surrogates_before = None
+        if NON_BMP_CHARACTERS.search(text) is not None:
+            code_points = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+            self.surrogates_before = np.zeros(self.text_len+1, dtype=np.int64)
+            np.cumsum(code_points > 0xFFFF, out=self.surrogates_before[1:])
+
+    def is_bmp(self):
+        return self.surrogates_before is None
+
+    def python_to_external(self, idx):
+        if self.surrogates_before is None:
+            return self.external_begin + idx
+        return self.external_begin + idx + int(self.surrogates_before[min(idx, self.text_len)])
+
+    def python_to_external_array(self, offsets):
+        if self.surrogates_before is None:
+            return self.external_begin + offsets
+        return self.external_begin + offsets + self.surrogates_before[np.minimum(offsets, self.text_len)]
+
+    def external_to_python(self, idx):
+        if self.surrogates_before is None:
+            return idx - self.external_begin
+        return int(self.external_to_python_array(idx))
+
+    def external_to_python_array(self, offsets):
+        if self.surrogates_before is None:
+            return offsets - self.external_begin
+        external_offsets = self.external_begin + np.arange(self.text_len+1) + self.surrogates_before
+        return np.searchsorted(external_offsets, offsets)
+
+
+# Maps offsets in the text of a pretokenized doc back to the offsets of the tokens in the CAS
+# The doc text only has single spaces between the tokens, so each token is shifted by the
+# difference of its begin in the CAS and in the doc text, whitespace is shifted with the token before it.
+class PretokenizedOffsetConverter:
+    def __init__(self, doc, token_begins):
+        self.utf16_converter = Utf16OffsetConverter(doc.text)
+        self.token_idx = np.array([token.idx for token in doc], dtype=np.int64)
+        doc_begins = self.utf16_converter.python_to_external_array(self.token_idx)
+        self.shifts = np.array(token_begins, dtype=np.int64) - doc_begins
+
+    def python_to_external(self, idx):
+        return int(self.python_to_external_array(np.array([idx], dtype=np.int64))[0])
+
+    def python_to_external_array(self, offsets):
+        external_offsets = self.utf16_converter.python_to_external_array(offsets)
+        if len(self.shifts) == 0:
+            return external_offsets
+        token_inds = np.maximum(np.searchsorted(self.token_idx, offsets, side="right") - 1, 0)
+        return external_offsets + self.shifts[token_inds]
+
+
+# Convert pretokenized input given as token offsets to tokens and spaces
+def decode_token_offsets(request):
+    # fix utf16 surrogates
+    text = utf16_to_utf8(request.text)
+    utf16_converter = Utf16OffsetConverter(text)
+    begins = utf16_converter.external_to_python_array(np.array(request.token_begins, dtype=np.int64)).tolist()
+    ends = utf16_converter.external_to_python_array(np.array(request.token_ends, dtype=np.int64)).tolist()
+
+    request.tokens = [text[begin:end] for begin, end in zip(begins, ends)]
+    # A token is followed by whitespace if the next token does not start at its end
+    request.spaces = [next_begin != end for next_begin, end in zip(request.token_begins[1:], request.token_ends)]
+    if len(request.tokens) > 0:
+        request.spaces.append(False)
+
+    if request.sent_start_inds is not None:
+        request.sent_starts = [False] * len(request.tokens)
+        for ind in request.sent_start_inds:
+            request.sent_starts[ind] = True
+
+    # The text is not used for pretokenized input, the token begins are kept to map the results back
+    request.text = ""
+
+
 def parse_url(url):
     try:
         parts = urlparse(url)
@@ -581,393 +1031,751 @@ def parse_url(url):
         return None
 
 
-# Process request from DUUI
-@app.post("/v1/process")
-def post_process(request: TextImagerRequest) -> TextImagerResponse:
+def get_morph_details(morph_features):
+    # Extract specific morph features
+    morph_details = {}
+    for feat in morph_features:
+        fields = feat.split("=")
+        if len(fields) != 2:
+            continue
+        # TODO check in nlp.meta for missing
+        feat_key = MORPH_FEATURE_MAPPING.get(fields[0].strip())
+        if feat_key is not None:
+            morph_details[feat_key] = fields[1].strip()
+    return morph_details
+
+
+def get_response_format(parameters):
+    response_format = parameters["response_format"] if "response_format" in parameters else RESPONSE_FORMAT_OBJECTS
+    # Check if format exits, this is a hard error!
+    if response_format not in RESPONSE_FORMATS:
+        raise Exception(f"The specified response format \"{response_format}\" does not exist!")
+    return response_format
+
+
+# Add the annotations of one spaCy doc as single objects
+def add_doc_objects(doc, doc_begin, utf16_to_ext, write_types, sentences, tokens, dependencies, entities):
+    # Sentences
+    # Note: Also sent if not written, if the components setting the boundaries were disabled there are none
+    if UIMA_TYPE_SENTENCE in write_types or doc.has_annotation("SENT_START"):
+        logger.debug("Writing Sentences...")
+        try:
+            # Can fail, e.g. with multilang model
+            # or if no sentencizer is requested
+            # TODO add_pipe("sentencizer") seems to work, check later!
+            for sent in doc.sents:
+                sentences.append(Sentence(
+                    begin=utf16_to_ext(doc_begin+sent.start_char),
+                    end=utf16_to_ext(doc_begin+sent.end_char),
+                    write_sentence=UIMA_TYPE_SENTENCE in write_types,
+                ))
+        except Exception as ex:
+            logger.exception("Error accessing sentences: %s", ex)
+
+    # Token, Lemma, POS, Morphology
+    # Note: The index continues over all docs, as the tokens of split texts are merged
+    cas_tokens = {}
+    token_ind = len(tokens)
+    logger.debug("Writing Tokens...")
+    for token in doc:
+        if not token.is_space:
+            # Create begin/end
+            token_begin = token.idx
+            token_end = token_begin + len(token)
+
+            # Create token data
+            current_token = Token(
+                begin=utf16_to_ext(doc_begin+token_begin),
+                end=utf16_to_ext(doc_begin+token_end),
+
+                # Token
+                ind=token_ind,
+                write_token=UIMA_TYPE_TOKEN in write_types,
+
+                # Lemma
+                lemma=token.lemma_,
+                write_lemma=UIMA_TYPE_LEMMA in write_types,
+
+                # POS
+                # TODO pos mapping?
+                pos=token.tag_,
+                pos_coarse=token.pos_,
+                write_pos=UIMA_TYPE_POS in write_types,
+
+                # Morph
+                morph="|".join(token.morph),
+                morph_details=get_morph_details(token.morph),
+                write_morph=UIMA_TYPE_MORPH in write_types,
+
+                # URL
+                like_url=token.like_url,
+                url_parts=parse_url(token.text) if token.like_url else None
+            )
+            tokens.append(current_token)
+            token_ind += 1
+
+            # Save token info for deps later
+            if token_begin not in cas_tokens:
+                cas_tokens[token_begin] = {}
+            cas_tokens[token_begin][token_end] = current_token
+
+    # Dependency
+    # Note: This is only supported if tokens are written!
+    logger.debug("Writing Dependencies...")
+    for token in doc:
+        if not token.is_space:
+            if not token.head.is_space:
+                # Get CAS token
+                token_begin = token.idx
+                token_end = token_begin + len(token)
+                if token_begin in cas_tokens and token_end in cas_tokens[token_begin]:
+                    uima_token = cas_tokens[token_begin][token_end]
+                else:
+                    continue
+
+                # Get head token
+                begin_head = token.head.idx
+                end_head = begin_head + len(token.head)
+                if begin_head in cas_tokens and end_head in cas_tokens[begin_head]:
+                    uima_head = cas_tokens[begin_head][end_head]
+                else:
+                    continue
+
+                # Create dependency
+                current_dep = Dependency(
+                    begin=utf16_to_ext(doc_begin+token_begin),
+                    end=utf16_to_ext(doc_begin+token_end),
+                    type=token.dep_.upper(),
+                    flavor="basic",
+                    dependent_ind=uima_token.ind,
+                    governor_ind=uima_head.ind,
+                    write_dep=UIMA_TYPE_DEPENDENCY in write_types
+                )
+                dependencies.append(current_dep)
+
+                # Add reference to token
+                uima_token.parent_ind = uima_head.ind
+                uima_token.write_dep = UIMA_TYPE_DEPENDENCY in write_types
+
+    # Named entities
+    logger.debug("Writing Named entities...")
+    try:
+        for ent in doc.ents:
+            entities.append(Entity(
+                begin=utf16_to_ext(doc_begin+ent.start_char),
+                end=utf16_to_ext(doc_begin+ent.end_char),
+                value=ent.label_,
+                write_entity=UIMA_TYPE_NAMED_ENTITY in write_types
+            ))
+    except Exception as ex:
+        logger.exception("Error accessing named entities: %s", ex)
+
+
+# Get the values of a token attribute column
+# Every unique value is only resolved once, using the first token that has it
+def get_unique_column_values(doc, token_inds, column, getter):
+    _, first_inds, inverse = np.unique(column, return_index=True, return_inverse=True)
+    values = [getter(doc[int(token_inds[ind])]) for ind in first_inds]
+    return values, inverse
+
+
+# Collects the annotations of all spaCy docs as parallel arrays
+# The token attributes are extracted in one pass using "Doc.to_array", strings are looked up once per unique value
+class ColumnarAnnotations:
+    # Attribute columns, in order of "Doc.to_array"
+    TOKEN_ATTRS = [LENGTH, SPACY, IS_SPACE, LIKE_URL, HEAD, LEMMA, TAG, POS, MORPH, DEP]
+    COL_LENGTH, COL_SPACY, COL_IS_SPACE, COL_LIKE_URL, COL_HEAD, COL_LEMMA, COL_TAG, COL_POS, COL_MORPH, COL_DEP = range(10)
+
+    def __init__(self, write_types):
+        self.write = ColumnarWriteTypes(
+            sentence=UIMA_TYPE_SENTENCE in write_types,
+            token=UIMA_TYPE_TOKEN in write_types,
+            lemma=UIMA_TYPE_LEMMA in write_types,
+            pos=UIMA_TYPE_POS in write_types,
+            morph=UIMA_TYPE_MORPH in write_types,
+            dep=UIMA_TYPE_DEPENDENCY in write_types,
+            entity=UIMA_TYPE_NAMED_ENTITY in write_types,
+        )
+
+        self.sentence_begins = []
+        self.sentence_ends = []
+
+        self.token_count = 0
+        self.token_begins = []
+        self.token_ends = []
+        self.token_lemmas = []
+        self.token_pos = []
+        self.token_pos_coarse = []
+        self.token_morphs = []
+        self.token_heads = []
+        self.token_deps = []
+
+        # Unique morph values, referenced by index
+        self.morphs = []
+        self.morph_inds = {}
+
+        self.url_inds = []
+        self.url_parts = []
+
+        self.entity_begins = []
+        self.entity_ends = []
+        self.entity_values = []
+
+    def get_morph_ind(self, morph):
+        if morph not in self.morph_inds:
+            self.morph_inds[morph] = len(self.morphs)
+            self.morphs.append(MorphValue(
+                value=morph,
+                details=get_morph_details(morph.split("|")) if morph else {}
+            ))
+        return self.morph_inds[morph]
+
+    def add_doc(self, doc, doc_begin, utf16_converter):
+        utf16_to_ext = utf16_converter.python_to_external
+
+        if self.write.sentence:
+            logger.debug("Writing Sentences...")
+            try:
+                # Can fail, e.g. with multilang model
+                for sent in doc.sents:
+                    self.sentence_begins.append(utf16_to_ext(doc_begin+sent.start_char))
+                    self.sentence_ends.append(utf16_to_ext(doc_begin+sent.end_char))
+            except Exception as ex:
+                logger.exception("Error accessing sentences: %s", ex)
+
+        if len(doc) > 0:
+            logger.debug("Writing Tokens...")
+            self.add_doc_tokens(doc, doc_begin, utf16_converter)
+
+        if self.write.entity:
+            logger.debug("Writing Named entities...")
+            try:
+                for ent in doc.ents:
+                    self.entity_begins.append(utf16_to_ext(doc_begin+ent.start_char))
+                    self.entity_ends.append(utf16_to_ext(doc_begin+ent.end_char))
+                    self.entity_values.append(ent.label_)
+            except Exception as ex:
+                logger.exception("Error accessing named entities: %s", ex)
+
+    def add_doc_tokens(self, doc, doc_begin, utf16_converter):
+        columns = doc.to_array(self.TOKEN_ATTRS)
+
+        # Token offsets, the doc text is the concatenation of all tokens and their trailing whitespace
+        lengths = columns[:, self.COL_LENGTH].astype(np.int64)
+        begins = np.zeros(len(doc), dtype=np.int64)
+        np.cumsum(lengths[:-1] + columns[:-1, self.COL_SPACY].astype(np.int64), out=begins[1:])
+        ends = begins + lengths
+
+        # Whitespace tokens are not written
+        is_token = columns[:, self.COL_IS_SPACE] == 0
+        token_inds = np.flatnonzero(is_token)
+        token_columns = columns[token_inds]
+
+        self.token_begins.extend(utf16_converter.python_to_external_array(doc_begin + begins[token_inds]).tolist())
+        self.token_ends.extend(utf16_converter.python_to_external_array(doc_begin + ends[token_inds]).tolist())
+
+        if self.write.lemma:
+            values, inverse = get_unique_column_values(doc, token_inds, token_columns[:, self.COL_LEMMA], lambda t: t.lemma_)
+            self.token_lemmas.extend(values[ind] for ind in inverse.tolist())
+
+        if self.write.pos:
+            values, inverse = get_unique_column_values(doc, token_inds, token_columns[:, self.COL_TAG], lambda t: t.tag_)
+            self.token_pos.extend(values[ind] for ind in inverse.tolist())
+            values, inverse = get_unique_column_values(doc, token_inds, token_columns[:, self.COL_POS], lambda t: t.pos_)
+            self.token_pos_coarse.extend(values[ind] for ind in inverse.tolist())
+
+        if self.write.morph:
+            values, inverse = get_unique_column_values(doc, token_inds, token_columns[:, self.COL_MORPH], lambda t: "|".join(t.morph))
+            morph_inds = np.array([self.get_morph_ind(value) for value in values], dtype=np.int64)
+            self.token_morphs.extend(morph_inds[inverse].tolist())
+
+        if self.write.dep:
+            # Head is stored relative to the token
+            heads = np.arange(len(doc)) + np.ascontiguousarray(columns[:, self.COL_HEAD]).view(np.int64)
+            # Map doc positions to the indices of the written tokens, the head must not be whitespace
+            inds = np.cumsum(is_token) - 1 + self.token_count
+            has_head = is_token & is_token[heads]
+            self.token_heads.extend(np.where(has_head, inds[heads], -1)[token_inds].tolist())
+            values, inverse = get_unique_column_values(doc, token_inds, token_columns[:, self.COL_DEP], lambda t: t.dep_.upper())
+            self.token_deps.extend(values[ind] for ind in inverse.tolist())
+
+        # URL detection, only needed if tokens are written
+        if self.write.token:
+            for ind in np.flatnonzero(token_columns[:, self.COL_LIKE_URL]).tolist():
+                url_parts = parse_url(doc[int(token_inds[ind])].text)
+                self.url_inds.append(self.token_count + ind)
+                self.url_parts.append(url_parts if url_parts is not None else {})
+
+        self.token_count += len(token_inds)
+
+    def to_response(self, meta, modification_meta, is_pretokenized):
+        return TextImagerColumnarResponse(
+            write=self.write,
+            sentences=SentenceColumns(
+                begin=self.sentence_begins,
+                end=self.sentence_ends,
+            ),
+            tokens=TokenColumns(
+                begin=self.token_begins,
+                end=self.token_ends,
+                lemma=self.token_lemmas if self.write.lemma else None,
+                pos=self.token_pos if self.write.pos else None,
+                pos_coarse=self.token_pos_coarse if self.write.pos else None,
+                morph=self.token_morphs if self.write.morph else None,
+                head=self.token_heads if self.write.dep else None,
+                dep=self.token_deps if self.write.dep else None,
+            ),
+            morphs=self.morphs,
+            urls=UrlColumns(
+                ind=self.url_inds,
+                parts=self.url_parts,
+            ),
+            entities=EntityColumns(
+                begin=self.entity_begins,
+                end=self.entity_ends,
+                value=self.entity_values,
+            ),
+            meta=meta,
+            modification_meta=modification_meta,
+            is_pretokenized=is_pretokenized
+        )
+
+
+# Hash of the input document, i.e. the text or the tokens
+def get_input_hash(request):
+    input_hash = hashlib.sha256()
+    input_hash.update(json.dumps([
+        request.text,
+        request.tokens,
+        request.spaces,
+        request.sent_starts,
+        request.token_begins,
+        request.token_ends,
+        request.sent_start_inds,
+    ], ensure_ascii=False).encode("utf-8", "surrogatepass"))
+    return input_hash.hexdigest()
+
+
+# Key of the result cache, contains everything the response depends on
+def get_result_cache_key(input_hash, model_name, model_version, write_types, prune_pipeline, disabled_components, response_format, parameters):
+    key = hashlib.sha256()
+    key.update(json.dumps([
+        input_hash,
+        settings.annotator_name,
+        settings.annotator_version,
+        settings.variant,
+        spacy.__version__,
+        model_name,
+        model_version,
+        sorted(write_types),
+        prune_pipeline,
+        sorted(disabled_components),
+        response_format,
+        # Splitting changes the results
+        str(parameters.get("split_large_texts", "")).lower(),
+        str(parameters.get("force_split_text", "")).lower(),
+    ]).encode("utf-8"))
+    return key.hexdigest()
+
+
+# Load a cached response, updating the modification timestamp
+def load_cached_response(prepared, modification_timestamp_seconds):
+    if prepared["response_format"] == RESPONSE_FORMAT_COLUMNAR:
+        response = TextImagerColumnarResponse.model_validate_json(prepared["cached_response"])
+    else:
+        response = TextImagerResponse.model_validate_json(prepared["cached_response"])
+    if response.modification_meta is not None:
+        response.modification_meta.timestamp = modification_timestamp_seconds
+    return response
+
+
+# Create an empty response, e.g. on errors
+def create_empty_response():
+    return TextImagerResponse(
+        sentences=[],
+        tokens=[],
+        dependencies=[],
+        entities=[],
+        is_pretokenized=False
+    )
+
+
+# Prepare a request for processing with spaCy
+# Returns the loaded model, the inputs for spaCy and everything needed to build the response later
+# The streaming response format is only supported if allowed, else the columnar format is used instead.
+def prepare_request(request, allow_streaming=False):
+    # Get CAS from XMI string
+    logger.debug("Received:")
+    logger.debug(request)
+
+    # Params, set here to empty dict to allow easier access later
+    if request.parameters is None:
+        request.parameters = {}
+
+    response_format = get_response_format(request.parameters)
+    if response_format == RESPONSE_FORMAT_STREAM and not allow_streaming:
+        logger.warning("Streaming is not supported here, using the columnar response format instead")
+        response_format = RESPONSE_FORMAT_COLUMNAR
+    logger.info("Using response format: \"%s\"", response_format)
+
+    # Hash the input before it is modified, to identify repeated documents
+    # Note: Streamed results are not cached, as their size is not bounded
+    use_result_cache = result_cache.is_enabled() and response_format != RESPONSE_FORMAT_STREAM \
+        and ((str(request.parameters["use_result_cache"]).lower() != "false") if ("use_result_cache" in request.parameters) else True)
+    input_hash = get_input_hash(request) if use_result_cache else None
+
+    # Pretokenized input given as offsets
+    if request.token_begins is not None and request.token_ends is not None:
+        logger.debug("Decoding %d token offsets", len(request.token_begins))
+        decode_token_offsets(request)
+
+    # Get spaCy model if not in single model mode
+    if settings.single_model is None:
+        # Resolve model name
+        model_name, model_lang = get_spacy_model_name(request.lang, request.parameters)
+    else:
+        # In single mode we always use the single specified model!
+        model_name = settings.single_model
+        model_lang = settings.single_model_lang
+        logger.info("Using single model image: \"%s\"", model_name)
+    logger.info("Using spaCy model: \"%s\"", model_name)
+
+    # Split large texts if needed and allowed
+    # TODO test splitting!
+    texts = None
+    texts_meta = None
+    n_process = 1
+    text_len = len(request.text)
+
+    # only if not pretokenized
+    is_pretokenized = request.tokens is not None and len(request.tokens) > 0 \
+                      and request.spaces is not None and len(request.spaces) > 0 \
+                      and len(request.tokens) == len(request.spaces)
+
+    has_sentences = request.sent_starts is not None and len(request.sent_starts) > 0
+
+    # What types to write?
+    if "write_types" in request.parameters and len(request.parameters["write_types"]) > 0:
+        write_types = set(request.parameters["write_types"])
+        logger.info("Only writing types: %s", ", ".join(write_types))
+    else:
+        write_types = set(TEXTIMAGER_ANNOTATOR_OUTPUT_TYPES)
+
+    # dont write tokens if pretokenized
+    if is_pretokenized:
+        write_types.discard(UIMA_TYPE_TOKEN)
+        if has_sentences:
+            write_types.discard(UIMA_TYPE_SENTENCE)
+
+    # Only run the pipeline components needed for the written types
+    prune_pipeline = (str(request.parameters["prune_pipeline"]).lower() != "false") if ("prune_pipeline" in request.parameters) else True
+    # The version identifies the model in the result cache, resolved without loading it
+    model_version = get_spacy_model_version(model_name)
+    disabled_components = list(get_model_disabled_components(model_name, model_lang, settings.variant, model_version, frozenset(write_types))) if prune_pipeline else []
+    logger.info("Disabled pipeline components: %s", ", ".join(disabled_components) if len(disabled_components) > 0 else "none")
+
+    # Return the cached result, if this document was already processed
+    cache_key = None
+    if use_result_cache:
+        cache_key = get_result_cache_key(input_hash, model_name, model_version, write_types, prune_pipeline, disabled_components, response_format, request.parameters)
+        cached_response = result_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("Using cached result \"%s\"", cache_key)
+            return {
+                "model_name": model_name,
+                "response_format": response_format,
+                "cache_key": cache_key,
+                "cached_response": cached_response,
+            }
+
+    # Load model, this is cached
+    nlp, nlp_err = load_spacy_model(model_name, model_lang, settings.variant)
+    if nlp is None:
+        raise Exception(f"spaCy model \"{model_name}\" could not be loaded: {nlp_err}")
+
+    # Get meta data on spaCy and used model
+    spacy_meta = nlp.meta
+
+    # Stream the text in windows instead, these are created while processing
+    if response_format == RESPONSE_FORMAT_STREAM:
+        if not is_pretokenized:
+            window_size = int(request.parameters["stream_window_size"]) if "stream_window_size" in request.parameters else settings.stream_window_size
+            return {
+                "model_name": model_name,
+                "nlp": nlp,
+                "spacy_meta": spacy_meta,
+                "text": request.text,
+                "window_size": min(window_size, nlp.max_length),
+                "is_pretokenized": is_pretokenized,
+                "write_types": write_types,
+                "response_format": response_format,
+                "disabled_components": disabled_components,
+                "cache_key": None,
+                "cached_response": None,
+            }
+        logger.info("Streaming is not supported for pretokenized input, using the columnar response format instead")
+        response_format = RESPONSE_FORMAT_COLUMNAR
+
+    logger.info("Input is pretokenized: %s", "yes" if is_pretokenized else "no")
+    if not is_pretokenized:
+        # TODO add splitting for pretokenized texts?
+        #  or remove completely -> should better be solved by DUUI segmentation
+        logger.debug("spaCy max size: %d", nlp.max_length)
+        logger.debug("Text size: %d", text_len)
+        force_split_text = (request.parameters["force_split_text"].lower() != "false") if ("force_split_text" in request.parameters) else False
+        if force_split_text or nlp.max_length < text_len:
+            # Allow splitting of large texts?
+            split_large_texts = (request.parameters["split_large_texts"].lower() != "false") if ("split_large_texts" in request.parameters) else False
+            if split_large_texts:
+                # Try to split based on sentences first
+                model_lang = spacy_meta["lang"]
+                logger.info(f"Splitting text into sentences using \"{model_lang}\" sentencizer...")
+                try:
+                    # Load cached sentencizer model
+                    nlp_sents, nlp_sents_err = load_spacy_sentencizer_model(model_lang)
+                    if nlp_sents is None:
+                        raise Exception(f"spaCy sentencizer model \"{model_lang}\" could not be loaded: {nlp_sents_err}")
+
+                    # fix utf16 surrogates, all splits share the converter of the full text
+                    text = utf16_to_utf8(request.text)
+                    utf16_converter = Utf16OffsetConverter(text)
+
+                    doc_sents = process_spacy(nlp_sents, [text], len(text)+100 if nlp_sents.max_length < len(text) else None)[0]
+                    texts = []
+                    texts_meta = []
+                    for sent in doc_sents.sents:
+                        texts.append(sent.text)
+                        texts_meta.append({
+                            "begin": sent.start_char,
+                            "end": sent.end_char,
+                            "utf16_converter": utf16_converter,
+                        })
+
+                    # Process the splits in parallel
+                    n_process = int(request.parameters["split_n_process"]) if "split_n_process" in request.parameters else settings.split_n_process
+                    logger.info("Processing %d splits using %d processes", len(texts), n_process)
+                except Exception as ex:
+                    # Splitting sentences failed, fallback to full text
+                    # TODO try to split using "."
+                    texts = None
+                    texts_meta = None
+                    n_process = 1
+                    logger.exception("Failed to split sentences: %s", ex)
+            else:
+                logger.warning("Text is too large, but splitting is disabled, this might be slow to process...")
+
+    # Use full text, if not set
+    if texts is None:
+        # note that this will "fail" for pretokenized texts, as we only have access to the tokens,
+        # in this case the conversion is performed after spaCy processing
+
+        # fix utf16 surrogates
+        text = utf16_to_utf8(request.text)
+        logger.info("Text size after utf16 conversion: %d", len(text))
+        #logger.debug("Text after utf16 conversion: %s", text)
+
+        # init converter
+        utf16_converter = Utf16OffsetConverter(text)
+
+        # use full text
+        texts = [text]
+        texts_meta = [{
+            "begin": utf16_converter.external_to_python(0),
+            "end": utf16_converter.external_to_python(len(request.text)),
+            "utf16_converter": utf16_converter,
+            "token_begins": request.token_begins,
+        }]
+    logger.info(f"Found {len(texts)} texts to process.")
+
+    # Inputs for spaCy, either texts or pretokenized docs
+    inputs = []
+    max_length_new = None
+
+    # Abort if no texts found
+    if len(texts) == 0 and not is_pretokenized:
+        logger.warning("No texts found and not pretokenized, aborting...")
+    elif is_pretokenized:
+        # if pretokenized, convert tokens to utf8 before processing
+        logger.debug("Converting %d pretokenized input to UTF-8", len(request.tokens))
+        request_tokens = [utf16_to_utf8(token) for token in request.tokens]
+
+        if has_sentences:
+            logger.debug(" Using pretokenized text with sentences...")
+            inputs = [Doc(nlp.vocab, words=request_tokens, spaces=request.spaces, sent_starts=request.sent_starts)]
+        else:
+            logger.debug(" Using pretokenized text...")
+            inputs = [Doc(nlp.vocab, words=request_tokens, spaces=request.spaces)]
+    else:
+        logger.debug(" Using full text...")
+        inputs = texts
+
+        # Find max text length, if not pretokenized
+        for text in texts:
+            text_len = len(text)
+            if nlp.max_length < text_len:
+                if max_length_new is None:
+                    max_length_new = text_len + 100
+                else:
+                    max_length_new = max(max_length_new, text_len+100)
+
+    return {
+        "model_name": model_name,
+        "nlp": nlp,
+        "spacy_meta": spacy_meta,
+        "inputs": inputs,
+        "texts_meta": texts_meta,
+        "max_length": max_length_new,
+        "n_process": n_process,
+        "is_pretokenized": is_pretokenized,
+        "write_types": write_types,
+        "response_format": response_format,
+        "disabled_components": disabled_components,
+        "cache_key": cache_key,
+        "cached_response": None,
+    }
+
+
+# Get the pipeline components that are not needed to write the given types
+def get_disabled_components(nlp, write_types):
+    needed_attributes = set()
+    for write_type in write_types:
+        needed_attributes.update(WRITE_TYPE_ATTRIBUTES.get(write_type, set()))
+
+    pipe_names = nlp.pipe_names
+    pipe_metas = {name: nlp.get_pipe_meta(name) for name in pipe_names}
+    enabled = set()
+
+    # Sentences: prefer a dedicated component, e.g. senter or sentencizer, over the parser
+    if len(needed_attributes & SENTENCE_ATTRIBUTES) > 0:
+        candidates = [name for name in pipe_names if len(set(pipe_metas[name].assigns) & SENTENCE_ATTRIBUTES) > 0]
+        dedicated = [name for name in candidates if set(pipe_metas[name].assigns) <= SENTENCE_ATTRIBUTES]
+        enabled.update(dedicated[:1] if len(dedicated) > 0 else candidates)
+
+    # Components that do not declare what they assign are always kept, e.g. the attribute ruler
+    other_attributes = needed_attributes - SENTENCE_ATTRIBUTES
+    for name in pipe_names:
+        assigns = set(pipe_metas[name].assigns)
+        if len(assigns) == 0 or len(assigns & other_attributes) > 0:
+            enabled.add(name)
+
+    # Add components assigning the attributes required by enabled components
+    changed = True
+    while changed:
+        changed = False
+        for name in list(enabled):
+            for previous_name in pipe_names[:pipe_names.index(name)]:
+                if previous_name not in enabled and len(set(pipe_metas[name].requires) & set(pipe_metas[previous_name].assigns)) > 0:
+                    enabled.add(previous_name)
+                    changed = True
+
+    # Add shared embedding layers, e.g. tok2vec or transformer, if any enabled component listens to them
+    for name in pipe_names:
+        listening_components = getattr(nlp.get_pipe(name), "listening_components", None)
+        if listening_components and len(enabled & set(listening_components)) > 0:
+            enabled.add(name)
+
+    return [name for name in pipe_names if name not in enabled]
+
+
+# Process texts or pretokenized docs with spaCy
+def process_spacy(nlp, inputs, max_length=None, batch_size=None, n_process=1, disable=None):
+    # Increase max length, if needed
+    max_length_before = None
+    if max_length is not None:
+        logger.info("Increasing spaCy max length %d -> %d", nlp.max_length, max_length)
+        max_length_before = nlp.max_length
+        nlp.max_length = max_length
+
+    # Process text with spaCy
+    logger.debug("Start processing...")
+    try:
+        # Note: Components are disabled only for this call, the loaded model is shared between requests
+        docs = list(nlp.pipe(inputs, batch_size=batch_size, n_process=n_process, disable=disable if disable is not None else []))
+        logger.debug("Procesed %d inputs into %d documents.", len(inputs), len(docs))
+    finally:
+        # Reset max length, if changed
+        if max_length_before is not None:
+            logger.info("Resetting spaCy max length to %d", max_length_before)
+            nlp.max_length = max_length_before
+
+    return docs
+
+
+# Create the annotation and modification meta data of a response
+def create_annotation_meta(spacy_meta, modification_timestamp_seconds):
+    # Build a "annotation comment" annotation
+    # Can be used for each annotation
+    meta = AnnotationMeta(
+            name=settings.annotator_name,
+            version=settings.annotator_version,
+            modelName=spacy_meta["name"],
+            modelVersion=spacy_meta["version"],
+            spacyVersion=spacy.__version__,
+            modelLang=spacy_meta["lang"],
+            modelSpacyVersion=spacy_meta["spacy_version"],
+            modelSpacyGitVersion=spacy_meta["spacy_git_version"]
+        )
+
+    # Add modification info
+    modification_meta_comment = f"{settings.annotator_name} ({settings.annotator_version}), spaCy ({spacy.__version__}), {spacy_meta['lang']} {spacy_meta['name']} ({spacy_meta['version']})"
+    modification_meta = DocumentModification(
+        user=settings.annotator_name,
+        timestamp=modification_timestamp_seconds,
+        comment=modification_meta_comment
+     )
+
+    return meta, modification_meta
+
+
+# Build the response of a prepared request from the processed spaCy docs
+def build_response(prepared, docs, modification_timestamp_seconds):
     # Return data
     sentences = []
     tokens = []
     dependencies = []
     entities = []
+    columns = None
     meta = None
     modification_meta = None
-    is_pretokenized = False
 
-    # Save modification start time for later
-    modification_timestamp_seconds = int(time())
+    spacy_meta = prepared["spacy_meta"]
+    write_types = prepared["write_types"]
+    is_pretokenized = prepared["is_pretokenized"]
 
-    try:
-        # Get CAS from XMI string
-        logger.debug("Received:")
-        logger.debug(request)
-
-        # Params, set here to empty dict to allow easier access later
-        if request.parameters is None:
-            request.parameters = {}
-
-        # Get spaCy model if not in single model mode
-        if settings.single_model is None:
-            # Resolve model name
-            model_name, model_lang = get_spacy_model_name(request.lang, request.parameters)
-        else:
-            # In single mode we always use the single specified model!
-            model_name = settings.single_model
-            model_lang = settings.single_model_lang
-            logger.info("Using single model image: \"%s\"", model_name)
-        logger.info("Using spaCy model: \"%s\"", model_name)
-
-        # Load model, this is cached
-        nlp, nlp_err = load_spacy_model(model_name, model_lang, settings.variant)
-        if nlp is None:
-            raise Exception(f"spaCy model \"{model_name}\" could not be loaded: {nlp_err}")
-
-        # Get meta data on spaCy and used model
-        spacy_meta = nlp.meta
-
-        # Split large texts if needed and allowed
-        # TODO test splitting!
-        texts = None
-        texts_meta = None
-        text_len = len(request.text)
-
-        # only if not pretokenized
-        is_pretokenized = request.tokens is not None and len(request.tokens) > 0 \
-                          and request.spaces is not None and len(request.spaces) > 0 \
-                          and len(request.tokens) == len(request.spaces)
-
-        has_sentences = request.sent_starts is not None and len(request.sent_starts) > 0
-
-        logger.info("Input is pretokenized: %s", "yes" if is_pretokenized else "no")
-        if not is_pretokenized:
-            # TODO add splitting for pretokenized texts?
-            #  or remove completely -> should better be solved by DUUI segmentation
-            logger.debug("spaCy max size: %d", nlp.max_length)
-            logger.debug("Text size: %d", text_len)
-            force_split_text = (request.parameters["force_split_text"].lower() != "false") if ("force_split_text" in request.parameters) else False
-            if force_split_text or nlp.max_length < text_len:
-                # Allow splitting of large texts?
-                split_large_texts = (request.parameters["split_large_texts"].lower() != "false") if ("split_large_texts" in request.parameters) else False
-                if split_large_texts:
-                    # Try to split based on sentences first
-                    # NOTE this does not support utf16 conversion as this will be removed and handled by duui later!
-                    model_lang = spacy_meta["lang"]
-                    logger.info(f"Splitting text into sentences using \"{model_lang}\" sentencizer...")
-                    try:
-                        # Load cached sentencizer model
-                        nlp_sents, nlp_sents_err = load_spacy_sentencizer_model(model_lang)
-                        if nlp_sents is None:
-                            raise Exception(f"spaCy sentencizer model \"{model_lang}\" could not be loaded: {nlp_sents_err}")
-                        doc_sents = nlp_sents(request.text)
-                        texts = []
-                        texts_meta = []
-                        for sent in doc_sents.sents:
-                            # TODO add fix for utf16 for all splits
-                            texts.append(sent.text)
-                            texts_meta.append({
-                                "begin": sent.start_char,
-                                "end": sent.end_char,
-                            })
-                    except Exception as ex:
-                        # Splitting sentences failed, fallback to full text
-                        # TODO try to split using "."
-                        texts = None
-                        texts_meta = None
-                        logger.exception("Failed to split sentences: %s", ex)
-                else:
-                    logger.warning("Text is too large, but splitting is disabled, this might be slow to process...")
-
-        # Use full text, if not set
-        if texts is None:
-            # note that this will "fail" for pretokenized texts, as we only have access to the tokens,
-            # in this case the conversion is performed after spaCy processing
-
-            # fix utf16 surrogates
-            text = utf16_to_utf8(request.text)
-            logger.info("Text size after utf16 conversion: %d", len(text))
-            #logger.debug("Text after utf16 conversion: %s", text)
-
-            # init converter
-            utf16_converter = Utf16CodepointOffsetConverter()
-            utf16_converter.create_offset_mapping(text)
-
-            # use full text
-            texts = [text]
-            texts_meta = [{
-                "begin": utf16_converter.external_to_python(0),
-                "end": utf16_converter.external_to_python(len(request.text)),
-                "utf16_converter": utf16_converter,
-            }]
-        logger.info(f"Found {len(texts)} texts to process.")
-
-        # Abort if no texts found
-        if len(texts) == 0 and not is_pretokenized:
-            logger.warning("No texts found and not pretokenized, aborting...")
-        else:
-            # Find max text length, if not pretokenized
-            max_length_new = None
-            if not is_pretokenized:
-                for text in texts:
-                    text_len = len(text)
-                    if nlp.max_length < text_len:
-                        if max_length_new is None:
-                            max_length_new = text_len + 100
-                        else:
-                            max_length_new = max(max_length_new, text_len+100)
-
-            # Increase max length, if needed
-            max_length_before = None
-            if max_length_new is not None:
-                logger.info("Increasing spaCy max length %d -> %d", nlp.max_length, max_length_new)
-                max_length_before = nlp.max_length
-                nlp.max_length = max_length_new
-
-            # Process text with spaCy
-            logger.debug("Start processing...")
-
-            # if pretokenized, convert tokens to utf8 before processing
-            if is_pretokenized:
-                logger.debug("Converting %d pretokenized input to UTF-8", len(request.tokens))
-                request_tokens = [utf16_to_utf8(token) for token in request.tokens]
-            else:
-                request_tokens = None
-
-            if is_pretokenized and has_sentences:
-                logger.debug(" Using pretokenized text with sentences...")
-                tokdoc = Doc(nlp.vocab, words=request_tokens, spaces=request.spaces, sent_starts=request.sent_starts)
-                docs = list(nlp.pipe([tokdoc]))
-                logger.debug("Procesed pretokenized %d tokens into %d documents.", len(request.tokens), len(docs))
-            elif is_pretokenized:
-                logger.debug(" Using pretokenized text...")
-                tokdoc = Doc(nlp.vocab, words=request_tokens, spaces=request.spaces)
-                docs = list(nlp.pipe([tokdoc]))
-                logger.debug("Procesed pretokenized %d tokens into %d documents.", len(request.tokens), len(docs))
-            else:
-                logger.debug(" Using full text...")
-                docs = list(nlp.pipe(texts))
-                logger.debug("Procesed %d texts into %d documents.", len(texts), len(docs))
-
-            # Reset max length, if changed
-            if max_length_before is not None:
-                logger.info("Resetting spaCy max length to %d", max_length_before)
-                nlp.max_length = max_length_before
-
-            # Build a "annotation comment" annotation
-            # Can be used for each annotation
-            meta = AnnotationMeta(
-                    name=settings.annotator_name,
-                    version=settings.annotator_version,
-                    modelName=spacy_meta["name"],
-                    modelVersion=spacy_meta["version"],
-                    spacyVersion=spacy.__version__,
-                    modelLang=spacy_meta["lang"],
-                    modelSpacyVersion=spacy_meta["spacy_version"],
-                    modelSpacyGitVersion=spacy_meta["spacy_git_version"]
-                )
+    if len(docs) > 0:
+        meta, modification_meta = create_annotation_meta(spacy_meta, modification_timestamp_seconds)
 
-            # What types to write?
-            if request.parameters is not None and "write_types" in request.parameters and len(request.parameters["write_types"]) > 0:
-                write_types = set(request.parameters["write_types"])
-                logger.info("Only writing types: %s", ", ".join(write_types))
-            else:
-                write_types = set(TEXTIMAGER_ANNOTATOR_OUTPUT_TYPES)
-
-            # dont write tokens if pretokenized
-            if is_pretokenized:
-                write_types.discard(UIMA_TYPE_TOKEN)
-                if has_sentences:
-                    write_types.discard(UIMA_TYPE_SENTENCE)
-
-            # TODO test splitting in multiple texts
-            for doc_meta, doc in zip(texts_meta, docs):
-                # generate utf16 converter for each doc on the fly if using pretokenized data
-                if is_pretokenized:
-                    utf16_converter = Utf16CodepointOffsetConverter()
-                    utf16_converter.create_offset_mapping(doc.text)
-                    doc_meta["utf16_converter"] = utf16_converter
-
-                if "utf16_converter" in doc_meta:
-                    utf16_converter = doc_meta["utf16_converter"]
-                else:
-                    utf16_converter = None
-                    logger.warning("No utf16 converter found, this should not happen!")
+    # Collect columns instead of objects
+    if prepared["response_format"] == RESPONSE_FORMAT_COLUMNAR:
+        columns = ColumnarAnnotations(write_types)
 
-                def utf16_to_ext(idx):
-                    return utf16_converter.python_to_external(idx) if utf16_converter is not None else idx
+    # TODO test splitting in multiple texts
+    for doc_meta, doc in zip(prepared["texts_meta"], docs):
+        # generate utf16 converter for each doc on the fly if using pretokenized data
+        if is_pretokenized:
+            if doc_meta.get("token_begins") is not None:
+                doc_meta["utf16_converter"] = PretokenizedOffsetConverter(doc, doc_meta["token_begins"])
+            else:
+                doc_meta["utf16_converter"] = Utf16OffsetConverter(doc.text)
 
-                # Get starting position of this sentence
-                doc_begin = doc_meta["begin"]
+        if "utf16_converter" in doc_meta:
+            utf16_converter = doc_meta["utf16_converter"]
+        else:
+            # without text, offsets are not converted
+            utf16_converter = Utf16OffsetConverter("")
+            logger.warning("No utf16 converter found, this should not happen!")
 
-                # Sentences
-                logger.debug("Writing Sentences...")
-                try:
-                    # Can fail, e.g. with multilang model
-                    # or if no sentencizer is requested
-                    # TODO add_pipe("sentencizer") seems to work, check later!
-                    for sent in doc.sents:
-                        sentences.append(Sentence(
-                            begin=utf16_to_ext(doc_begin+sent.start_char),
-                            end=utf16_to_ext(doc_begin+sent.end_char),
-                            write_sentence=UIMA_TYPE_SENTENCE in write_types,
-                        ))
-                except Exception as ex:
-                    logger.exception("Error accessing sentences: %s", ex)
-
-                # Token, Lemma, POS, Morphology
-                cas_tokens = {}
-                token_ind = 0
-                logger.debug("Writing Tokens...")
-                for token in doc:
-                    if not token.is_space:
-                        # Create begin/end
-                        token_begin = token.idx
-                        token_end = token_begin + len(token)
-
-                        # Extract specific morph features
-                        morph_details = {}
-                        for feat in token.morph:
-                            fields = feat.split("=")
-                            if len(fields) != 2:
-                                continue
-                            feat_key = fields[0].strip()
-                            feat_value = fields[1].strip()
-
-                            # TODO check in nlp.meta for missing
-                            if feat_key == "Gender":
-                                morph_details["gender"] = feat_value
-                            elif feat_key == "Number":
-                                morph_details["number"] = feat_value
-                            elif feat_key == "Case":
-                                morph_details["case"] = feat_value
-                            elif feat_key == "Degree":
-                                morph_details["degree"] = feat_value
-                            elif feat_key == "VerbForm":
-                                morph_details["verbForm"] = feat_value
-                            elif feat_key == "Tense":
-                                morph_details["tense"] = feat_value
-                            elif feat_key == "Mood":
-                                morph_details["mood"] = feat_value
-                            elif feat_key == "Voice":  # ?
-                                morph_details["voice"] = feat_value
-                            elif feat_key == "Definite":
-                                morph_details["definiteness"] = feat_value
-                            elif feat_key == "Person":
-                                morph_details["person"] = feat_value
-                            elif feat_key == "Aspect":  # ?
-                                morph_details["aspect"] = feat_value
-                            elif feat_key == "Animacy":  # ?
-                                morph_details["animacy"] = feat_value
-                            elif feat_key == "Negative":  # ?
-                                morph_details["negative"] = feat_value
-                            elif feat_key == "NumType":  # ?
-                                morph_details["numType"] = feat_value
-                            elif feat_key == "Possessive":  # ?
-                                morph_details["possessive"] = feat_value
-                            elif feat_key == "PronType":
-                                morph_details["pronType"] = feat_value
-                            elif feat_key == "Reflex":
-                                morph_details["reflex"] = feat_value
-                            elif feat_key == "Transitivity":  # ?
-                                morph_details["transitivity"] = feat_value
-
-                        # Create token data
-                        current_token = Token(
-                            begin=utf16_to_ext(doc_begin+token_begin),
-                            end=utf16_to_ext(doc_begin+token_end),
-
-                            # Token
-                            ind=token_ind,
-                            write_token=UIMA_TYPE_TOKEN in write_types,
-
-                            # Lemma
-                            lemma=token.lemma_,
-                            write_lemma=UIMA_TYPE_LEMMA in write_types,
-
-                            # POS
-                            # TODO pos mapping?
-                            pos=token.tag_,
-                            pos_coarse=token.pos_,
-                            write_pos=UIMA_TYPE_POS in write_types,
-
-                            # Morph
-                            morph="|".join(token.morph),
-                            morph_details=morph_details,
-                            write_morph=UIMA_TYPE_MORPH in write_types,
-
-                            # URL
-                            like_url=token.like_url,
-                            url_parts=parse_url(token.text) if token.like_url else None
-                        )
-                        tokens.append(current_token)
-                        token_ind += 1
-
-                        # Save token info for deps later
-                        if token_begin not in cas_tokens:
-                            cas_tokens[token_begin] = {}
-                        cas_tokens[token_begin][token_end] = current_token
-
-                # Dependency
-                # Note: This is only supported if tokens are written!
-                logger.debug("Writing Dependencies...")
-                for token in doc:
-                    if not token.is_space:
-                        if not token.head.is_space:
-                            # Get CAS token
-                            token_begin = token.idx
-                            token_end = token_begin + len(token)
-                            if token_begin in cas_tokens and token_end in cas_tokens[token_begin]:
-                                uima_token = cas_tokens[token_begin][token_end]
-                            else:
-                                continue
-
-                            # Get head token
-                            begin_head = token.head.idx
-                            end_head = begin_head + len(token.head)
-                            if begin_head in cas_tokens and end_head in cas_tokens[begin_head]:
-                                uima_head = cas_tokens[begin_head][end_head]
-                            else:
-                                continue
-
-                            # Create dependency
-                            current_dep = Dependency(
-                                begin=utf16_to_ext(doc_begin+token_begin),
-                                end=utf16_to_ext(doc_begin+token_end),
-                                type=token.dep_.upper(),
-                                flavor="basic",
-                                dependent_ind=uima_token.ind,
-                                governor_ind=uima_head.ind,
-                                write_dep=UIMA_TYPE_DEPENDENCY in write_types
-                            )
-                            dependencies.append(current_dep)
-
-                            # Add reference to token
-                            uima_token.parent_ind = uima_head.ind
-                            uima_token.write_dep = UIMA_TYPE_DEPENDENCY in write_types
-
-                # Named entities
-                logger.debug("Writing Named entities...")
-                try:
-                    for ent in doc.ents:
-                        entities.append(Entity(
-                            begin=utf16_to_ext(doc_begin+ent.start_char),
-                            end=utf16_to_ext(doc_begin+ent.end_char),
-                            value=ent.label_,
-                            write_entity=UIMA_TYPE_NAMED_ENTITY in write_types
-                        ))
-                except Exception as ex:
-                    logger.exception("Error accessing named entities: %s", ex)
+        # Get starting position of this sentence
+        doc_begin = doc_meta["begin"]
 
-                # Add modification info
-                modification_meta_comment = f"{settings.annotator_name} ({settings.annotator_version}), spaCy ({spacy.__version__}), {spacy_meta['lang']} {spacy_meta['name']} ({spacy_meta['version']})"
-                modification_meta = DocumentModification(
-                    user=settings.annotator_name,
-                    timestamp=modification_timestamp_seconds,
-                    comment=modification_meta_comment
-                 )
+        if columns is not None:
+            columns.add_doc(doc, doc_begin, utf16_converter)
+        else:
+            add_doc_objects(doc, doc_begin, utf16_converter.python_to_external, write_types, sentences, tokens, dependencies, entities)
 
-    except Exception as ex:
-        logger.exception(ex)
+    if columns is not None:
+        return columns.to_response(meta, modification_meta, is_pretokenized)
 
-    # Return data as JSON
     return TextImagerResponse(
         sentences=sentences,
         tokens=tokens,
@@ -977,3 +1785,183 @@ def post_process(request: TextImagerRequest) -> TextImagerResponse:
         modification_meta=modification_meta,
         is_pretokenized=is_pretokenized
     )
+
+
+# Find the end of a window of the text, preferably on the last sentence boundary
+def find_window_end(text, begin, end, nlp_sents):
+    if nlp_sents is not None:
+        window = text[begin:end]
+        doc_sents = process_spacy(nlp_sents, [window], len(window)+100 if nlp_sents.max_length < len(window) else None)[0]
+        sents = list(doc_sents.sents)
+        if len(sents) > 1:
+            return begin + sents[-1].start_char
+
+    # Else, split on the last whitespace
+    space = max(text.rfind(" ", begin, end), text.rfind("\n", begin, end))
+    if space > begin:
+        return space + 1
+    return end
+
+
+# Split the text into windows of at most window_size characters
+# The windows are created one by one, so that only the current window needs to be held in memory,
+# each window gets a converter for its own UTF-16 offsets in the full text.
+def iter_text_windows(text, window_size, nlp_sents):
+    begin = 0
+    external_begin = 0
+    text_len = len(text)
+    while begin < text_len:
+        end = min(begin + window_size, text_len)
+        if end < text_len:
+            end = find_window_end(text, begin, end, nlp_sents)
+
+        # fix utf16 surrogates
+        window = utf16_to_utf8(text[begin:end])
+        utf16_converter = Utf16OffsetConverter(window, external_begin)
+        yield window, utf16_converter
+
+        external_begin = utf16_converter.python_to_external(len(window))
+        begin = end
+
+
+# Stream the response as newline delimited JSON
+# The first line contains the meta data, followed by one columnar response per processed window.
+def stream_response(prepared, modification_timestamp_seconds):
+    nlp = prepared["nlp"]
+    spacy_meta = prepared["spacy_meta"]
+    write_types = prepared["write_types"]
+
+    meta, modification_meta = create_annotation_meta(spacy_meta, modification_timestamp_seconds)
+    yield TextImagerStreamHeader(
+        meta=meta,
+        modification_meta=modification_meta,
+        is_pretokenized=prepared["is_pretokenized"]
+    ).model_dump_json() + "\n"
+
+    # Windows are split on sentences, if a sentencizer is available
+    nlp_sents, nlp_sents_err = load_spacy_sentencizer_model(spacy_meta["lang"])
+    if nlp_sents is None:
+        logger.warning("spaCy sentencizer model \"%s\" could not be loaded, splitting windows on whitespace: %s", spacy_meta["lang"], nlp_sents_err)
+
+    windows_count = 0
+    try:
+        windows = iter_text_windows(prepared["text"], prepared["window_size"], nlp_sents)
+        # Process one window at a time, each is sent before the next one is processed
+        for doc, utf16_converter in nlp.pipe(windows, as_tuples=True, batch_size=1, disable=prepared["disabled_components"]):
+            columns = ColumnarAnnotations(write_types)
+            columns.add_doc(doc, 0, utf16_converter)
+            yield columns.to_response(None, None, False).model_dump_json() + "\n"
+            windows_count += 1
+    except Exception as ex:
+        # The response is already started, so the error is sent as last line instead
+        logger.exception(ex)
+        yield TextImagerStreamError(error=str(ex)).model_dump_json() + "\n"
+        return
+    logger.info("Streamed %d windows", windows_count)
+    yield TextImagerStreamEnd(windows=windows_count).model_dump_json() + "\n"
+
+
+# Process request from DUUI
+@app.post("/v1/process")
+def post_process(request: TextImagerRequest) -> TextImagerResponse:
+    # Save modification start time for later
+    modification_timestamp_seconds = int(time())
+
+    response_json = None
+    try:
+        prepared = prepare_request(request, allow_streaming=True)
+        if prepared["response_format"] == RESPONSE_FORMAT_STREAM:
+            return StreamingResponse(
+                stream_response(prepared, modification_timestamp_seconds),
+                media_type="application/x-ndjson"
+            )
+        if prepared["cached_response"] is not None:
+            response = load_cached_response(prepared, modification_timestamp_seconds)
+        else:
+            docs = process_spacy(prepared["nlp"], prepared["inputs"], prepared["max_length"], n_process=prepared["n_process"], disable=prepared["disabled_components"])
+            response = build_response(prepared, docs, modification_timestamp_seconds)
+            if prepared["cache_key"] is not None:
+                response_json = response.model_dump_json()
+                result_cache.put(prepared["cache_key"], response_json)
+    except Exception as ex:
+        logger.exception(ex)
+        response = create_empty_response()
+        response_json = None
+
+    # Return columns as JSON, directly serialized to skip the response validation
+    if isinstance(response, TextImagerColumnarResponse):
+        return Response(
+            content=response_json if response_json is not None else response.model_dump_json(),
+            media_type="application/json"
+        )
+
+    # Return data as JSON
+    return response
+
+
+# Process multiple requests at once
+# Requests using the same model are processed together in one spaCy pipe, optionally using multiple processes
+@app.post("/v1/process_batch")
+def post_process_batch(request: TextImagerBatchRequest) -> TextImagerBatchResponse:
+    # Save modification start time for later
+    modification_timestamp_seconds = int(time())
+
+    batch_size = request.batch_size if request.batch_size is not None else settings.batch_size
+    n_process = request.n_process if request.n_process is not None else settings.batch_n_process
+    logger.info("Processing batch of %d requests, batch size: %s, processes: %d", len(request.requests), batch_size, n_process)
+
+    # Prepare all requests and group them by model and enabled components, keeping their position in the batch
+    responses = [None] * len(request.requests)
+    prepared_by_model = {}
+    for ind, single_request in enumerate(request.requests):
+        try:
+            prepared = prepare_request(single_request)
+            if prepared["cached_response"] is not None:
+                responses[ind] = load_cached_response(prepared, modification_timestamp_seconds)
+                continue
+            model_key = (prepared["model_name"], tuple(prepared["disabled_components"]))
+            if model_key not in prepared_by_model:
+                prepared_by_model[model_key] = []
+            prepared_by_model[model_key].append((ind, prepared))
+        except Exception as ex:
+            logger.exception(ex)
+            responses[ind] = create_empty_response()
+
+    for (model_name, disabled_components), model_requests in prepared_by_model.items():
+        logger.info("Processing %d requests using spaCy model \"%s\"...", len(model_requests), model_name)
+
+        # All requests of this model share the loaded pipeline
+        nlp = model_requests[0][1]["nlp"]
+        inputs = []
+        max_length = None
+        for _, prepared in model_requests:
+            inputs.extend(prepared["inputs"])
+            if prepared["max_length"] is not None:
+                max_length = prepared["max_length"] if max_length is None else max(max_length, prepared["max_length"])
+
+        try:
+            docs = process_spacy(nlp, inputs, max_length, batch_size, n_process, list(disabled_components))
+        except Exception as ex:
+            logger.exception(ex)
+            for ind, _ in model_requests:
+                responses[ind] = create_empty_response()
+            continue
+
+        # Assign the docs back to their requests, in the same order they were added
+        docs_offset = 0
+        for ind, prepared in model_requests:
+            request_docs = docs[docs_offset:docs_offset+len(prepared["inputs"])]
+            docs_offset += len(prepared["inputs"])
+            try:
+                responses[ind] = build_response(prepared, request_docs, modification_timestamp_seconds)
+                if prepared["cache_key"] is not None:
+                    result_cache.put(prepared["cache_key"], responses[ind].model_dump_json())
+            except Exception as ex:
+                logger.exception(ex)
+                responses[ind] = create_empty_response()
+
+    # Serialize each response directly, as they can be of different formats
+    return Response(
+        content="{\"responses\":[" + ",".join(response.model_dump_json() for response in responses) + "]}",
+        media_type="application/json"
+    )
@@ -2,4 +2,11 @@ TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_ANNOTATOR_NAME="textimager-duui-transform
 TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_ANNOTATOR_VERSION="unset" \
 TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_LOG_LEVEL="DEBUG" \
 TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_MODEL_CACHE_SIZE="1" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_BATCH_MAX_WAIT="0.01" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_SORT_BY_LENGTH="true" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_RESULT_CACHE_SIZE="10000" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_BACKENDS="" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_CHUNKING="false" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_CHUNK_OVERLAP="64" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_CHUNK_POOLING="length" \
 uvicorn src.main.python.textimager_duui_transformers_sentiment:app --host 0.0.0.0 --port 9714 --workers 1
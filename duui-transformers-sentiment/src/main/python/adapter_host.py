@@ -0,0 +1,44 @@
+import logging
+
+import torch
+from transformers import AutoTokenizer
+
+logger = logging.getLogger(__name__)
+
+
+# Base model shared by all adapters trained on it
+# Adapters are loaded on first use and stay attached, switching between them only changes the active adapter.
+class AdapterHost:
+    def __init__(self, model_name, model_version, device):
+        # only available with the adapter variant
+        from transformers import AutoAdapterModel
+
+        logger.info("Loading adapter base model \"%s\"", model_name)
+        self.device = torch.device(f"cuda:{device}" if device >= 0 else "cpu")
+        self.model = AutoAdapterModel.from_pretrained(model_name, revision=model_version, local_files_only=True)
+        self.model.to(self.device)
+        self.model.eval()
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name, local_files_only=True)
+
+        # adapter path -> adapter name of all loaded adapters
+        self.adapters = {}
+        self.active_adapter = None
+
+    # Activate the adapter and its prediction head, loading it if needed
+    def activate(self, adapter_path):
+        adapter_name = self.adapters.get(adapter_path)
+        if adapter_name is None:
+            logger.info("Loading adapter \"%s\"", adapter_path)
+            # checkpoints of the same experiment share the adapter name, load each under its own
+            adapter_name = self.model.load_adapter(adapter_path, load_as=f"adapter_{len(self.adapters)}")
+            self.adapters[adapter_path] = adapter_name
+
+            # new adapter layers and heads are created on cpu and in training mode
+            self.model.to(self.device)
+            self.model.eval()
+
+        if adapter_name != self.active_adapter:
+            self.model.set_active_adapters(adapter_name)
+            self.active_adapter = adapter_name
+
+        return self
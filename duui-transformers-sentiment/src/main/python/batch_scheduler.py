@@ -0,0 +1,130 @@
+import logging
+from collections import deque
+from threading import Condition, Event, Thread
+from time import monotonic
+
+logger = logging.getLogger(__name__)
+
+
+# Texts of one selection waiting for inference
+class BatchJob:
+    def __init__(self, key, run, texts, batch_size):
+        self.key = key
+        self.run = run
+        self.texts = texts
+        self.batch_size = batch_size
+        self.created = monotonic()
+
+        self.results = None
+        self.error = None
+        self.done = Event()
+
+
+# Collects the texts of all in-flight requests into shared batches
+# Jobs with the same key (model and pipeline arguments) are merged until the batch size is reached
+# or the oldest job waited for max_wait seconds, then run at once and the results are scattered back.
+# A single worker thread runs all batches, so only one model is used at a time.
+# If given, "on_batch(key, texts_count, queue_waits)" is called after each batch with the seconds each job waited.
+class BatchScheduler:
+    def __init__(self, max_wait=0.0, on_batch=None):
+        self.max_wait = max_wait
+        self.on_batch = on_batch
+
+        self.jobs = deque()
+        self.condition = Condition()
+        self.worker = None
+
+        self.batches = 0
+        self.batched_jobs = 0
+        self.batched_texts = 0
+
+    # Run "run(texts, batch_size)" for these texts, possibly together with texts of other requests, blocks until done
+    def submit(self, key, run, texts, batch_size):
+        if len(texts) == 0:
+            return []
+
+        job = BatchJob(key, run, texts, batch_size)
+        with self.condition:
+            if self.worker is None:
+                self.worker = Thread(target=self.run_worker, name="batch-scheduler", daemon=True)
+                self.worker.start()
+            self.jobs.append(job)
+            self.condition.notify_all()
+
+        job.done.wait()
+        if job.error is not None:
+            raise job.error
+        return job.results
+
+    def run_worker(self):
+        while True:
+            batch = self.next_batch()
+            self.run_batch(batch)
+
+    # Wait for the next batch, which is formed from the oldest job and all later jobs with the same key
+    def next_batch(self):
+        with self.condition:
+            while len(self.jobs) == 0:
+                self.condition.wait()
+
+            first = self.jobs[0]
+            deadline = first.created + self.max_wait
+            while True:
+                batch = [job for job in self.jobs if job.key == first.key]
+                texts_count = sum(len(job.texts) for job in batch)
+                timeout = deadline - monotonic()
+                if texts_count >= first.batch_size or timeout <= 0:
+                    break
+                self.condition.wait(timeout)
+
+            for job in batch:
+                self.jobs.remove(job)
+
+            return batch
+
+    def run_batch(self, batch):
+        texts = [text for job in batch for text in job.texts]
+        queue_waits = [monotonic() - job.created for job in batch]
+        logger.debug("Running batch of %d texts from %d requests", len(texts), len(batch))
+
+        try:
+            results = batch[0].run(texts, batch[0].batch_size)
+
+            start = 0
+            for job in batch:
+                job.results = results[start:start+len(job.texts)]
+                start += len(job.texts)
+        except Exception as ex:
+            if len(batch) == 1:
+                batch[0].error = ex
+            else:
+                # Run each job on its own, so only the request that caused the error fails
+                logger.warning("Batch of %d requests failed, running them separately: %s", len(batch), ex)
+                for job in batch:
+                    try:
+                        job.results = job.run(job.texts, job.batch_size)
+                    except Exception as job_ex:
+                        job.error = job_ex
+
+        with self.condition:
+            self.batches += 1
+            self.batched_jobs += len(batch)
+            self.batched_texts += len(texts)
+
+        if self.on_batch is not None:
+            try:
+                self.on_batch(batch[0].key, len(texts), queue_waits)
+            except Exception:
+                logger.exception("Batch callback failed")
+
+        for job in batch:
+            job.done.set()
+
+    def stats(self):
+        with self.condition:
+            return {
+                "queued_jobs": len(self.jobs),
+                "batches": self.batches,
+                "batched_jobs": self.batched_jobs,
+                "batched_texts": self.batched_texts,
+            }
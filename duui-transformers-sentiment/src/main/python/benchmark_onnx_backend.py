@@ -0,0 +1,120 @@
+# Benchmark of the ONNX Runtime backends against PyTorch for one registered sentiment model
+# Compares inference latency and the agreement of labels and scores on the same synthetic texts.
+# Run from the duui-transformers-sentiment directory, the model needs to be available:
+#   python -m src.main.python.benchmark_onnx_backend --model cardiffnlp/twitter-roberta-base-sentiment --sentences 1000
+import argparse
+import json
+import os
+import random
+from time import perf_counter
+
+# The service is configured using env vars, provide defaults for a local run
+os.environ.setdefault("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_ANNOTATOR_NAME", "textimager-duui-transformers-sentiment-benchmark")
+os.environ.setdefault("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_ANNOTATOR_VERSION", "unset")
+os.environ.setdefault("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_LOG_LEVEL", "WARNING")
+os.environ.setdefault("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_MODEL_CACHE_SIZE", "3")
+
+from . import textimager_duui_transformers_sentiment as service
+from .onnx_backend import BACKENDS, BACKEND_PYTORCH
+
+SAMPLE_SENTENCES = [
+    "I love this movie, it is great!",
+    "This was the worst service I have ever experienced.",
+    "The package arrived on Tuesday.",
+    "Not bad at all, but the ending could have been better.",
+    "@user thanks for the quick reply http://example.org",
+    "Die Bundesregierung hat einen neuen Gesetzentwurf vorgestellt.",
+    "Das Essen war leider kalt und viel zu teuer.",
+    "C'est vraiment une excellente nouvelle pour tout le monde.",
+]
+
+
+def build_texts(count, seed):
+    rnd = random.Random(seed)
+    return [
+        " ".join(rnd.choice(SAMPLE_SENTENCES) for _ in range(rnd.randint(1, 3)))
+        for _ in range(count)
+    ]
+
+
+def run_benchmark(model_name, model_data, backend, texts, batch_size, repeat):
+    # first run includes loading and, for ONNX, the export if not cached yet
+    start = perf_counter()
+    results = service.run_sentiment_analysis(model_name, model_data, texts, batch_size, False, backend)
+    first_seconds = perf_counter() - start
+
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        results = service.run_sentiment_analysis(model_name, model_data, texts, batch_size, False, backend)
+        timings.append(perf_counter() - start)
+
+    scores = [
+        dict(zip(labels, label_scores.tolist()))
+        for (labels, label_scores), _, _, _ in results
+    ]
+
+    return {
+        "backend": backend,
+        "first_run_seconds": first_seconds,
+        "best_seconds": min(timings),
+        "mean_seconds": sum(timings) / len(timings),
+        "sentences_per_second": len(texts) / min(timings),
+    }, scores
+
+
+def compare_scores(reference, scores):
+    label_agreement = 0
+    max_difference = 0.0
+    differences = 0.0
+    for reference_scores, other_scores in zip(reference, scores):
+        if max(reference_scores, key=reference_scores.get) == max(other_scores, key=other_scores.get):
+            label_agreement += 1
+        for label in reference_scores:
+            difference = abs(reference_scores[label] - other_scores[label])
+            max_difference = max(max_difference, difference)
+            differences += difference
+
+    return {
+        "label_agreement": label_agreement / len(reference),
+        "max_score_difference": max_difference,
+        "mean_score_difference": differences / (len(reference) * len(reference[0])),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ONNX Runtime backends of the sentiment annotator")
+    parser.add_argument("--model", required=True, help="Registered model name")
+    parser.add_argument("--sentences", type=int, default=1000, help="Number of synthetic texts")
+    parser.add_argument("--batch-size", type=int, default=32, help="Inference batch size")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs per backend")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the synthetic texts")
+    args = parser.parse_args()
+
+    model_data = service.get_model_data(args.model)
+    texts = [
+        model_data["preprocess"](text)
+        for text in build_texts(args.sentences, args.seed)
+    ]
+
+    results = []
+    reference = None
+    for backend in BACKENDS:
+        result, scores = run_benchmark(args.model, model_data, backend, texts, args.batch_size, args.repeat)
+        if backend == BACKEND_PYTORCH:
+            reference = scores
+        else:
+            result.update(compare_scores(reference, scores))
+            result["speedup"] = results[0]["best_seconds"] / result["best_seconds"]
+        results.append(result)
+
+    print(json.dumps({
+        "model": args.model,
+        "sentences": len(texts),
+        "batch_size": args.batch_size,
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+# Benchmark of the sentiment service on synthetic documents, runs offline using a tiny randomly initialized model
+# Each scenario is run in-process (calling the endpoint function) and through the FastAPI test client,
+# reports sentences per second, p50/p95 request latency and peak RSS as JSON.
+# Run from the duui-transformers-sentiment directory:
+#   python -m src.main.python.benchmark_service --requests 20 --batch-sizes 8,32 --output benchmark.json
+# Use "--model" to benchmark a registered model instead of the fixture, it needs to be available.
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import types
+from time import perf_counter
+
+# The service is configured using env vars, provide defaults for a local run
+os.environ.setdefault("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_ANNOTATOR_NAME", "textimager-duui-transformers-sentiment-benchmark")
+os.environ.setdefault("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_ANNOTATOR_VERSION", "unset")
+os.environ.setdefault("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_LOG_LEVEL", "WARNING")
+os.environ.setdefault("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_MODEL_CACHE_SIZE", "3")
+# repeated requests would only measure the result cache
+os.environ.setdefault("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_RESULT_CACHE_SIZE", "0")
+
+import numpy
+import torch
+from fastapi.testclient import TestClient
+from transformers import BertConfig, BertForSequenceClassification, BertTokenizerFast
+
+from . import textimager_duui_transformers_sentiment as service
+from .duui.reqres import TextImagerRequest
+
+FIXTURE_MODEL_NAME = "benchmark/tiny-sentiment"
+FIXTURE_MODULE = "benchmark_tiny_sentiment"
+FIXTURE_LABELS = ["Negative", "Neutral", "Positive"]
+
+WORDS = [
+    "the", "a", "this", "that", "it", "is", "was", "not", "very", "really", "and", "but",
+    "i", "we", "they", "love", "hate", "like", "good", "bad", "great", "terrible", "okay", "fine",
+    "awful", "nice", "movie", "service", "food", "price", "day", "team", "game", "news",
+]
+
+# name -> sentences per document, words per sentence and selections
+SCENARIOS = {
+    "short": {"sentences": (100, 300), "words": (3, 15), "selections": ["sentence"]},
+    "long": {"sentences": (2, 6), "words": (150, 400), "selections": ["sentence"]},
+    "mixed": {"sentences": (20, 80), "words": (3, 60), "selections": ["sentence", "paragraph", "text"]},
+}
+MODES = ["inprocess", "http"]
+
+
+# Save a tiny BERT classifier with a vocabulary of the synthetic words, only meant for measuring the service overhead
+def create_fixture_model(path):
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + WORDS
+    vocab_filename = os.path.join(path, "vocab.txt")
+    with open(vocab_filename, "w", encoding="utf-8") as f:
+        f.write("\n".join(vocab))
+    tokenizer = BertTokenizerFast(vocab_filename)
+
+    torch.manual_seed(0)
+    config = BertConfig(
+        vocab_size=len(vocab),
+        hidden_size=32,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=64,
+        max_position_embeddings=128,
+        num_labels=len(FIXTURE_LABELS),
+        id2label=dict(enumerate(FIXTURE_LABELS)),
+        label2id={label: i for i, label in enumerate(FIXTURE_LABELS)},
+    )
+    BertForSequenceClassification(config).save_pretrained(path)
+    tokenizer.save_pretrained(path)
+
+
+# Register the fixture like a model definition module, so it is loaded by the service as any other model
+def register_fixture_model(path):
+    module = types.ModuleType(FIXTURE_MODULE)
+    module.SUPPORTED_MODEL = {
+        FIXTURE_MODEL_NAME: {
+            "version": "fixture",
+            "type": "local",
+            "path": path,
+            "max_length": 128,
+            "mapping": {
+                "Positive": 1,
+                "Neutral": 0,
+                "Negative": -1
+            },
+            "3sentiment": {
+                "pos": ["Positive"],
+                "neu": ["Neutral"],
+                "neg": ["Negative"]
+            },
+            "preprocess": lambda text: text,
+            "languages": ["en"]
+        },
+    }
+    sys.modules[f"{service.__package__}.models.{FIXTURE_MODULE}"] = module
+    service.MODEL_REGISTRY[FIXTURE_MODEL_NAME] = {"module": FIXTURE_MODULE, "enabled": True}
+
+
+def build_payload(scenario, rnd, model_name, lang, batch_size):
+    sentences_count = rnd.randint(*scenario["sentences"])
+    sentences = []
+    begin = 0
+    for _ in range(sentences_count):
+        text = " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(*scenario["words"]))) + "."
+        sentences.append({"text": text, "begin": begin, "end": begin + len(text)})
+        begin += len(text) + 1
+    doc_len = max(begin - 1, 0)
+
+    selections = []
+    for selection in scenario["selections"]:
+        if selection == "text":
+            selection_sentences = [{"text": " ".join(s["text"] for s in sentences), "begin": 0, "end": doc_len}]
+        elif selection == "paragraph":
+            # paragraphs of up to 10 sentences
+            selection_sentences = [
+                {"text": " ".join(s["text"] for s in paragraph), "begin": paragraph[0]["begin"], "end": paragraph[-1]["end"]}
+                for paragraph in (sentences[i:i+10] for i in range(0, len(sentences), 10))
+            ]
+        else:
+            selection_sentences = sentences
+        selections.append({"selection": selection, "sentences": selection_sentences})
+
+    return {
+        "selections": selections,
+        "lang": lang,
+        "doc_len": doc_len,
+        "model_name": model_name,
+        "batch_size": batch_size,
+        "ignore_max_length_truncation_padding": False,
+    }
+
+
+def peak_rss_mb():
+    # kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_scenario(client, mode, payloads):
+    latencies = []
+    sentences_count = 0
+    for payload in payloads:
+        start = perf_counter()
+        if mode == "http":
+            response = client.post("/v1/process", json=payload)
+            response.raise_for_status()
+            selections = response.json()["selections"]
+        else:
+            response = service.post_process(TextImagerRequest(**payload))
+            selections = response.selections
+        latencies.append(perf_counter() - start)
+
+        if len(selections) != len(payload["selections"]):
+            raise Exception("Request failed, see the service log")
+        sentences_count += sum(len(selection["sentences"]) for selection in payload["selections"])
+
+    return {
+        "requests": len(payloads),
+        "sentences": sentences_count,
+        "seconds": sum(latencies),
+        "sentences_per_second": sentences_count / sum(latencies),
+        "latency_p50_ms": float(numpy.percentile(latencies, 50)) * 1000,
+        "latency_p95_ms": float(numpy.percentile(latencies, 95)) * 1000,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the sentiment annotator on synthetic documents")
+    parser.add_argument("--model", default=None, help="Registered model name, uses a tiny local fixture model if not set")
+    parser.add_argument("--lang", default="en", help="Document language")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma separated scenarios: " + ", ".join(SCENARIOS))
+    parser.add_argument("--modes", default=",".join(MODES), help="Comma separated modes: " + ", ".join(MODES))
+    parser.add_argument("--batch-sizes", default="32", help="Comma separated inference batch sizes")
+    parser.add_argument("--requests", type=int, default=10, help="Number of timed requests per run")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the synthetic documents")
+    parser.add_argument("--output", default=None, help="Write the JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as fixture_path:
+        model_name = args.model
+        if model_name is None:
+            create_fixture_model(fixture_path)
+            register_fixture_model(fixture_path)
+            model_name = FIXTURE_MODEL_NAME
+
+        client = TestClient(service.app)
+        results = []
+        for scenario_name in args.scenarios.split(","):
+            for batch_size in [int(b) for b in args.batch_sizes.split(",")]:
+                # same documents for all modes
+                rnd = random.Random(args.seed)
+                payloads = [
+                    build_payload(SCENARIOS[scenario_name], rnd, model_name, args.lang, batch_size)
+                    for _ in range(args.requests)
+                ]
+                for mode in args.modes.split(","):
+                    # warmup, includes loading the model
+                    run_scenario(client, mode, payloads[:1])
+
+                    result = {
+                        "scenario": scenario_name,
+                        "mode": mode,
+                        "batch_size": batch_size,
+                    }
+                    result.update(run_scenario(client, mode, payloads))
+                    results.append(result)
+
+    output = json.dumps({
+        "model": model_name,
+        "torch_threads": torch.get_num_threads(),
+        "peak_rss_mb": peak_rss_mb(),
+        "results": results,
+    }, indent=2)
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,31 @@ class Settings(BaseSettings):
     # Model LRU cache size
     textimager_duui_transformers_sentiment_model_cache_size: int
 
+    # Max time in seconds to wait for texts of other requests to fill a batch, 0 only merges already queued texts
+    textimager_duui_transformers_sentiment_batch_max_wait: float = 0.01
+
+    # Sort texts by token count before batching to reduce padding
+    textimager_duui_transformers_sentiment_sort_by_length: bool = True
+
+    # Max number of cached text results, 0 to disable
+    textimager_duui_transformers_sentiment_result_cache_size: int = 10000
+
+    # Inference backend per model as comma separated "model_name=backend" list, use "*" as model name for all others
+    # Backends: pytorch (default), onnx or onnx-int8 (dynamically quantized)
+    textimager_duui_transformers_sentiment_backends: Optional[str] = None
+
+    # Directory for the exported ONNX models
+    textimager_duui_transformers_sentiment_onnx_cache_path: str = "onnx_models"
+
+    # Split texts longer than the model max length into overlapping token windows instead of truncating them
+    textimager_duui_transformers_sentiment_chunking: bool = False
+
+    # Number of tokens shared by consecutive windows
+    textimager_duui_transformers_sentiment_chunk_overlap: int = 64
+
+    # Pooling of the window scores for each text: mean or length (weighted by the window token count)
+    textimager_duui_transformers_sentiment_chunk_pooling: str = "length"
+
 
 # Capabilities
 class TextImagerCapability(BaseModel):
@@ -51,3 +76,13 @@ class TextImagerDocumentation(BaseModel):
 
     # Analysis engine XML, if available
     implementation_specific: Optional[str]
+
+
+# Result cache statistics
+class ResultCacheStats(BaseModel):
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    entries: int
+    max_entries: int
@@ -0,0 +1,75 @@
+from bisect import bisect_left
+from threading import Lock
+
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096)
+
+
+def format_labels(labels, extra=()):
+    items = list(labels) + list(extra)
+    if len(items) == 0:
+        return ""
+    values = ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n"))
+        for name, value in items
+    )
+    return "{" + values + "}"
+
+
+# Counters and histograms with labels, rendered in the Prometheus text format
+class Metrics:
+    def __init__(self):
+        self.lock = Lock()
+
+        # name -> (type, help text, histogram buckets)
+        self.definitions = {}
+
+        # name -> labels -> counter value or [bucket counts, sum, count]
+        self.values = {}
+
+    def counter(self, name, help_text):
+        self.definitions[name] = ("counter", help_text, None)
+        self.values[name] = {}
+
+    def histogram(self, name, help_text, buckets=SECONDS_BUCKETS):
+        self.definitions[name] = ("histogram", help_text, buckets)
+        self.values[name] = {}
+
+    def inc(self, name, value=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            values = self.values[name]
+            values[key] = values.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = tuple(sorted(labels.items()))
+        buckets = self.definitions[name][2]
+        with self.lock:
+            values = self.values[name]
+            if key not in values:
+                values[key] = [[0] * (len(buckets) + 1), 0.0, 0]
+            histogram = values[key]
+            histogram[0][bisect_left(buckets, value)] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def render(self):
+        lines = []
+        with self.lock:
+            for name, (metric_type, help_text, buckets) in self.definitions.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                for key, value in self.values[name].items():
+                    if metric_type == "counter":
+                        lines.append(f"{name}{format_labels(key)} {value}")
+                        continue
+
+                    bucket_counts, total, count = value
+                    cumulative = 0
+                    for bound, bucket_count in zip(list(buckets) + ["+Inf"], bucket_counts):
+                        cumulative += bucket_count
+                        lines.append(f"{name}_bucket{format_labels(key, [('le', bound)])} {cumulative}")
+                    lines.append(f"{name}_sum{format_labels(key)} {total}")
+                    lines.append(f"{name}_count{format_labels(key)} {count}")
+
+        return "\n".join(lines) + "\n"
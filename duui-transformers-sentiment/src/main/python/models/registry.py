@@ -0,0 +1,157 @@
+# Registry of all supported models with the module containing their definition
+# The definitions (including version, languages and preprocessing) are only imported when a model is first used,
+# enable a model by setting "enabled" here and copying its module in the Dockerfile.
+MODEL_REGISTRY = {
+    "cardiffnlp/twitter-roberta-base-sentiment": {"module": "cardiffnlp_twitter_roberta_base_sentiment", "enabled": True},
+    "cardiffnlp/twitter-roberta-base-sentiment-latest": {"module": "cardiffnlp_twitter_roberta_base_sentiment_latest", "enabled": True},
+    "cardiffnlp/twitter-xlm-roberta-base-sentiment": {"module": "cardiffnlp_twitter_xlm_roberta_base_sentiment", "enabled": True},
+    "clampert/multilingual-sentiment-covid19": {"module": "clampert_multilingual_sentiment_covid19", "enabled": True},
+    "cmarkea/distilcamembert-base-sentiment": {"module": "cmarkea_distilcamembert_base_sentiment", "enabled": True},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-ep1-cp35057": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep1_cp35057", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-ep2-cp70114": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep2_cp70114", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-ep3-cp105171": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep3_cp105171", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-ep4-cp140228": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep4_cp140228", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-ep5-cp175285": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep5_cp175285", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-unseen-ep1-cp35010": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep1_cp35010", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-unseen-ep2-cp70020": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep2_cp70020", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-unseen-ep3-cp105030": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep3_cp105030", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-unseen-ep4-cp140040": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep4_cp140040", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-unseen-ep5-cp175050": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep5_cp175050", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep2-cp210060": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp210060", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep4-cp420120": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp420120", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep6-cp630180": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp630180", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep8-cp840240": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp840240", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep10-cp1050300": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp1050300", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep1-cp30979": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep1_cp30979", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep2-cp61958": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep2_cp61958", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep3-cp92937": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep3_cp92937", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep4-cp123916": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep4_cp123916", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep5-cp154895": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep5_cp154895", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep6-cp185874": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep6_cp185874", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep7-cp216853": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep7_cp216853", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep8-cp247832": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep8_cp247832", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep9-cp278811": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep9_cp278811", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep10-cp309790": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep10_cp309790", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep11-cp340769": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep11_cp340769", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep12-cp371748": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep12_cp371748", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep13-cp402727": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep13_cp402727", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep14-cp433706": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep14_cp433706", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep15-cp464685": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep15_cp464685", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep16-cp495664": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep16_cp495664", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep17-cp526643": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep17_cp526643", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep18-cp557622": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep18_cp557622", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep19-cp588601": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep19_cp588601", "enabled": False},
+    "dbaumartz/cardiffnlp_twitter-xlm-roberta-base-sentiment-finetuned-de-3sentiment-2-exact-ep20-cp619580": {"module": "dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep20_cp619580", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-ep1-cp35057": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep1_cp35057", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-ep2-cp70114": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep2_cp70114", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-ep3-cp105171": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep3_cp105171", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-ep4-cp140228": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep4_cp140228", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-ep5-cp175285": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep5_cp175285", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-unseen-ep1-cp4193": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep1_cp4193", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-unseen-ep2-cp8386": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep2_cp8386", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-unseen-ep3-cp12579": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep3_cp12579", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-unseen-ep4-cp16772": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep4_cp16772", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-unseen-ep5-cp20965": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep5_cp20965", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep2-cp25156": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp25156", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep4-cp50312": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp50312", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep6-cp75468": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp75468", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep8-cp100624": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp100624", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep10-cp125780": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp125780", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep1-cp30979": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep1_cp30979", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep6-cp185874": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep6_cp185874", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep7-cp216853": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep7_cp216853", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep8-cp247832": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep8_cp247832", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep9-cp278811": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep9_cp278811", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep10-cp309790": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep10_cp309790", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep11-cp340769": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep11_cp340769", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep12-cp371748": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep12_cp371748", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep13-cp402727": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep13_cp402727", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep14-cp433706": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep14_cp433706", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep15-cp464685": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep15_cp464685", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep16-cp495664": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep16_cp495664", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep17-cp526643": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep17_cp526643", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep18-cp557622": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep18_cp557622", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep19-cp588601": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep19_cp588601", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep20-cp619580": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep20_cp619580", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep3-cp92937": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep3_cp92937", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep4-cp123916": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep4_cp123916", "enabled": False},
+    "dbaumartz/mdraw_german-news-sentiment-bert-finetuned-de-3sentiment-2-exact-ep5-cp154895": {"module": "dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep5_cp154895", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-ep1-cp35057": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep1_cp35057", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-ep2-cp70114": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep2_cp70114", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-ep3-cp105171": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep3_cp105171", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-ep4-cp140228": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep4_cp140228", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-ep5-cp175285": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep5_cp175285", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-unseen-ep1-cp4224": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep1_cp4224", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-unseen-ep2-cp8448": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep2_cp8448", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-unseen-ep3-cp12672": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep3_cp12672", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-unseen-ep4-cp16896": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep4_cp16896", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-unseen-ep5-cp21120": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep5_cp21120", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep2-cp25342": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp25342", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep4-cp50684": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp50684", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep6-cp76026": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp76026", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep8-cp101368": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp101368", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep10-cp126710": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp126710", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep1-cp30979": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep1_cp30979", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep2-cp61958": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep2_cp61958", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep3-cp92937": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep3_cp92937", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep4-cp123916": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep4_cp123916", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep5-cp154895": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep5_cp154895", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep6-cp185874": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep6_cp185874", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep7-cp216853": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep7_cp216853", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep8-cp247832": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep8_cp247832", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep9-cp278811": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep9_cp278811", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep10-cp309790": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep10_cp309790", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep11-cp340769": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep11_cp340769", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep12-cp371748": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep12_cp371748", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep13-cp402727": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep13_cp402727", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep14-cp433706": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep14_cp433706", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep15-cp464685": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep15_cp464685", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep16-cp495664": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep16_cp495664", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep17-cp526643": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep17_cp526643", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep18-cp557622": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep18_cp557622", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep19-cp588601": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep19_cp588601", "enabled": False},
+    "dbaumartz/oliverguhr_german-sentiment-bert-finetuned-de-3sentiment-2-exact-ep20-cp619580": {"module": "dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep20_cp619580", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-ep1-cp35057": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep1_cp35057", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-ep2-cp70114": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep2_cp70114", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-ep3-cp105171": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep3_cp105171", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-ep4-cp140228": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep4_cp140228", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-ep5-cp175285": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep5_cp175285", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-unseen-ep1-cp30870": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep1_cp30870", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-unseen-ep2-cp61740": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep2_cp61740", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-unseen-ep3-cp92610": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep3_cp92610", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-unseen-ep4-cp123480": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep4_cp123480", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-unseen-ep5-cp154350": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep5_cp154350", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep2-cp185216": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp185216", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep4-cp370432": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp370432", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep6-cp555648": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp555648", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep8-cp740864": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp740864", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-unseen-adapter-pfeiffer-ep10-cp926080": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp926080", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep1-cp30979": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep1_cp30979", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep2-cp61958": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep2_cp61958", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep3-cp92937": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep3_cp92937", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep4-cp123916": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep4_cp123916", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep5-cp154895": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep5_cp154895", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep6-cp185874": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep6_cp185874", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep7-cp216853": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep7_cp216853", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep8-cp247832": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep8_cp247832", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep9-cp278811": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep9_cp278811", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep10-cp309790": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep10_cp309790", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep11-cp340769": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep11_cp340769", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep12-cp371748": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep12_cp371748", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep13-cp402727": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep13_cp402727", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep14-cp433706": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep14_cp433706", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep15-cp464685": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep15_cp464685", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep16-cp495664": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep16_cp495664", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep17-cp526643": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep17_cp526643", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep18-cp557622": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep18_cp557622", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep19-cp588601": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep19_cp588601", "enabled": False},
+    "dbaumartz/philschmid_distilbert-base-multilingual-cased-sentiment-2-finetuned-de-3sentiment-2-exact-ep20-cp619580": {"module": "dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep20_cp619580", "enabled": False},
+    "finiteautomata/bertweet-base-sentiment-analysis": {"module": "finiteautomata_bertweet_base_sentiment_analysis", "enabled": True},
+    "j-hartmann/sentiment-roberta-large-english-3-classes": {"module": "j_hartmann_sentiment_roberta_large_english_3_classes", "enabled": True},
+    "LiYuan/amazon-review-sentiment-analysis": {"module": "liyuan_amazon_review_sentiment_analysis", "enabled": True},
+    "mdraw/german-news-sentiment-bert": {"module": "mdraw_german_news_sentiment_bert", "enabled": True},
+    "nlptown/bert-base-multilingual-uncased-sentiment": {"module": "nlptown_bert_base_multilingual_uncased_sentiment", "enabled": True},
+    "oliverguhr/german-sentiment-bert": {"module": "oliverguhr_german_sentiment_bert", "enabled": True},
+    "philschmid/distilbert-base-multilingual-cased-sentiment-2": {"module": "philschmid_distilbert_base_multilingual_cased_sentiment_2", "enabled": True},
+    "siebert/sentiment-roberta-large-english": {"module": "siebert_sentiment_roberta_large_english", "enabled": True},
+}
@@ -0,0 +1,126 @@
+import inspect
+import logging
+import os
+import re
+import shutil
+import tempfile
+
+import torch
+from transformers import AutoConfig, AutoModelForSequenceClassification, AutoTokenizer
+
+logger = logging.getLogger(__name__)
+
+BACKEND_PYTORCH = "pytorch"
+BACKEND_ONNX = "onnx"
+BACKEND_ONNX_INT8 = "onnx-int8"
+BACKENDS = [
+    BACKEND_PYTORCH,
+    BACKEND_ONNX,
+    BACKEND_ONNX_INT8,
+]
+
+ONNX_MODEL_FILENAME = "model.onnx"
+
+
+# ONNX Runtime session, called like the PyTorch model on the tokenized inputs
+class OnnxModel:
+    def __init__(self, model_path, config):
+        # only needed for this backend
+        import onnxruntime
+
+        self.session = onnxruntime.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+        self.config = config
+
+    def __call__(self, **inputs):
+        feed = {
+            name: inputs[name].cpu().numpy()
+            for name in self.input_names
+        }
+        logits = self.session.run(["logits"], feed)[0]
+        return {"logits": torch.from_numpy(logits)}
+
+
+# Provides the parts of the transformers pipeline used for inference
+class OnnxSentimentAnalysis:
+    def __init__(self, model, tokenizer):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.device = torch.device("cpu")
+
+
+def get_export_path(cache_path, model_name, model_version, quantize):
+    export_name = re.sub(r"[^A-Za-z0-9._-]", "_", model_name.strip("/"))
+    if model_version is not None:
+        export_name += "_" + model_version
+    if quantize:
+        export_name += "_int8"
+    return os.path.join(cache_path, export_name)
+
+
+# Export the model to ONNX with dynamic batch and sequence axes, optionally with int8 quantized weights
+def export_onnx_model(model_name, model_version, export_path, quantize):
+    local_files_only = model_version is None
+    model = AutoModelForSequenceClassification.from_pretrained(model_name, revision=model_version, local_files_only=local_files_only)
+    model.eval()
+    tokenizer = AutoTokenizer.from_pretrained(model_name, revision=model_version, local_files_only=local_files_only)
+
+    # export to a temporary directory first, so an interrupted export is never used
+    os.makedirs(os.path.dirname(export_path), exist_ok=True)
+    temp_path = tempfile.mkdtemp(dir=os.path.dirname(export_path))
+    try:
+        inputs = tokenizer(["This is a sample.", "Sample"], padding=True, return_tensors="pt")
+        # traced inputs follow the order of the forward arguments, not of the tokenizer outputs
+        input_names = [
+            name
+            for name in inspect.signature(model.forward).parameters
+            if name in inputs
+        ]
+        dynamic_axes = {
+            name: {0: "batch", 1: "sequence"}
+            for name in input_names
+        }
+        dynamic_axes["logits"] = {0: "batch"}
+
+        model_path = os.path.join(temp_path, ONNX_MODEL_FILENAME)
+        if quantize:
+            model_path = os.path.join(temp_path, "model_fp32.onnx")
+
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                ({name: inputs[name] for name in input_names},),
+                model_path,
+                input_names=input_names,
+                output_names=["logits"],
+                dynamic_axes=dynamic_axes,
+                opset_version=13
+            )
+
+        if quantize:
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+            quantize_dynamic(model_path, os.path.join(temp_path, ONNX_MODEL_FILENAME), weight_type=QuantType.QInt8)
+            os.remove(model_path)
+
+        model.config.save_pretrained(temp_path)
+        tokenizer.save_pretrained(temp_path)
+
+        os.rename(temp_path, export_path)
+    except Exception:
+        shutil.rmtree(temp_path, ignore_errors=True)
+        raise
+
+
+# Load the model for ONNX Runtime, exporting it on first use
+def load_onnx_model(model_name, model_version, cache_path, quantize):
+    export_path = get_export_path(cache_path, model_name, model_version, quantize)
+    if not os.path.exists(os.path.join(export_path, ONNX_MODEL_FILENAME)):
+        logger.info("Exporting model \"%s\" to ONNX at \"%s\"", model_name, export_path)
+        export_onnx_model(model_name, model_version, export_path, quantize)
+
+    logger.info("Loading ONNX model from \"%s\"", export_path)
+    config = AutoConfig.from_pretrained(export_path)
+    tokenizer = AutoTokenizer.from_pretrained(export_path)
+    model = OnnxModel(os.path.join(export_path, ONNX_MODEL_FILENAME), config)
+
+    return OnnxSentimentAnalysis(model, tokenizer)
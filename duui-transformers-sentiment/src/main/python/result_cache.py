@@ -0,0 +1,55 @@
+from collections import OrderedDict
+from threading import Lock
+
+
+# LRU cache for model results of single texts, identified by model, version, settings and preprocessed text
+class ResultCache:
+    def __init__(self, max_entries=0):
+        # Max number of cached results, 0 disables the cache
+        self.max_entries = max_entries
+
+        # Cached results, ordered from least to most recently used
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def is_enabled(self):
+        return self.max_entries > 0
+
+    # Get the cached result for this key, None if not cached
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if not self.is_enabled():
+            return
+
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups > 0 else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+            }
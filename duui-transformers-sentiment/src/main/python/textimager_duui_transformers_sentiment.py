@@ -1,338 +1,76 @@
 import logging
+from contextvars import ContextVar
 from functools import lru_cache
+from importlib import import_module
 from itertools import chain
 from platform import python_version
 from sys import version as sys_version
-from threading import Lock
-from time import time
-from typing import Dict, Union
-from datetime import datetime
+from time import perf_counter, time
+from typing import Dict, List, Union
 
 from cassis import load_typesystem
-from fastapi import FastAPI, Response
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import PlainTextResponse
+import numpy
 import torch
 from transformers import pipeline, __version__ as transformers_version, AutoTokenizer
 
+from .adapter_host import AdapterHost
+from .batch_scheduler import BatchScheduler
+from .onnx_backend import BACKENDS, BACKEND_PYTORCH, BACKEND_ONNX_INT8, load_onnx_model
+from .metrics import Metrics, SIZE_BUCKETS
+from .result_cache import ResultCache
 from .duui.reqres import TextImagerResponse, TextImagerRequest
 from .duui.sentiment import SentimentSentence, SentimentSelection
-from .duui.service import Settings, TextImagerDocumentation, TextImagerCapability
+from .duui.service import Settings, TextImagerDocumentation, TextImagerCapability, ResultCacheStats
 from .duui.uima import *
-from .models.cardiffnlp_twitter_roberta_base_sentiment import SUPPORTED_MODEL as CARDIFFNLP_TRBS
-from .models.cardiffnlp_twitter_roberta_base_sentiment_latest import SUPPORTED_MODEL as CARDIFFNLP_TRBSL
-from .models.cardiffnlp_twitter_xlm_roberta_base_sentiment import SUPPORTED_MODEL as CARDIFFNLP_TXRBS
-from .models.clampert_multilingual_sentiment_covid19 import SUPPORTED_MODEL as CLAMPERT_MSC19
-from .models.cmarkea_distilcamembert_base_sentiment import SUPPORTED_MODEL as CMARKEA_DBS
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep1_cp35057 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E1
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep2_cp70114 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E2
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep3_cp105171 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E3
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep4_cp140228 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E4
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep5_cp175285 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E5
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep1_cp35010 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E1
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep2_cp70020 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E2
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep3_cp105030 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E3
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep4_cp140040 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E4
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep5_cp175050 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E5
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp210060 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E2
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp420120 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E4
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp630180 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E6
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp840240 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E8
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp1050300 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E10
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep1_cp30979 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E1
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep2_cp61958 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E2
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep3_cp92937 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E3
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep4_cp123916 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E4
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep5_cp154895 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E5
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep6_cp185874 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E6
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep7_cp216853 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E7
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep8_cp247832 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E8
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep9_cp278811 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E9
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep10_cp309790 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E10
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep11_cp340769 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E11
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep12_cp371748 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E12
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep13_cp402727 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E13
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep14_cp433706 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E14
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep15_cp464685 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E15
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep16_cp495664 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E16
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep17_cp526643 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E17
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep18_cp557622 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E18
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep19_cp588601 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E19
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep20_cp619580 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E20
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep1_cp35057 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3_2E1
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep2_cp70114 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3_2E2
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep3_cp105171 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3_2E3
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep4_cp140228 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3_2E4
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep5_cp175285 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3_2E5
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep1_cp4193 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3U_2E1
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep2_cp8386 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3U_2E2
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep3_cp12579 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3U_2E3
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep4_cp16772 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3U_2E4
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep5_cp20965 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3U_2E5
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp25156 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3UAP_2E2
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp50312 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3UAP_2E4
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp75468 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3UAP_2E6
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp100624 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3UAP_2E8
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp125780 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3UAP_2E10
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep1_cp30979 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E1
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep6_cp185874 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E6
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep7_cp216853 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E7
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep8_cp247832 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E8
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep9_cp278811 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E9
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep10_cp309790 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E10
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep11_cp340769 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E11
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep12_cp371748 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E12
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep13_cp402727 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E13
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep14_cp433706 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E14
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep15_cp464685 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E15
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep16_cp495664 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E16
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep17_cp526643 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E17
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep18_cp557622 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E18
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep19_cp588601 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E19
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep20_cp619580 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E20
-# #from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep2_cp61958 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E2
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep3_cp92937 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E3
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep4_cp123916 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E4
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep5_cp154895 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E5
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep1_cp35057 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3_2E1
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep2_cp70114 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3_2E2
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep3_cp105171 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3_2E3
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep4_cp140228 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3_2E4
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep5_cp175285 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3_2E5
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep1_cp4224 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E1
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep2_cp8448 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E2
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep3_cp12672 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E3
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep4_cp16896 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E4
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep5_cp21120 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E5
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp25342 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E2
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp50684 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E4
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp76026 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E6
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp101368 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E8
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp126710 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E10
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep1_cp30979 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E1
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep2_cp61958 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E2
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep3_cp92937 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E3
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep4_cp123916 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E4
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep5_cp154895 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E5
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep6_cp185874 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E6
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep7_cp216853 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E7
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep8_cp247832 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E8
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep9_cp278811 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E9
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep10_cp309790 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E10
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep11_cp340769 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E11
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep12_cp371748 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E12
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep13_cp402727 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E13
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep14_cp433706 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E14
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep15_cp464685 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E15
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep16_cp495664 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E16
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep17_cp526643 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E17
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep18_cp557622 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E18
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep19_cp588601 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E19
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep20_cp619580 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E20
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep1_cp35057 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E1
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep2_cp70114 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E2
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep3_cp105171 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E3
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep4_cp140228 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E4
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep5_cp175285 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E5
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep1_cp30870 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E1
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep2_cp61740 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E2
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep3_cp92610 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E3
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep4_cp123480 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E4
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep5_cp154350 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E5
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp185216 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E2
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp370432 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E4
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp555648 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E6
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp740864 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E8
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp926080 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E10
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep1_cp30979 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E1
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep2_cp61958 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E2
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep3_cp92937 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E3
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep4_cp123916 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E4
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep5_cp154895 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E5
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep6_cp185874 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E6
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep7_cp216853 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E7
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep8_cp247832 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E8
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep9_cp278811 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E9
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep10_cp309790 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E10
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep11_cp340769 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E11
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep12_cp371748 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E12
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep13_cp402727 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E13
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep14_cp433706 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E14
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep15_cp464685 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E15
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep16_cp495664 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E16
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep17_cp526643 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E17
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep18_cp557622 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E18
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep19_cp588601 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E19
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep20_cp619580 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E20
-from .models.finiteautomata_bertweet_base_sentiment_analysis import SUPPORTED_MODEL as FINITEAUTOMATA_BBSA
-from .models.j_hartmann_sentiment_roberta_large_english_3_classes import SUPPORTED_MODEL as JHARTMANN_SRLE3C
-from .models.liyuan_amazon_review_sentiment_analysis import SUPPORTED_MODEL as LIYUAN_ARSA
-from .models.mdraw_german_news_sentiment_bert import SUPPORTED_MODEL as MDRAW_GNSB
-from .models.nlptown_bert_base_multilingual_uncased_sentiment import SUPPORTED_MODEL as NLPTOWN_BBMUS
-from .models.oliverguhr_german_sentiment_bert import SUPPORTED_MODEL as OLIVERGUHR_GSB
-from .models.philschmid_distilbert_base_multilingual_cased_sentiment_2 import SUPPORTED_MODEL as PHILSHMID_DBMCS2
-from .models.siebert_sentiment_roberta_large_english import SUPPORTED_MODEL as SIEBERT_SRLE
-
-
-SUPPORTED_MODELS = {
-    **CARDIFFNLP_TRBS,
-    **CARDIFFNLP_TRBSL,
-    **CARDIFFNLP_TXRBS,
-    **NLPTOWN_BBMUS,
-    **FINITEAUTOMATA_BBSA,
-    **SIEBERT_SRLE,
-    **JHARTMANN_SRLE3C,
-    **LIYUAN_ARSA,
-    **PHILSHMID_DBMCS2,
-    **CLAMPERT_MSC19,
-    **OLIVERGUHR_GSB,
-    **MDRAW_GNSB,
-    **CMARKEA_DBS,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E1,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E2,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E3,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E4,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E5,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E1,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E2,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E3,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E4,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E5,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E2,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E4,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E6,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E8,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E10,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E1,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E2,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E3,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E4,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E5,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E6,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E7,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E8,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E9,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E10,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E11,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E12,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E13,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E14,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E15,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E16,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E17,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E18,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E19,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E20,
-    #**DBAUMARTZ_MDRAW_GNSBFD3_2E1,
-    #**DBAUMARTZ_MDRAW_GNSBFD3_2E2,
-    #**DBAUMARTZ_MDRAW_GNSBFD3_2E3,
-    #**DBAUMARTZ_MDRAW_GNSBFD3_2E4,
-    #**DBAUMARTZ_MDRAW_GNSBFD3_2E5,
-    #**DBAUMARTZ_MDRAW_GNSBFD3U_2E1,
-    #**DBAUMARTZ_MDRAW_GNSBFD3U_2E2,
-    #**DBAUMARTZ_MDRAW_GNSBFD3U_2E3,
-    #**DBAUMARTZ_MDRAW_GNSBFD3U_2E4,
-    #**DBAUMARTZ_MDRAW_GNSBFD3U_2E5,
-    #**DBAUMARTZ_MDRAW_GNSBFD3UAP_2E2,
-    #**DBAUMARTZ_MDRAW_GNSBFD3UAP_2E4,
-    #**DBAUMARTZ_MDRAW_GNSBFD3UAP_2E6,
-    #**DBAUMARTZ_MDRAW_GNSBFD3UAP_2E8,
-    #**DBAUMARTZ_MDRAW_GNSBFD3UAP_2E10,
-    #**DBAUMARTZ_MDRAW_GNSBFD3E_2E1,
-    #**DBAUMARTZ_MDRAW_GNSBFD3E_2E2,
-    #**DBAUMARTZ_MDRAW_GNSBFD3E_2E3,
-    #**DBAUMARTZ_MDRAW_GNSBFD3E_2E4,
-    #**DBAUMARTZ_MDRAW_GNSBFD3E_2E5,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E6,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E7,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E8,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E9,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E10,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E11,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E12,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E13,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E14,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E15,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E16,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E17,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E18,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E19,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E20,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3_2E1,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3_2E2,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3_2E3,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3_2E4,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3_2E5,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E1,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E2,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E3,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E4,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E5,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E2,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E4,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E6,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E8,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E10,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E1,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E2,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E3,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E4,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E5,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E6,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E7,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E8,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E9,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E10,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E11,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E12,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E13,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E14,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E15,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E16,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E17,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E18,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E19,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E20,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E1,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E2,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E3,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E4,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E5,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E1,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E2,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E3,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E4,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E5,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E2,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E4,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E6,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E8,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E10,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E1,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E2,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E3,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E4,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E5,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E6,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E7,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E8,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E9,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E10,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E11,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E12,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E13,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E14,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E15,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E16,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E17,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E18,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E19,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E20,
-}
+from .models.registry import MODEL_REGISTRY
+
+SENTIMENT_POLARITIES = ["pos", "neu", "neg"]
+CHUNK_POOLINGS = ["mean", "length"]
 
 settings = Settings()
-supported_languages = sorted(list(set(chain(*[m["languages"] for m in SUPPORTED_MODELS.values()]))))
 lru_cache_with_size = lru_cache(maxsize=settings.textimager_duui_transformers_sentiment_model_cache_size)
-model_lock = Lock()
+
+# processing stages: parse, preprocess, tokenize, forward, postprocess, serialize
+metrics = Metrics()
+metrics.counter("sentiment_requests_total", "Processed requests per model")
+metrics.counter("sentiment_request_errors_total", "Failed requests per model")
+metrics.histogram("sentiment_stage_seconds", "Time spent in each processing stage per model")
+metrics.histogram("sentiment_queue_wait_seconds", "Time requests waited for their texts to be scheduled")
+metrics.histogram("sentiment_scheduled_batch_texts", "Texts of all merged requests per scheduled batch", SIZE_BUCKETS)
+metrics.histogram("sentiment_model_batch_size", "Inputs per model forward pass", SIZE_BUCKETS)
+metrics.counter("sentiment_texts_total", "Texts in all selections of the requests")
+metrics.counter("sentiment_result_cache_hits_total", "Texts served from the result cache")
+metrics.counter("sentiment_inferred_texts_total", "Unique texts run through the model")
+metrics.counter("sentiment_tokens_total", "Tokens run through the model")
+metrics.counter("sentiment_padded_tokens_total", "Tokens including padding run through the model")
+
+
+def observe_scheduled_batch(key, texts_count, queue_waits):
+    model_name = key[0]
+    metrics.observe("sentiment_scheduled_batch_texts", texts_count, model=model_name)
+    for queue_wait in queue_waits:
+        metrics.observe("sentiment_queue_wait_seconds", queue_wait, model=model_name)
+
+
+batch_scheduler = BatchScheduler(settings.textimager_duui_transformers_sentiment_batch_max_wait, observe_scheduled_batch)
+result_cache = ResultCache(settings.textimager_duui_transformers_sentiment_result_cache_size)
+
+# timestamps of the current http request, to time parsing and serialization outside of the endpoint
+request_timings = ContextVar("request_timings", default=None)
+
+# inference backend per model name, "*" sets the backend for all other models
+model_backends = {}
+if settings.textimager_duui_transformers_sentiment_backends:
+    for model_backend in settings.textimager_duui_transformers_sentiment_backends.split(","):
+        backend_model_name, backend = model_backend.rsplit("=", 1)
+        if backend.strip() not in BACKENDS:
+            raise Exception(f"Backend \"{backend.strip()}\" is not supported!")
+        model_backends[backend_model_name.strip()] = backend.strip()
+
+if settings.textimager_duui_transformers_sentiment_chunk_pooling not in CHUNK_POOLINGS:
+    raise Exception(f"Chunk pooling \"{settings.textimager_duui_transformers_sentiment_chunk_pooling}\" is not supported!")
 
 logging.basicConfig(level=settings.textimager_duui_transformers_sentiment_log_level)
 logger = logging.getLogger(__name__)
@@ -377,6 +115,25 @@ app = FastAPI(
 )
 
 
+@app.middleware("http")
+async def time_request(request: Request, call_next):
+    timings = {"received": perf_counter()}
+    request_timings.set(timings)
+
+    response = await call_next(request)
+
+    # the response is serialized after the endpoint returned
+    if "handled" in timings:
+        metrics.observe("sentiment_stage_seconds", perf_counter() - timings["handled"], model=timings["model_name"], stage="serialize")
+
+    return response
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics() -> str:
+    return metrics.render()
+
+
 @app.get("/v1/communication_layer", response_class=PlainTextResponse)
 def get_communication_layer() -> str:
     return lua_communication_script
@@ -384,8 +141,16 @@ def get_communication_layer() -> str:
 
 @app.get("/v1/documentation")
 def get_documentation() -> TextImagerDocumentation:
+    # imports the definitions of all enabled models, their weights are not loaded
+    supported_models = {
+        model_name: {
+            "version": get_model_data(model_name)["version"],
+            "languages": get_model_data(model_name)["languages"],
+        }
+        for model_name in get_enabled_models()
+    }
     capabilities = TextImagerCapability(
-        supported_languages=supported_languages,
+        supported_languages=sorted(list(set(chain(*[m["languages"] for m in supported_models.values()])))),
         reproducible=True
     )
 
@@ -401,7 +166,7 @@ def get_documentation() -> TextImagerDocumentation:
         },
         docker_container_id="[TODO]",
         parameters={
-            "model_name": SUPPORTED_MODELS,
+            "model_name": supported_models,
         },
         capability=capabilities,
         implementation_specific=None,
@@ -421,11 +186,16 @@ def get_typesystem() -> Response:
     )
 
 
+@app.get("/v1/details/result_cache")
+def get_result_cache_stats() -> ResultCacheStats:
+    return ResultCacheStats(**result_cache.stats())
+
+
 def clean_cuda_cache():
     if device >= 0:
-        logger.info('emptying cuda cache')
+        logger.debug('emptying cuda cache')
         torch.cuda.empty_cache()
-        logger.info('cuda cache empty')
+        logger.debug('cuda cache empty')
 
 
 @app.post("/v1/process")
@@ -434,9 +204,15 @@ def post_process(request: TextImagerRequest) -> TextImagerResponse:
     meta = None
     modification_meta = None
 
-    clean_cuda_cache()
+    start = perf_counter()
+    stage_seconds = {}
+    # only registered model names are used as metric labels
+    metrics_model_name = request.model_name if request.model_name in get_enabled_models() else "unsupported"
 
-    dt = datetime.now()
+    # time from receiving the request until here, includes reading and validating the body
+    timings = request_timings.get()
+    if timings is not None:
+        stage_seconds["parse"] = start - timings["received"]
 
     try:
         modification_timestamp_seconds = int(time())
@@ -444,18 +220,45 @@ def post_process(request: TextImagerRequest) -> TextImagerResponse:
         logger.debug("Received:")
         logger.debug(request)
 
-        if request.model_name not in SUPPORTED_MODELS:
+        if request.model_name not in get_enabled_models():
             raise Exception(f"Model \"{request.model_name}\" is not supported!")
 
-        if request.lang not in SUPPORTED_MODELS[request.model_name]["languages"]:
-            raise Exception(f"Document language \"{request.lang}\" is not supported by model \"{request.model_name}\"!")
-
         logger.info("Using model: \"%s\"", request.model_name)
-        model_data = SUPPORTED_MODELS[request.model_name]
+        model_data = get_model_data(request.model_name)
         logger.debug(model_data)
 
-        for selection in request.selections:
-            processed_sentences = process_selection(request.model_name, model_data, selection, request.doc_len, request.batch_size, request.ignore_max_length_truncation_padding)
+        if request.lang not in model_data["languages"]:
+            raise Exception(f"Document language \"{request.lang}\" is not supported by model \"{request.model_name}\"!")
+
+        request_stats = {
+            "tokens": 0,
+            "padded_tokens": 0,
+            "document_order_padded_tokens": 0,
+            "texts": 0,
+            "unique_texts": 0,
+            "cache_hits": 0,
+        }
+
+        # run all selections together, so texts appearing in multiple selections are only processed once
+        stage_start = perf_counter()
+        selections_texts = [
+            preprocess_selection(model_data, selection)
+            for selection in request.selections
+        ]
+        stage_seconds["preprocess"] = perf_counter() - stage_start
+
+        # tokenization and forward pass are measured by the batch scheduler worker
+        stage_start = perf_counter()
+        results = analyse_texts(request.model_name, model_data, list(chain(*selections_texts)), request.batch_size, request.ignore_max_length_truncation_padding, request_stats)
+        stage_seconds["inference"] = perf_counter() - stage_start
+
+        stage_start = perf_counter()
+        results_start = 0
+        for selection, selection_texts in zip(request.selections, selections_texts):
+            selection_results = results[results_start:results_start+len(selection_texts)]
+            results_start += len(selection_texts)
+
+            processed_sentences = process_selection(model_data, selection, selection_results, request.doc_len)
 
             processed_selections.append(
                 SentimentSelection(
@@ -463,6 +266,23 @@ def post_process(request: TextImagerRequest) -> TextImagerResponse:
                     sentences=processed_sentences
                 )
             )
+        stage_seconds["postprocess"] = perf_counter() - stage_start
+
+        logger.info(
+            "Texts: %d, unique: %d, cached: %d",
+            request_stats["texts"],
+            request_stats["unique_texts"],
+            request_stats["cache_hits"]
+        )
+
+        if request_stats["padded_tokens"] > 0:
+            logger.info(
+                "Padding ratio: %.3f (%d of %d tokens), in document order: %.3f",
+                1 - request_stats["tokens"] / request_stats["padded_tokens"],
+                request_stats["padded_tokens"] - request_stats["tokens"],
+                request_stats["padded_tokens"],
+                1 - request_stats["tokens"] / request_stats["document_order_padded_tokens"]
+            )
 
         meta = UimaAnnotationMeta(
             name=settings.textimager_duui_transformers_sentiment_annotator_name,
@@ -480,43 +300,73 @@ def post_process(request: TextImagerRequest) -> TextImagerResponse:
 
     except Exception as ex:
         logger.exception(ex)
+        metrics.inc("sentiment_request_errors_total", model=metrics_model_name)
 
     #logger.debug(processed_selections)
     for ps in processed_selections:
         for s in ps.sentences:
             logger.debug(s)
 
-    dte = datetime.now()
-    print(dte, 'Finished processing', flush=True)
-    print('Time elapsed', f'{dte-dt}', flush=True)
-
     clean_cuda_cache()
 
-    return TextImagerResponse(
+    metrics.inc("sentiment_requests_total", model=metrics_model_name)
+    for stage, seconds in stage_seconds.items():
+        # inference is the sum of the stages in the worker and the queue wait
+        if stage != "inference":
+            metrics.observe("sentiment_stage_seconds", seconds, model=metrics_model_name, stage=stage)
+
+    logger.info(
+        "Finished processing in %.4fs (%s)",
+        perf_counter() - start,
+        ", ".join(f"{stage}: {seconds:.4f}s" for stage, seconds in stage_seconds.items())
+    )
+
+    response = TextImagerResponse(
         selections=processed_selections,
         meta=meta,
         modification_meta=modification_meta
     )
 
+    if timings is not None:
+        timings["model_name"] = metrics_model_name
+        timings["handled"] = perf_counter()
+
+    return response
+
+
+def get_enabled_models():
+    return [model_name for model_name, entry in MODEL_REGISTRY.items() if entry["enabled"]]
+
 
+# import the model definition from its module on first use, it contains the version and languages
+@lru_cache(maxsize=None)
+def get_model_data(model_name):
+    module_name = MODEL_REGISTRY[model_name]["module"]
+    logger.info("Loading definition of model \"%s\" from module \"%s\"", model_name, module_name)
+    module = import_module(f".models.{module_name}", __package__)
+    return module.SUPPORTED_MODEL[model_name]
+
+
+def get_model_backend(model_name):
+    return model_backends.get(model_name, model_backends.get("*", BACKEND_PYTORCH))
+
+
+# adapter hosts are cached here too, keyed on their base model, so the cache size bounds all loaded models
 @lru_cache_with_size
-def load_model(model_name, model_version, labels_count, adapter_path=None):
+def load_model(model_name, model_version, labels_count, backend=BACKEND_PYTORCH, adapter_host=False):
+    if adapter_host:
+        return AdapterHost(model_name, model_version, device)
+
+    if backend != BACKEND_PYTORCH:
+        return load_onnx_model(model_name, model_version, settings.textimager_duui_transformers_sentiment_onnx_cache_path, backend == BACKEND_ONNX_INT8)
+
     mo = model_name
     to = model_name
 
-    # manually load model if:
-    # model is local path, not on huggingface hub
-    # or adapter is used
-    if model_version is None or adapter_path is not None:
-        if adapter_path is None:
-            from transformers import AutoModelForSequenceClassification
-            mo = AutoModelForSequenceClassification.from_pretrained(model_name, revision=model_version, local_files_only=True)
-        else:
-            from transformers import AutoAdapterModel
-            mo = AutoAdapterModel.from_pretrained(model_name, revision=model_version, local_files_only=True)
-            adapter_name = mo.load_adapter(adapter_path)
-            mo.set_active_adapters(adapter_name)
-
+    # manually load model if model is local path, not on huggingface hub
+    if model_version is None:
+        from transformers import AutoModelForSequenceClassification
+        mo = AutoModelForSequenceClassification.from_pretrained(model_name, revision=model_version, local_files_only=True)
         to = AutoTokenizer.from_pretrained(model_name, local_files_only=True)
 
     return pipeline(
@@ -529,41 +379,63 @@ def load_model(model_name, model_version, labels_count, adapter_path=None):
     )
 
 
-def map_sentiment(sentiment_result: List[Dict[str, Union[str, float]]], sentiment_mapping: Dict[str, float], sentiment_polarity: Dict[str, List[str]], sentence: UimaSentence) -> SentimentSentence:
-    # get label from top result and map to sentiment values -1, 0 or 1
-    sentiment_value = 0.0
-    top_result = sentiment_result[0]
-    if top_result["label"] in sentiment_mapping:
-        sentiment_value = sentiment_mapping[top_result["label"]]
+# all adapters for the same base model share one instance of it
+def load_adapter_host(model_name, model_version):
+    return load_model(model_name, model_version, None, adapter_host=True)
 
-    # get scores of all labels
-    details = {
-        s["label"]: s["score"]
-        for s in sentiment_result
-    }
 
-    # calculate polarity: pos-neg
-    polarities = {
-        "pos": 0,
-        "neu": 0,
-        "neg": 0
-    }
-    for p in polarities:
-        for l in sentiment_polarity[p]:
-            for s in sentiment_result:
-                if s["label"] == l:
-                    polarities[p] += s["score"]
-
-    polarity = polarities["pos"] - polarities["neg"]
-
-    return SentimentSentence(
-        sentence=sentence,
-        sentiment=sentiment_value,
-        score=top_result["score"],
-        details=details,
-        polarity=polarity,
-        **polarities
-    )
+# map the (sentences x labels) score matrix to sentiment values
+def map_sentiments(scores, labels, sentiment_mapping: Dict[str, float], sentiment_polarity: Dict[str, List[str]], sentences: List[UimaSentence], doc_len: int) -> List[SentimentSentence]:
+    # get top label of each sentence and map to sentiment values -1, 0 or 1
+    top_labels = scores.argmax(axis=1)
+    top_scores = scores[numpy.arange(len(scores)), top_labels]
+    mapping_values = numpy.array([sentiment_mapping.get(label, 0.0) for label in labels], dtype=numpy.float64)
+    sentiment_values = mapping_values[top_labels]
+
+    # sum scores of labels for pos, neu and neg, polarity: pos-neg
+    polarity_matrix = numpy.array([
+        [sentiment_polarity[p].count(label) for p in SENTIMENT_POLARITIES]
+        for label in labels
+    ], dtype=numpy.float64)
+    polarities = scores @ polarity_matrix
+    polarity_values = polarities[:, 0] - polarities[:, 2]
+
+    processed_sentences = [
+        SentimentSentence(
+            sentence=sentence,
+            sentiment=sentiment,
+            score=score,
+            details=dict(zip(labels, details)),
+            polarity=polarity,
+            pos=pos,
+            neu=neu,
+            neg=neg
+        )
+        for sentence, sentiment, score, details, polarity, (pos, neu, neg)
+        in zip(sentences, sentiment_values.tolist(), top_scores.tolist(), scores.tolist(), polarity_values.tolist(), polarities.tolist())
+    ]
+
+    # average of all sentences for the whole selection
+    if len(sentences) > 1:
+        pos, neu, neg = polarities.mean(axis=0).tolist()
+        processed_sentences.append(
+            SentimentSentence(
+                sentence=UimaSentence(
+                    text="",
+                    begin=0,
+                    end=doc_len,
+                ),
+                sentiment=float(sentiment_values.mean()),
+                score=float(top_scores.mean()),
+                details=dict(zip(labels, scores.mean(axis=0).tolist())),
+                polarity=float(polarity_values.mean()),
+                pos=pos,
+                neu=neu,
+                neg=neg
+            )
+        )
+
+    return processed_sentences
 
 
 def fix_unicode_problems(text):
@@ -574,7 +446,145 @@ def fix_unicode_problems(text):
     return clean_text
 
 
-def process_selection(model_name, model_data, selection, doc_len, batch_size, ignore_max_length_truncation_padding):
+def get_sentiment_analysis(model_name, model_data, backend):
+    model_type = "huggingface" if not "type" in model_data else model_data["type"]
+    if model_type == "local":
+        sentiment_analysis = load_model(model_data["path"], None, len(model_data["mapping"]), backend=backend)
+    elif model_type == "adapter":
+        if backend != BACKEND_PYTORCH:
+            raise Exception(f"Backend \"{backend}\" does not support adapter models!")
+        adapter_model_type = "huggingface" if not "model_type" in model_data else model_data["model_type"]
+        if adapter_model_type == "local":
+            adapter_host = load_adapter_host(model_data["model_path"], None)
+        else:
+            adapter_host = load_adapter_host(model_data["model_name"], model_data["model_version"])
+        sentiment_analysis = adapter_host.activate(model_data["adapter_path"])
+    else:
+        sentiment_analysis = load_model(model_name, model_data["version"], len(model_data["mapping"]), backend=backend)
+
+    return sentiment_analysis
+
+
+# labels and (texts x labels) score matrix from the logits, same activation as the pipeline
+def get_label_scores(config, logits):
+    if config.problem_type == "multi_label_classification" or config.num_labels == 1:
+        scores = torch.sigmoid(logits.float())
+    else:
+        scores = torch.softmax(logits.float(), dim=-1)
+
+    labels = tuple(config.id2label[i] for i in range(scores.shape[1]))
+    return labels, scores.numpy().astype(numpy.float64)
+
+
+# split the tokens of each text into windows of at most max_length tokens, consecutive windows share overlap tokens
+# returns the encoding of each window and the index of its text
+def get_token_windows(tokenizer, texts, max_length, overlap):
+    window_size = max_length - tokenizer.num_special_tokens_to_add()
+    step = window_size - overlap
+    if step <= 0:
+        raise Exception(f"Chunk overlap {overlap} is too large for max length {max_length}!")
+
+    windows = []
+    window_texts = []
+    for i, input_ids in enumerate(tokenizer(texts, add_special_tokens=False)["input_ids"]):
+        # the last window ends at the end of the text, texts without tokens still get one window
+        starts = range(0, max(len(input_ids) - overlap, 1), step)
+        for start in starts:
+            windows.append(tokenizer.prepare_for_model(input_ids[start:start+window_size], add_special_tokens=True))
+            window_texts.append(i)
+
+    return windows, window_texts
+
+
+# run the model on the texts, only called from the batch scheduler worker
+# all texts are tokenized once and, if enabled, sorted by token count to build batches of similar length,
+# with chunking enabled the windows of all texts are batched together and their scores are pooled per text,
+# returns the labels and scores, token count, padded length in this batch and padded length in document order for each text
+def run_sentiment_analysis(model_name, model_data, texts, batch_size, ignore_max_length_truncation_padding, backend):
+    sentiment_analysis = get_sentiment_analysis(model_name, model_data, backend)
+    tokenizer = sentiment_analysis.tokenizer
+
+    tokenize_seconds = 0.0
+    forward_seconds = 0.0
+    stage_start = perf_counter()
+    if settings.textimager_duui_transformers_sentiment_chunking:
+        windows, window_texts = get_token_windows(tokenizer, texts, model_data["max_length"], settings.textimager_duui_transformers_sentiment_chunk_overlap)
+    else:
+        if ignore_max_length_truncation_padding:
+            encodings = tokenizer(texts)
+        else:
+            encodings = tokenizer(texts, truncation=True, max_length=model_data["max_length"])
+        windows = [
+            {key: encodings[key][i] for key in encodings.keys()}
+            for i in range(len(texts))
+        ]
+        window_texts = list(range(len(texts)))
+    lengths = [len(window["input_ids"]) for window in windows]
+    tokenize_seconds += perf_counter() - stage_start
+
+    order = list(range(len(windows)))
+    if settings.textimager_duui_transformers_sentiment_sort_by_length:
+        order.sort(key=lambda i: lengths[i])
+
+    labels = None
+    window_scores = [None] * len(windows)
+    batch_lengths = [0] * len(windows)
+    for batch_start in range(0, len(order), batch_size):
+        batch = order[batch_start:batch_start+batch_size]
+        metrics.observe("sentiment_model_batch_size", len(batch), model=model_name)
+
+        stage_start = perf_counter()
+        inputs = tokenizer.pad([windows[i] for i in batch], return_tensors="pt")
+        batch_length = inputs["input_ids"].shape[1]
+        tokenize_seconds += perf_counter() - stage_start
+
+        stage_start = perf_counter()
+        inputs = {key: value.to(sentiment_analysis.device) for key, value in inputs.items()}
+
+        with torch.inference_mode():
+            logits = sentiment_analysis.model(**inputs)["logits"].cpu()
+
+        labels, scores = get_label_scores(sentiment_analysis.model.config, logits)
+        forward_seconds += perf_counter() - stage_start
+        for row, i in enumerate(batch):
+            window_scores[i] = scores[row]
+            batch_lengths[i] = batch_length
+
+    # padding the same batches would have needed without sorting, to see the savings
+    document_order_batch_lengths = []
+    for batch_start in range(0, len(windows), batch_size):
+        batch_length = max(lengths[batch_start:batch_start+batch_size])
+        document_order_batch_lengths.extend([batch_length] * len(lengths[batch_start:batch_start+batch_size]))
+
+    metrics.observe("sentiment_stage_seconds", tokenize_seconds, model=model_name, stage="tokenize")
+    metrics.observe("sentiment_stage_seconds", forward_seconds, model=model_name, stage="forward")
+    logger.debug("Ran %d inputs of %d texts, tokenize: %.4fs, forward: %.4fs", len(windows), len(texts), tokenize_seconds, forward_seconds)
+
+    # every text has a single window
+    if len(windows) == len(texts):
+        results = [(labels, text_scores) for text_scores in window_scores]
+        return list(zip(results, lengths, batch_lengths, document_order_batch_lengths))
+
+    # pool the window scores and sum the token counts of all windows of each text
+    window_texts = numpy.array(window_texts)
+    if settings.textimager_duui_transformers_sentiment_chunk_pooling == "length":
+        weights = numpy.array(lengths, dtype=numpy.float64)
+    else:
+        weights = numpy.ones(len(windows), dtype=numpy.float64)
+    scores = numpy.zeros((len(texts), len(labels)), dtype=numpy.float64)
+    numpy.add.at(scores, window_texts, numpy.stack(window_scores) * weights[:, None])
+    scores /= numpy.bincount(window_texts, weights=weights, minlength=len(texts))[:, None]
+
+    text_lengths, text_batch_lengths, text_document_order_batch_lengths = (
+        numpy.bincount(window_texts, weights=values, minlength=len(texts)).astype(int).tolist()
+        for values in (lengths, batch_lengths, document_order_batch_lengths)
+    )
+
+    results = [(labels, text_scores) for text_scores in scores]
+    return list(zip(results, text_lengths, text_batch_lengths, text_document_order_batch_lengths))
+
+
+def preprocess_selection(model_data, selection):
     for s in selection.sentences:
         s.text = fix_unicode_problems(s.text)
 
@@ -585,93 +595,70 @@ def process_selection(model_name, model_data, selection, doc_len, batch_size, ig
     logger.debug("Preprocessed texts:")
     logger.debug(texts)
 
-    with model_lock:
-        model_type = "huggingface" if not "type" in model_data else model_data["type"]
-        if model_type == "local":
-            sentiment_analysis = load_model(model_data["path"], None, len(model_data["mapping"]))
-        elif model_type == "adapter":
-            adapter_model_type = "huggingface" if not "type" in model_data else model_data["type"]
-            adapter_path = model_data["adapter_path"]
-            if adapter_model_type == "local":
-                sentiment_analysis = load_model(model_data["model_path"], None, len(model_data["mapping"]), adapter_path)
-            else:
-                sentiment_analysis = load_model(model_data["model_name"], model_data["model_version"], len(model_data["mapping"]), adapter_path)
-        else:
-            sentiment_analysis = load_model(model_name, model_data["version"], len(model_data["mapping"]))
+    return texts
 
-        if ignore_max_length_truncation_padding:
-            results = sentiment_analysis(
-                texts, batch_size=batch_size
-            )
+
+def get_result_cache_key(model_name, model_data, ignore_max_length_truncation_padding, backend, text):
+    return model_name, model_data["version"], ignore_max_length_truncation_padding, backend, text
+
+
+# get the model results for the texts, each unique text is only run once and cached results are reused
+def analyse_texts(model_name, model_data, texts, batch_size, ignore_max_length_truncation_padding, request_stats):
+    results = [None] * len(texts)
+    backend = get_model_backend(model_name)
+
+    # positions of all occurrences of each text not in the cache
+    missing_texts = {}
+    cache_hits = 0
+    for i, text in enumerate(texts):
+        if text in missing_texts:
+            missing_texts[text].append(i)
+            continue
+
+        result = result_cache.get(get_result_cache_key(model_name, model_data, ignore_max_length_truncation_padding, backend, text)) if result_cache.is_enabled() else None
+        if result is not None:
+            results[i] = result
+            cache_hits += 1
         else:
-            results = sentiment_analysis(
-                texts, truncation=True, padding=True, max_length=model_data["max_length"], batch_size=batch_size
-            )
+            missing_texts[text] = [i]
+
+    request_stats["texts"] += len(texts)
+    request_stats["unique_texts"] += len(set(texts))
+    request_stats["cache_hits"] += cache_hits
+    metrics.inc("sentiment_texts_total", len(texts), model=model_name)
+    metrics.inc("sentiment_result_cache_hits_total", cache_hits, model=model_name)
+
+    # texts of concurrent requests for the same model and settings are run together
+    batch_texts = list(missing_texts.keys())
+    batch_results = batch_scheduler.submit(
+        (model_name, ignore_max_length_truncation_padding),
+        lambda scheduled_texts, scheduled_batch_size: run_sentiment_analysis(model_name, model_data, scheduled_texts, scheduled_batch_size, ignore_max_length_truncation_padding, backend),
+        batch_texts,
+        batch_size
+    )
 
-    processed_sentences = [
-        map_sentiment(r, model_data["mapping"], model_data["3sentiment"], s)
-        for s, r
-        in zip(selection.sentences, results)
-    ]
+    metrics.inc("sentiment_inferred_texts_total", len(batch_texts), model=model_name)
+    for text, (result, length, batch_length, document_order_batch_length) in zip(batch_texts, batch_results):
+        result_cache.put(get_result_cache_key(model_name, model_data, ignore_max_length_truncation_padding, backend, text), result)
+        for i in missing_texts[text]:
+            results[i] = result
 
-    if len(results) > 1:
-        begin = 0
-        end = doc_len
-
-        sentiments = 0
-        for sentence in processed_sentences:
-            sentiments += sentence.sentiment
-        sentiment = sentiments / len(processed_sentences)
-
-        scores = 0
-        for sentence in processed_sentences:
-            scores += sentence.score
-        score = scores / len(processed_sentences)
-
-        details = {}
-        for sentence in processed_sentences:
-            for d in sentence.details:
-                if d not in details:
-                    details[d] = 0
-                details[d] += sentence.details[d]
-        for d in details:
-            details[d] = details[d] / len(processed_sentences)
-
-        polaritys = 0
-        for sentence in processed_sentences:
-            polaritys += sentence.polarity
-        polarity = polaritys / len(processed_sentences)
-
-        poss = 0
-        for sentence in processed_sentences:
-            poss += sentence.pos
-        pos = poss / len(processed_sentences)
-
-        neus = 0
-        for sentence in processed_sentences:
-            neus += sentence.neu
-        neu = neus / len(processed_sentences)
-
-        negs = 0
-        for sentence in processed_sentences:
-            negs += sentence.neg
-        neg = negs / len(processed_sentences)
+        request_stats["tokens"] += length
+        request_stats["padded_tokens"] += batch_length
+        request_stats["document_order_padded_tokens"] += document_order_batch_length
 
-        processed_sentences.append(
-            SentimentSentence(
-                sentence=UimaSentence(
-                    text="",
-                    begin=begin,
-                    end=end,
-                ),
-                sentiment=sentiment,
-                score=score,
-                details=details,
-                polarity=polarity,
-                pos=pos,
-                neu=neu,
-                neg=neg
-            )
-        )
+    metrics.inc("sentiment_tokens_total", sum(length for _, length, _, _ in batch_results), model=model_name)
+    metrics.inc("sentiment_padded_tokens_total", sum(batch_length for _, _, batch_length, _ in batch_results), model=model_name)
 
-    return processed_sentences
+    return results
+
+
+def process_selection(model_data, selection, results, doc_len):
+    if len(results) == 0:
+        return []
+
+    # all results are from the same model and share the labels
+    labels = results[0][0]
+    scores = numpy.stack([r[1] for r in results])
+
+    return map_sentiments(scores, labels, model_data["mapping"], model_data["3sentiment"], selection.sentences, doc_len)